@@ -0,0 +1,51 @@
+"""Compare parsing schemas that share definitions one by one with parsing them as a bundle."""
+
+import timeit
+
+from chiaro.core import SchemaBundleParser, SchemaParser
+
+DEFINITIONS = {
+    "Address": {
+        "type": "object",
+        "properties": {"street": {"type": "string"}, "city": {"type": "string"}, "zip": {"type": "string"}},
+        "required": ["street", "city"],
+    },
+    "Contact": {
+        "type": "object",
+        "properties": {
+            "email": {"type": "string", "format": "email"},
+            "phone": {"type": "string"},
+            "address": {"$ref": "#/definitions/Address"},
+        },
+    },
+}
+
+SCHEMAS = [
+    {
+        "title": f"Entity{i}",
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": "string"},
+            "contact": {"$ref": "#/definitions/Contact"},
+            "billing": {"$ref": "#/definitions/Address"},
+        },
+        "definitions": DEFINITIONS,
+    }
+    for i in range(50)
+]
+
+
+def main() -> None:
+    """Print the cost of parsing the schemas separately and as one bundle."""
+    runs = 10
+    separate = timeit.timeit(lambda: [SchemaParser(s, cache=None).parse() for s in SCHEMAS], number=runs) / runs
+    bundle = timeit.timeit(lambda: SchemaBundleParser(SCHEMAS).parse(), number=runs) / runs
+    print(f"schemas:  {len(SCHEMAS):10d}")
+    print(f"separate: {separate * 1e3:10.2f} ms")
+    print(f"bundle:   {bundle * 1e3:10.2f} ms")
+    print(f"speedup:  {separate / bundle:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
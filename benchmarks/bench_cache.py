@@ -0,0 +1,49 @@
+"""Compare compiling a schema with fetching it from the in-memory and on-disk caches."""
+
+import tempfile
+import timeit
+
+from chiaro.cache import DiskCache, ModelCache
+from chiaro.core import SchemaParser
+
+SCHEMA = {
+    "title": "Order",
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "quantity": {"type": "integer", "minimum": 1},
+        "price": {"type": "number"},
+        "customer": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "email": {"type": "string"}},
+            "required": ["name"],
+        },
+        "items": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["id", "quantity"],
+}
+
+
+def main() -> None:
+    """Print the per-call cost of a compile, a rebuild from disk and a cache hit."""
+    runs = 200
+    compile_time = timeit.timeit(lambda: SchemaParser(SCHEMA, cache=None).parse(), number=runs) / runs
+
+    cache = ModelCache()
+    SchemaParser(SCHEMA, cache=cache).parse()
+    hit_time = timeit.timeit(lambda: SchemaParser(SCHEMA, cache=cache).parse(), number=runs * 50) / (runs * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        disk = DiskCache(directory)
+        SchemaParser(SCHEMA, cache=None, disk_cache=disk).parse()
+        disk_time = timeit.timeit(lambda: SchemaParser(SCHEMA, cache=None, disk_cache=disk).parse(), number=runs) / runs
+
+    print(f"compile:      {compile_time * 1e6:10.1f} us")
+    print(f"disk rebuild: {disk_time * 1e6:10.1f} us")
+    print(f"cache hit:    {hit_time * 1e6:10.1f} us")
+    print(f"speedup:      {compile_time / hit_time:10.1f}x")
+    print(cache.stats())
+
+
+if __name__ == "__main__":
+    main()
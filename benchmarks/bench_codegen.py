@@ -0,0 +1,59 @@
+"""Compare service startup with a generated module against parsing the schema at runtime."""
+
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from chiaro.codegen import compile_schemas
+
+DEFINITIONS = 200
+
+SCHEMA = {
+    "title": "Api",
+    "type": "object",
+    "properties": {f"item{i}": {"$ref": f"#/definitions/Item{i}"} for i in range(DEFINITIONS)},
+    "definitions": {
+        f"Item{i}": {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "name": {"type": "string", "maxLength": 64}},
+            "required": ["id"],
+        }
+        for i in range(DEFINITIONS)
+    },
+}
+
+
+def startup(code: str, cwd: Path) -> float:
+    """Run ``code`` in a fresh interpreter and return the best wall time of a few runs."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=cwd, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Print the startup time of both approaches."""
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        schema_path = root / "api.json"
+        schema_path.write_text(json.dumps(SCHEMA))
+        compile_schemas([schema_path], root / "models")
+        runtime = startup(
+            "import json; from chiaro.core import SchemaParser; "
+            "SchemaParser(json.load(open('api.json'))).parse()",
+            root,
+        )
+        generated = startup("from models.api import Api", root)
+        baseline = startup("import chiaro.core", root)
+    print(f"import chiaro.core:       {baseline * 1e3:8.1f} ms")
+    print(f"parse schema at startup:  {runtime * 1e3:8.1f} ms")
+    print(f"import generated module:  {generated * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare the pydantic-core backend with create_model for build time and validation throughput."""
+
+import json
+import timeit
+
+from chiaro.core import SchemaParser
+
+SCHEMA = {
+    "title": "Order",
+    "type": "object",
+    "properties": {
+        "id": {"type": "string", "pattern": "^[A-Z]+-[0-9]+$"},
+        "quantity": {"type": "integer", "minimum": 1},
+        "price": {"type": "number", "exclusiveMinimum": 0},
+        "status": {"enum": ["new", "paid", "shipped"]},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "customer": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "email": {"type": "string"}},
+            "required": ["name"],
+        },
+        "lines": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"sku": {"type": "string"}, "count": {"type": "integer", "minimum": 1}},
+                "required": ["sku", "count"],
+            },
+        },
+    },
+    "required": ["id", "quantity"],
+}
+
+RECORD = {
+    "id": "AB-12",
+    "quantity": 3,
+    "price": 19.5,
+    "status": "paid",
+    "tags": ["a", "b"],
+    "customer": {"name": "Ada", "email": "ada@example.com"},
+    "lines": [{"sku": "X1", "count": 1}, {"sku": "X2", "count": 2}],
+}
+
+
+def main() -> None:
+    """Print build times and validations per second for both backends."""
+    runs = 50
+    model_build = timeit.timeit(lambda: SchemaParser(SCHEMA, cache=None).parse(), number=runs) / runs
+    core_build = timeit.timeit(lambda: SchemaParser(SCHEMA, cache=None).parse_validator(), number=runs) / runs
+    model_cls = SchemaParser(SCHEMA, cache=None).parse()
+    validator = SchemaParser(SCHEMA, cache=None).parse_validator()
+    payload = json.dumps(RECORD).encode()
+
+    count = 20000
+    rates = {
+        "model python": count / timeit.timeit(lambda: model_cls.model_validate(RECORD), number=count),
+        "core python": count / timeit.timeit(lambda: validator.validate_python(RECORD), number=count),
+        "model json": count / timeit.timeit(lambda: model_cls.model_validate_json(payload), number=count),
+        "core json": count / timeit.timeit(lambda: validator.validate_json(payload), number=count),
+    }
+    print(f"build create_model: {model_build * 1e3:8.2f} ms")
+    print(f"build core schema:  {core_build * 1e3:8.2f} ms ({model_build / core_build:.1f}x faster)")
+    for name, rate in rates.items():
+        print(f"validate {name:13s} {rate:12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
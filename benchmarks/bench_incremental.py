@@ -0,0 +1,49 @@
+"""Compare a full re-parse with an incremental re-parse after one property changes."""
+
+import copy
+import time
+
+from chiaro.core import IncrementalParser, SchemaParser
+
+DEFINITIONS = 2000
+
+
+def make_schema(count: int) -> dict:
+    """Build a schema whose root references ``count`` definitions in small reference chains."""
+    definitions = {
+        f"Model{i}": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                **({"previous": {"$ref": f"#/definitions/Model{i - 1}"}} if i % 5 else {}),
+            },
+        }
+        for i in range(count)
+    }
+    properties = {f"model{i}": {"$ref": f"#/definitions/Model{i}"} for i in range(count)}
+    return {"title": "Root", "type": "object", "properties": properties, "definitions": definitions}
+
+
+def main() -> None:
+    """Print the time of a full and of an incremental re-parse."""
+    schema = make_schema(DEFINITIONS)
+    previous = IncrementalParser(schema).parse()
+    changed = copy.deepcopy(schema)
+    changed["definitions"]["Model2"]["properties"]["note"] = {"type": "string"}
+
+    start = time.perf_counter()
+    SchemaParser(changed, cache=None).parse()
+    full = time.perf_counter() - start
+    start = time.perf_counter()
+    result = IncrementalParser(changed).parse(previous)
+    incremental = time.perf_counter() - start
+
+    print(f"models: {len(result.models)}, rebuilt: {len(result.rebuilt)}")
+    print(f"full re-parse:        {full * 1e3:9.1f} ms")
+    print(f"incremental re-parse: {incremental * 1e3:9.1f} ms")
+    print(f"speedup:              {full / incremental:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
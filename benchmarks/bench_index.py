@@ -0,0 +1,49 @@
+"""Compare resolving references through the pointer index with walking the document per lookup."""
+
+import timeit
+from typing import Any
+
+from chiaro.compiler import unescape_pointer
+from chiaro.index import SchemaIndex
+
+DEFINITIONS = 2000
+
+
+def walk(document: Any, ref: str) -> Any:
+    """Resolve a JSON pointer by splitting it and walking the document, as done before the index."""
+    target = document
+    for token in filter(None, ref[1:].split("/")):
+        key = unescape_pointer(token)
+        target = target[int(key)] if isinstance(target, list) else target[key]
+    return target
+
+
+def main() -> None:
+    """Print the cost of indexing a reference-heavy schema and of each lookup."""
+    schema = {
+        "type": "object",
+        "definitions": {
+            f"Model{i}": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "string"},
+                    "next": {"$ref": f"#/definitions/Model{(i + 1) % DEFINITIONS}/properties/value"},
+                },
+            }
+            for i in range(DEFINITIONS)
+        },
+    }
+    refs = [f"#/definitions/Model{i}/properties/next" for i in range(DEFINITIONS)] * 5
+    runs = 20
+    build = timeit.timeit(lambda: SchemaIndex(schema), number=runs) / runs
+    index = SchemaIndex(schema)
+    indexed = timeit.timeit(lambda: [index.get(r) for r in refs], number=runs) / runs
+    walked = timeit.timeit(lambda: [walk(schema, r) for r in refs], number=runs) / runs
+    print(f"indexed subschemas: {len(index)}, lookups: {len(refs)}")
+    print(f"index build: {build * 1e3:8.2f} ms")
+    print(f"indexed:     {indexed * 1e3:8.2f} ms ({indexed / len(refs) * 1e9:6.0f} ns per lookup)")
+    print(f"walked:      {walked * 1e3:8.2f} ms ({walked / len(refs) * 1e9:6.0f} ns per lookup)")
+
+
+if __name__ == "__main__":
+    main()
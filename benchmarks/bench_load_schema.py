@@ -0,0 +1,44 @@
+"""Time decoding a large bundled JSON Schema file with the generator's loaders."""
+
+import json
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "bg" / "datamodel-code-generator"))
+
+from datamodel_code_generator import load_yaml
+from datamodel_code_generator.loader import load_file
+
+DEFINITIONS = 20_000
+PROPERTIES = 20
+
+
+def build_schema() -> dict:
+    """Definitions with constrained string properties, about 18 MB of JSON."""
+    return {
+        "definitions": {
+            f"Model{i}": {
+                "type": "object",
+                "properties": {f"field{j}": {"type": "string", "maxLength": j} for j in range(PROPERTIES)},
+            }
+            for i in range(DEFINITIONS)
+        }
+    }
+
+
+def main() -> None:
+    """Print the cost of loading the file through PyYAML and through the format-detecting loader."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bundle.json"
+        path.write_text(json.dumps(build_schema()), encoding="utf-8")
+        as_yaml = timeit.timeit(lambda: load_yaml(path.read_text(encoding="utf-8")), number=1)
+        loaded = timeit.timeit(lambda: load_file(path), number=3) / 3
+        print(f"file size:              {path.stat().st_size / 1e6:8.2f} MB")
+    print(f"load_yaml:              {as_yaml:8.2f} s")
+    print(f"load_file:              {loaded:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Measure how compiling a large schema scales with the number of worker processes."""
+
+import os
+import time
+
+from chiaro.builder import ModelBuilder
+from chiaro.compiler import SchemaCompiler
+from chiaro.core import DynamicModel
+from chiaro.parallel import ParallelSchemaCompiler
+
+DEFINITIONS = 3000
+GROUP = 10
+
+
+def make_schema(count: int) -> dict:
+    """
+    Build a schema shaped like an OpenAPI components section.
+
+    Definitions reference their predecessor within groups of ``GROUP``, a shared error type and
+    themselves, so the reference graph has chains, shared leaves and cycles.
+    """
+    definitions: dict[str, dict] = {
+        "Error": {"type": "object", "properties": {"code": {"type": "integer"}, "message": {"type": "string"}}}
+    }
+    for i in range(count):
+        properties = {
+            "id": {"type": "integer", "minimum": 0},
+            "name": {"type": "string", "maxLength": 64},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "error": {"$ref": "#/components/schemas/Error"},
+            "children": {"type": "array", "items": {"$ref": f"#/components/schemas/Item{i}"}},
+            "meta": {"type": "object", "properties": {"created": {"type": "string", "format": "date-time"}}},
+        }
+        if i % GROUP:
+            properties["previous"] = {"$ref": f"#/components/schemas/Item{i - 1}"}
+        definitions[f"Item{i}"] = {"type": "object", "properties": properties}
+    return {
+        "title": "Api",
+        "type": "object",
+        "properties": {f"item{i}": {"$ref": f"#/components/schemas/Item{i}"} for i in range(count)},
+        "components": {"schemas": definitions},
+    }
+
+
+def main() -> None:
+    """Print compile times for 1 to N workers next to the serial compiler and the class build."""
+    schema = make_schema(DEFINITIONS)
+    start = time.perf_counter()
+    definition = SchemaCompiler(schema).compile()
+    serial = time.perf_counter() - start
+    start = time.perf_counter()
+    ModelBuilder(DynamicModel).build(definition)
+    build = time.perf_counter() - start
+    print(f"definitions: {DEFINITIONS}, models: {len(definition.models)}")
+    print(f"serial compile: {serial * 1e3:9.1f} ms")
+    print(f"class build:    {build * 1e3:9.1f} ms (always in the parent process)")
+
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+    baseline = None
+    expected = None
+    for workers in counts:
+        start = time.perf_counter()
+        result = ParallelSchemaCompiler(schema, workers).compile()
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        expected = expected or result
+        same = "identical" if result == expected else "DIFFERENT"
+        print(f"workers {workers:2d}: {elapsed * 1e3:9.1f} ms  speedup {baseline / elapsed:5.2f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
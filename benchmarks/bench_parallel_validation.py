@@ -0,0 +1,58 @@
+"""Measure the throughput of validating newline-delimited JSON with different numbers of workers."""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from chiaro.parallel import ParallelValidator
+
+SCHEMA = {
+    "title": "Event",
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "score": {"type": "number"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "source": {
+            "type": "object",
+            "properties": {"host": {"type": "string"}, "port": {"type": "integer"}},
+        },
+    },
+    "required": ["id", "name"],
+}
+
+RECORDS = 500_000
+
+
+def write_file(path: Path) -> None:
+    """Write the records to ``path``, one JSON object per line."""
+    with path.open("w", encoding="utf-8") as file:
+        for i in range(RECORDS):
+            source = {"host": "example.com", "port": 8000 + i % 100}
+            file.write(json.dumps({"id": i, "name": f"event-{i}", "score": i / 7, "tags": ["a"], "source": source}))
+            file.write("\n")
+
+
+def main() -> None:
+    """Print the records per second at 1, 2, 4, 8 and one worker per CPU, in both output modes."""
+    cpus = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "events.ndjson"
+        write_file(path)
+        print(f"records: {RECORDS}, file: {path.stat().st_size / 1e6:.1f} MB, CPUs: {cpus}")
+        for workers in sorted({1, 2, 4, 8, cpus}):
+            for mode in ("python", "json"):
+                with ParallelValidator(SCHEMA, workers, mode=mode) as validator:
+                    # Start the workers and compile the schema before timing.
+                    list(validator.validate_chunks([(1, b"{}\n")] * workers))
+                    start = time.perf_counter()
+                    count = sum(1 for _ in validator.validate_ndjson(path))
+                    elapsed = time.perf_counter() - start
+                print(f"workers {workers:3d}  {mode:6s}  {count / elapsed:12.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Time parsing a large JSON Schema with the generator's ``JsonSchemaParser``."""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "bg" / "datamodel-code-generator"))
+
+from datamodel_code_generator.parser.jsonschema import (
+    JsonSchemaObject,
+    JsonSchemaParser,
+    build_schema_object,
+)
+
+DEFINITIONS = 2000
+PROPERTIES = 8
+
+
+def build_schema() -> dict:
+    """Definitions with scalar, array and nested object properties that reference each other."""
+    definitions = {}
+    for i in range(DEFINITIONS):
+        properties = {f"field{j}": {"type": ["string", "integer", "number"][j % 3]} for j in range(PROPERTIES)}
+        properties["tags"] = {"type": "array", "items": {"type": "string"}}
+        properties["nested"] = {"type": "object", "properties": {"value": {"type": "string", "maxLength": 10}}}
+        if i:
+            properties["parent"] = {"$ref": f"#/definitions/Model{i - 1}"}
+        definitions[f"Model{i}"] = {"type": "object", "properties": properties, "required": ["field0"]}
+    return {"title": "Root", "type": "object", "definitions": definitions}
+
+
+class ValidatedSchemaObject(JsonSchemaObject):
+    """A subclass, so that the parser validates every schema object instead of building simple ones itself."""
+
+
+class ValidatingParser(JsonSchemaParser):
+    SCHEMA_OBJECT_TYPE = ValidatedSchemaObject
+
+
+def main() -> None:
+    """Print the cost of the ``$id`` pre-pass, of building schema objects and of a whole parse, each both ways."""
+    schema = build_schema()
+    text = json.dumps(schema)
+    definitions = schema["definitions"]
+    parser = JsonSchemaParser(text)
+
+    def validated_ids() -> None:
+        for key, model in definitions.items():
+            parser.parse_id(JsonSchemaObject.parse_obj(model), ["#/definitions", key])
+
+    def raw_ids() -> None:
+        for key, model in definitions.items():
+            parser.parse_raw_id(model, ["#/definitions", key])
+
+    validated = timeit.timeit(validated_ids, number=3) / 3
+    raw = timeit.timeit(raw_ids, number=3) / 3
+    models = list(definitions.values())
+    objects_validated = timeit.timeit(lambda: [JsonSchemaObject.parse_obj(m) for m in models], number=3) / 3
+    objects_built = timeit.timeit(lambda: [build_schema_object(m) for m in models], number=3) / 3
+    parse_validated = timeit.timeit(lambda: ValidatingParser(text).parse(), number=1)
+    parse = timeit.timeit(lambda: JsonSchemaParser(text).parse(), number=1)
+    print(f"definitions:            {DEFINITIONS:8d}")
+    print(f"$id pass, validated:    {validated * 1e3:8.2f} ms")
+    print(f"$id pass, raw dicts:    {raw * 1e3:8.2f} ms")
+    print(f"objects, validated:     {objects_validated * 1e3:8.2f} ms")
+    print(f"objects, raw dicts:     {objects_built * 1e3:8.2f} ms")
+    print(f"parse, validated:       {parse_validated * 1e3:8.2f} ms")
+    print(f"parse:                  {parse * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
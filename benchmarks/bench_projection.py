@@ -0,0 +1,55 @@
+"""Compare validating whole records with validating a projection on a few of their fields."""
+
+import json
+import timeit
+
+from chiaro.core import SchemaParser
+
+FIELDS = 200
+
+SCHEMA = {
+    "title": "Record",
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        **{f"field{i}": {"type": "string", "maxLength": 50} for i in range(FIELDS - 3)},
+        "owner": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "email": {"type": "string", "pattern": "@"}},
+        },
+    },
+    "required": ["id", "name"],
+}
+
+RECORDS = [
+    {
+        "id": i,
+        "name": f"record-{i}",
+        **{f"field{j}": "value" for j in range(FIELDS - 3)},
+        "owner": {"name": "Ada", "email": "ada@example.com"},
+    }
+    for i in range(5000)
+]
+
+
+def main() -> None:
+    """Print the cost of validating every field and of validating two fields and one nested field."""
+    parser = SchemaParser(SCHEMA)
+    model = parser.parse()
+    projection = parser.parse_projection("id", "name", "owner.name")
+    data = json.dumps(RECORDS).encode()
+    runs = 5
+    full = timeit.timeit(lambda: model.validate_many(RECORDS), number=runs) / runs
+    projected = timeit.timeit(lambda: projection.validate_many(RECORDS), number=runs) / runs
+    full_json = timeit.timeit(lambda: model.validate_many_json(data), number=runs) / runs
+    projected_json = timeit.timeit(lambda: projection.validate_many_json(data), number=runs) / runs
+    print(f"records: {len(RECORDS)}, fields: {FIELDS}")
+    print(f"full:            {full * 1e3:10.2f} ms")
+    print(f"projection:      {projected * 1e3:10.2f} ms  ({1 - projected / full:.0%} less)")
+    print(f"full json:       {full_json * 1e3:10.2f} ms")
+    print(f"projection json: {projected_json * 1e3:10.2f} ms  ({1 - projected_json / full_json:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Time compiling the generator's model templates and rendering many models with them."""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "bg" / "datamodel-code-generator"))
+
+from datamodel_code_generator.model.base import (
+    TEMPLATE_DIR,
+    get_template,
+    set_template_cache_dir,
+)
+from datamodel_code_generator.model.pydantic_v2 import BaseModel, DataModelField
+from datamodel_code_generator.reference import Reference
+from datamodel_code_generator.types import DataType
+
+MODELS = 5000
+FIELDS = 5
+
+
+def load_templates() -> None:
+    """Load and compile every built-in template."""
+    for path in TEMPLATE_DIR.rglob("*.jinja2"):
+        get_template(path.relative_to(TEMPLATE_DIR))
+
+
+def build_models() -> list[BaseModel]:
+    """Build models with a few scalar fields each."""
+    return [
+        BaseModel(
+            reference=Reference(path=f"#/definitions/Model{i}", name=f"Model{i}"),
+            fields=[
+                DataModelField(name=f"field{j}", data_type=DataType(type="str"), required=j % 2 == 0)
+                for j in range(FIELDS)
+            ],
+        )
+        for i in range(MODELS)
+    ]
+
+
+def main() -> None:
+    """Print the cost of compiling the templates with and without a bytecode cache, and of rendering."""
+    runs = 20
+
+    def cold() -> None:
+        set_template_cache_dir(None)
+        load_templates()
+
+    compiled = timeit.timeit(cold, number=runs) / runs
+    with tempfile.TemporaryDirectory() as directory:
+        set_template_cache_dir(Path(directory))
+        load_templates()
+
+        def cached() -> None:
+            set_template_cache_dir(Path(directory))
+            load_templates()
+
+        from_bytecode = timeit.timeit(cached, number=runs) / runs
+    set_template_cache_dir(None)
+    models = build_models()
+    rendered = timeit.timeit(lambda: [m.render() for m in models], number=3) / 3
+    print(f"compile templates:      {compiled * 1e3:8.2f} ms")
+    print(f"load from bytecode:     {from_bytecode * 1e3:8.2f} ms")
+    print(f"render {MODELS} models:    {rendered * 1e3:8.2f} ms ({rendered / MODELS * 1e6:6.1f} us per model)")
+
+
+if __name__ == "__main__":
+    main()
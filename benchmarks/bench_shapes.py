@@ -0,0 +1,50 @@
+"""Measure parsing a schema that repeats the same inline object shapes many times."""
+
+import time
+import tracemalloc
+
+from chiaro.core import SchemaParser
+
+OCCURRENCES = 300
+
+SHAPES = {
+    "address": {"type": "object", "properties": {"street": {"type": "string"}, "city": {"type": "string"}}},
+    "money": {"type": "object", "properties": {"amount": {"type": "number"}, "currency": {"type": "string"}}},
+    "audit": {
+        "type": "object",
+        "properties": {"created": {"type": "string", "format": "date-time"}, "by": {"type": "string"}},
+    },
+}
+
+
+def make_schema(unique: bool) -> dict:
+    """Build a schema with inline copies of each shape; ``unique`` makes every copy distinct."""
+    properties = {}
+    for i in range(OCCURRENCES):
+        for key, shape in SHAPES.items():
+            properties[f"{key}{i}"] = {**shape, "description": f"copy {i}"} if unique else shape
+    return {"title": "Document", "type": "object", "properties": properties}
+
+
+def measure(schema: dict) -> tuple[float, int]:
+    """Parse a schema and return the elapsed seconds and the bytes allocated while parsing."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    SchemaParser(schema, cache=None).parse()
+    elapsed = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, allocated
+
+
+def main() -> None:
+    """Print parse time and retained memory with shared and with distinct inline shapes."""
+    distinct_time, distinct_memory = measure(make_schema(unique=True))
+    shared_time, shared_memory = measure(make_schema(unique=False))
+    print(f"inline objects: {OCCURRENCES * len(SHAPES)}")
+    print(f"distinct shapes: {distinct_time * 1e3:9.1f} ms {distinct_memory / 2**20:8.1f} MiB")
+    print(f"shared shapes:   {shared_time * 1e3:9.1f} ms {shared_memory / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
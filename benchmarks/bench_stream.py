@@ -0,0 +1,53 @@
+"""Measure the throughput and peak memory of validating newline-delimited JSON files."""
+
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from chiaro.core import SchemaParser
+from chiaro.stream import validate_ndjson
+
+SCHEMA = {
+    "title": "Event",
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "score": {"type": "number"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["id", "name"],
+}
+
+
+def write_file(path: Path, records: int) -> None:
+    """Write records to ``path``, with every hundredth one invalid."""
+    with path.open("w", encoding="utf-8") as file:
+        for i in range(records):
+            record = {"id": i, "name": f"event-{i}", "score": i / 7, "tags": ["a", "b"]}
+            if i % 100 == 0:
+                record["id"] = "not a number"
+            file.write(json.dumps(record) + "\n")
+
+
+def main() -> None:
+    """Print the records per second and the peak allocated memory for files of growing size."""
+    model = SchemaParser(SCHEMA).parse()
+    with tempfile.TemporaryDirectory() as directory:
+        for records in (10_000, 100_000, 1_000_000):
+            path = Path(directory) / f"{records}.ndjson"
+            write_file(path, records)
+            tracemalloc.start()
+            start = time.perf_counter()
+            count = sum(1 for _ in validate_ndjson(path, model))
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            size = path.stat().st_size / 1e6
+            print(f"{size:8.1f} MB  {count / elapsed:10.0f} records/s  peak {peak / 1e6:6.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compare validating records with constructing them in trusted mode, with and without sampling."""
+
+import timeit
+
+from chiaro.core import DriftReport, SchemaParser
+
+NARROW = {
+    "title": "Event",
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "score": {"type": "number"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "source": {"$ref": "#/definitions/Source"},
+    },
+    "required": ["id", "name"],
+    "definitions": {
+        "Source": {"type": "object", "properties": {"host": {"type": "string"}, "port": {"type": "integer"}}},
+    },
+}
+
+WIDE = {
+    "title": "Measurement",
+    "type": "object",
+    "properties": {
+        **{f"label{i}": {"type": "string", "maxLength": 50} for i in range(100)},
+        **{f"value{i}": {"type": "number", "minimum": 0} for i in range(100)},
+        "series": {"type": "array", "items": {"type": "number", "minimum": 0}},
+    },
+}
+
+
+def narrow_records() -> list[dict]:
+    """Records with a few fields and a nested model."""
+    return [
+        {
+            "id": i,
+            "name": f"event-{i}",
+            "score": i / 7,
+            "tags": ["a", "b"],
+            "source": {"host": "example.com", "port": 8000 + i % 100},
+        }
+        for i in range(50_000)
+    ]
+
+
+def wide_records() -> list[dict]:
+    """Records with 200 constrained fields and a long array."""
+    return [
+        {
+            **{f"label{i}": "text" for i in range(100)},
+            **{f"value{i}": 1.5 for i in range(100)},
+            "series": [1.0] * 200,
+        }
+        for _ in range(5000)
+    ]
+
+
+def main() -> None:
+    """Print the cost of validating, constructing, and constructing with 1-in-N sampling."""
+    runs = 3
+
+    def timed(function: object) -> float:
+        return timeit.timeit(function, number=runs) / runs
+
+    for schema, records in ((NARROW, narrow_records()), (WIDE, wide_records())):
+        model = SchemaParser(schema).parse()
+        validated = timed(lambda: model.validate_many(records))  # noqa: B023
+        constructed = timed(lambda: [model.model_construct(**r) for r in records])  # noqa: B023
+        trusted = timed(lambda: model.from_trusted_many(records))  # noqa: B023
+        print(f"{schema['title']} ({len(records)} records)")
+        print(f"  validate_many:       {validated * 1e3:10.2f} ms")
+        print(f"  model_construct:     {constructed * 1e3:10.2f} ms")
+        print(f"  from_trusted_many:   {trusted * 1e3:10.2f} ms")
+        for every in (1000, 100, 10):
+            sampled = timed(lambda every=every: model.from_trusted_many(records, drift=DriftReport(every)))  # noqa: B023
+            print(f"    sampling 1 in {every:<5d}{sampled * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
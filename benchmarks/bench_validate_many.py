@@ -0,0 +1,53 @@
+"""Compare validating records one at a time with validating them as one batch."""
+
+import json
+import timeit
+
+from chiaro.core import SchemaParser
+
+SCHEMA = {
+    "title": "Event",
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "score": {"type": "number"},
+        "active": {"type": "boolean"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "source": {
+            "type": "object",
+            "properties": {"host": {"type": "string"}, "port": {"type": "integer"}},
+        },
+    },
+    "required": ["id", "name"],
+}
+
+RECORDS = [
+    {
+        "id": i,
+        "name": f"event-{i}",
+        "score": i / 7,
+        "active": i % 2 == 0,
+        "tags": ["a", "b"],
+        "source": {"host": "example.com", "port": 8000 + i % 100},
+    }
+    for i in range(50_000)
+]
+
+
+def main() -> None:
+    """Print the cost of validating the records in a loop, as a list and as a JSON array."""
+    model = SchemaParser(SCHEMA).parse()
+    data = json.dumps(RECORDS).encode()
+    runs = 5
+    loop = timeit.timeit(lambda: [model(**record) for record in RECORDS], number=runs) / runs
+    batch = timeit.timeit(lambda: model.validate_many(RECORDS), number=runs) / runs
+    batch_json = timeit.timeit(lambda: model.validate_many_json(data), number=runs) / runs
+    print(f"records:    {len(RECORDS):10d}")
+    print(f"loop:       {loop * 1e3:10.2f} ms")
+    print(f"batch:      {batch * 1e3:10.2f} ms  ({loop / batch:.2f}x)")
+    print(f"batch json: {batch_json * 1e3:10.2f} ms  ({loop / batch_json:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,6 @@ from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 from typing import (
-    IO,
     Any,
     TextIO,
     TypeVar,
@@ -17,7 +16,8 @@ import yaml
 
 from datamodel_code_generator.format import PythonVersion
 from datamodel_code_generator.model import get_data_model_types
-from datamodel_code_generator.parser import DefaultPutDict, LiteralType
+from datamodel_code_generator.parser import REMOTE_CACHE_SIZE, DefaultPutDict, LiteralType, LRUPutDict
+from datamodel_code_generator.remote import ReferenceLoader
 from datamodel_code_generator.types import StrictTypes
 from datamodel_code_generator.util import SafeLoader
 
@@ -26,6 +26,17 @@ T = TypeVar("T")
 
 DEFAULT_BASE_CLASS: str = "pydantic.BaseModel"
 
+# generate() arguments that change how a run is carried out but not the code it generates.
+RUN_ONLY_OPTIONS: frozenset[str] = frozenset((
+    "input_",
+    "output",
+    "stream_output",
+    "render_workers",
+    "manifest_path",
+    "reference_loader",
+    "remote_object_cache_size",
+))
+
 
 def load_yaml(stream: str | TextIO) -> Any:
     return yaml.load(stream, Loader=SafeLoader)
@@ -163,11 +174,20 @@ def generate(
     custom_formatters_kwargs: dict[str, Any] | None = None,
     use_pendulum: bool = False,
     http_query_parameters: Sequence[tuple[str, str]] | None = None,
+    stream_output: bool = False,
+    render_workers: int | None = None,
+    manifest_path: Path | None = None,
+    reference_loader: ReferenceLoader | None = None,
+    remote_object_cache_size: int | None = REMOTE_CACHE_SIZE,
 ) -> None:
-    remote_text_cache: DefaultPutDict[str, str] = DefaultPutDict()
+    # Everything that shapes the generated code, so that a manifest from other settings is not reused.
+    options = {k: v for k, v in locals().items() if k not in RUN_ONLY_OPTIONS}
+    remote_text_cache: DefaultPutDict[str, str] = LRUPutDict(REMOTE_CACHE_SIZE)
     input_text = None
 
     kwargs: dict[str, Any] = {}
+    from datamodel_code_generator.manifest import Manifest, options_hash, template_files
+    from datamodel_code_generator.parser.base import ModuleInfo, Result
     from datamodel_code_generator.parser.jsonschema import JsonSchemaParser
 
     parser_class = JsonSchemaParser
@@ -241,14 +261,13 @@ def generate(
         custom_formatters_kwargs=custom_formatters_kwargs,
         use_pendulum=use_pendulum,
         http_query_parameters=http_query_parameters,
+        reference_loader=reference_loader,
+        remote_object_cache_size=remote_object_cache_size,
         **kwargs,
     )
 
-    with chdir(output):
-        results = parser.parse()
     if not input_filename:
         input_filename = input_.name
-    modules = {output: (results, input_filename)}
 
     timestamp = datetime.now(UTC).replace(microsecond=0).isoformat()
 
@@ -258,17 +277,77 @@ def generate(
     if not disable_timestamp:
         header += f"\n#   timestamp: {timestamp}"
 
-    file: IO[Any] | None
-    for path, (body, filename) in modules.items():
-        file = path.open("wt", encoding=encoding)
+    def write_module(path: Path, body: str, filename: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wt", encoding=encoding) as file:
+            print(custom_file_header or header.format(filename), file=file)
+            if body:
+                print(file=file)
+                print(body.rstrip(), file=file)
+
+    def source_name(result: Result) -> str:
+        return result.source.as_posix() if result.source else input_filename
+
+    manifest: Manifest | None = None
+    previous: Manifest | None = None
+    if manifest_path is not None:
+        options_key = options_hash(options, template_files(custom_template_dir))
+        manifest = Manifest.from_sources(options_key, parser.iter_source)
+        previous = Manifest.load(manifest_path)
+        if manifest.is_unchanged(previous) and all(p.exists() for p in previous.module_paths(output).values()):
+            return
+
+    if stream_output or manifest is not None:
+        # Modules are written as soon as they are rendered. Empty package __init__.py modules are
+        # yielded before any module is rendered and wait until the end in case they are rendered.
+        output = output.resolve()
+        placeholders: dict[tuple[str, ...], Result] = {}
+        module_names: set[tuple[str, ...]] = set()
+
+        def module_path(name: tuple[str, ...]) -> Path:
+            # A lone root module is written to ``output`` itself, as when parse() returns a string.
+            if not placeholders and module_names == {("__init__.py",)}:
+                return output
+            return output.joinpath(*name)
+
+        def write(name: tuple[str, ...], result: Result) -> None:
+            path = module_path(name)
+            write_module(path, result.body, input_filename if path == output else source_name(result))
+
+        def select(infos: dict[tuple[str, ...], ModuleInfo]) -> set[tuple[str, ...]]:
+            module_names.update(infos)
+            if manifest is None:
+                return module_names
+            manifest.modules = {"/".join(name): info for name, info in infos.items()}
+            stale = manifest.stale_modules(previous)
+            return {name for name in infos if "/".join(name) in stale or not module_path(name).exists()}
+
+        with chdir(output):
+            for name, result in parser.iter_modules(workers=render_workers, select=select):
+                if name not in module_names:
+                    placeholders[name] = result
+                    continue
+                write(name, result)
+        for name in placeholders.keys() - module_names:
+            if manifest is None or not module_path(name).exists():
+                write(name, placeholders[name])
+        if manifest is not None:
+            if previous is not None:
+                current = set(manifest.module_paths(output).values())
+                for path in set(previous.module_paths(output).values()) - current:
+                    path.unlink(missing_ok=True)
+            manifest.dump(manifest_path)
+        return
 
-        print(custom_file_header or header.format(filename), file=file)
-        if body:
-            print(file=file)
-            print(body.rstrip(), file=file)
+    with chdir(output):
+        results = parser.parse()
+    if isinstance(results, str):
+        modules = {output: (results, input_filename)}
+    else:
+        modules = {output.joinpath(*name): (result.body, source_name(result)) for name, result in results.items()}
 
-        if file is not None:
-            file.close()
+    for path, (body, filename) in modules.items():
+        write_module(path, body, filename)
 
 
 __all__ = [
@@ -0,0 +1,104 @@
+"""Decode schema documents, as JSON where they are JSON and as YAML otherwise.
+
+A document is JSON if its suffix is ``.json``, or if it has no YAML suffix and starts with ``{`` or
+``[``. JSON documents follow JSON's scalar rules, which differ from those of the YAML loader the
+generator used for everything before: ``1e3`` and ``1.0e3`` are the number 1000.0 rather than
+strings. ``.yaml`` and ``.yml`` documents, and JSON documents the JSON decoder rejects, are still
+read as YAML, with timestamps kept as strings.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import mmap
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+from datamodel_code_generator.util import SafeLoader
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Files at least this large are mapped into memory rather than read into a string first.
+MMAP_THRESHOLD: int = 1 << 20
+
+JSON_SUFFIXES: frozenset[str] = frozenset((".json",))
+YAML_SUFFIXES: frozenset[str] = frozenset((".yaml", ".yml"))
+
+
+@cache
+def _fast_json_loads() -> Callable[[Any], Any] | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson.loads
+
+
+def is_json(head: str | bytes | memoryview, suffix: str = "") -> bool:
+    """Whether a document with this suffix, starting with ``head``, is JSON rather than YAML."""
+    suffix = suffix.lower()
+    if suffix in JSON_SUFFIXES:
+        return True
+    if suffix in YAML_SUFFIXES:
+        return False
+    if not isinstance(head, str):
+        head = bytes(head[:64]).decode("utf-8", "ignore")
+    return head.lstrip("\ufeff \t\r\n")[:1] in ("{", "[")
+
+
+def _load_json(data: str | bytes | memoryview, encoding: str) -> Any:
+    fast_loads = _fast_json_loads()
+    if fast_loads is not None and (isinstance(data, str) or codecs.lookup(encoding).name == "utf-8"):
+        try:
+            return fast_loads(data)
+        except ValueError:
+            # Documents the fast decoder rejects, e.g. with NaN or very large integers, get another try.
+            pass
+    return json.loads(data if isinstance(data, str) else str(data, encoding))
+
+
+def _load_yaml(stream: Any) -> Any:
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_text(text: str, suffix: str = "") -> Any:
+    """Decode a JSON or YAML document, detecting the format from ``suffix`` or the text itself."""
+    if is_json(text, suffix):
+        try:
+            return _load_json(text, "utf-8")
+        except ValueError:
+            # Not JSON after all; YAML accepts more, as the generator always did.
+            pass
+    return _load_yaml(text)
+
+
+def load_file(path: Path, encoding: str = "utf-8") -> Any:
+    """Decode a JSON or YAML file, mapping large JSON files into memory instead of reading them."""
+    with path.open("rb") as file:
+        size = path.stat().st_size
+        if size < MMAP_THRESHOLD:
+            data = file.read()
+            if is_json(data, path.suffix):
+                try:
+                    return _load_json(data, encoding)
+                except ValueError:
+                    pass
+            return _load_yaml(data.decode(encoding))
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                if is_json(view, path.suffix):
+                    try:
+                        return _load_json(view, encoding)
+                    except ValueError:
+                        pass
+            finally:
+                view.release()
+    # The YAML loader reads the stream in chunks, so a large YAML file is never held as one string.
+    with path.open(encoding=encoding) as stream:
+        return _load_yaml(stream)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import defaultdict
+from collections.abc import Mapping
+from enum import Enum
+from importlib import metadata
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from datamodel_code_generator.model.base import TEMPLATE_DIR
+from datamodel_code_generator.parser.base import ModuleInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from datamodel_code_generator.parser.base import Source
+
+MANIFEST_VERSION: int = 2
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def generator_version() -> str:
+    try:
+        return metadata.version("datamodel-code-generator")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _normalize(value: Any) -> Any:
+    """A JSON-serializable form of an option value that is the same in every process."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, PurePath):
+        return value.as_posix()
+    if isinstance(value, Mapping):
+        return {str(k): _normalize(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (set, frozenset)):
+        return sorted((_normalize(v) for v in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if callable(value) and hasattr(value, "__qualname__"):
+        # Functions and classes are known by name: their default repr holds a memory address.
+        return f"{getattr(value, '__module__', None)}.{value.__qualname__}"
+    if hasattr(value, "__dict__"):
+        return [f"{type(value).__module__}.{type(value).__qualname__}", _normalize(vars(value))]
+    return repr(value)
+
+
+def template_files(custom_template_dir: Path | None = None) -> list[Path]:
+    """The built-in templates and those in ``custom_template_dir``, which override them by path."""
+    directories = [TEMPLATE_DIR] if custom_template_dir is None else [TEMPLATE_DIR, custom_template_dir]
+    return [path for directory in directories for path in sorted(directory.rglob("*")) if path.is_file()]
+
+
+def options_hash(options: Mapping[str, Any], files: Iterable[Path] = ()) -> str:
+    """Hash the options of a run, the contents of ``files``, e.g. templates, and the generator version."""
+    digest = hashlib.sha256()
+    key = {"version": generator_version(), "options": _normalize(options)}
+    digest.update(json.dumps(key, sort_keys=True).encode())
+    for path in files:
+        digest.update(path.as_posix().encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+class Manifest(BaseModel):
+    """Content hashes of the inputs of a run and the output modules built from them.
+
+    ``modules`` maps each module, as a ``/``-separated path, to its source files, the modules it
+    depends on and its class names.
+    """
+
+    version: int = MANIFEST_VERSION
+    options: str
+    inputs: dict[str, str]
+    modules: dict[str, ModuleInfo] = {}
+
+    @classmethod
+    def from_sources(cls, options: str, sources: Iterable[Source]) -> Manifest:
+        """A manifest without modules, for the ``options`` key from :func:`options_hash` and ``sources``."""
+        return cls(options=options, inputs={s.path.as_posix(): content_hash(s.text) for s in sources})
+
+    @classmethod
+    def load(cls, path: Path) -> Manifest | None:
+        try:
+            manifest = cls.model_validate_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.version == MANIFEST_VERSION else None
+
+    def dump(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.model_dump_json(indent=2) + "\n", encoding="utf-8")
+
+    def module_paths(self, output: Path) -> dict[str, Path]:
+        # A lone root module is written to ``output`` itself.
+        if self.modules.keys() == {"__init__.py"}:
+            return {"__init__.py": output}
+        return {name: output.joinpath(*name.split("/")) for name in self.modules}
+
+    def is_unchanged(self, previous: Manifest | None) -> bool:
+        return previous is not None and previous.options == self.options and previous.inputs == self.inputs
+
+    def stale_modules(self, previous: Manifest | None) -> set[str]:
+        """Modules whose inputs, class names or dependencies changed, and every module depending on them."""
+        if previous is None or previous.options != self.options:
+            return set(self.modules)
+        changed_inputs = {p for p, h in self.inputs.items() if previous.inputs.get(p) != h}
+        changed_inputs |= previous.inputs.keys() - self.inputs.keys()
+        stale = {
+            name
+            for name, module in self.modules.items()
+            if previous.modules.get(name) != module
+            # Modules without a source file, e.g. from a text input, depend on every input.
+            or (changed_inputs and not module.sources)
+            or not changed_inputs.isdisjoint(module.sources)
+        }
+        dependents: defaultdict[str, set[str]] = defaultdict(set)
+        for name, module in self.modules.items():
+            for dependency in module.dependencies:
+                dependents[dependency].add(name)
+        pending = list(stale)
+        while pending:
+            for dependent in dependents[pending.pop()] - stale:
+                stale.add(dependent)
+                pending.append(dependent)
+        return stale
@@ -5,6 +5,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
     List,
@@ -14,7 +15,7 @@ from typing import (
 )
 from warnings import warn
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, Template, TemplateNotFound
 from pydantic import Field
 
 from datamodel_code_generator.imports import (
@@ -127,6 +128,7 @@ class DataModelFieldBase(_BaseModel):
             return type_hint
         return get_optional_type(type_hint, self.data_type.use_union_operator)
 
+    @property
     def imports(self) -> tuple[Import, ...]:
         type_hint = self.type_hint
         has_union = not self.data_type.use_union_operator and UNION_PREFIX in type_hint
@@ -191,11 +193,47 @@ class DataModelFieldBase(_BaseModel):
         return True
 
 
+class TemplateLoader(BaseLoader):
+    """Load templates by path, relative to :data:`TEMPLATE_DIR` unless the path is absolute."""
+
+    def get_source(self, environment: Environment, template: str) -> Tuple[str, str, Callable[[], bool]]:
+        path = TEMPLATE_DIR / template
+        try:
+            source = path.read_text(encoding="utf-8")
+            mtime = path.stat().st_mtime
+        except OSError:
+            raise TemplateNotFound(template) from None
+
+        def uptodate() -> bool:
+            try:
+                return path.stat().st_mtime == mtime
+            except OSError:
+                return False
+
+        return source, str(path), uptodate
+
+
+class TemplateEnvironment(Environment):
+    """Environment that resolves ``include`` and ``import`` names next to the including template."""
+
+    def join_path(self, template: str, parent: str) -> str:
+        return str(Path(parent).parent / template)
+
+
+# One environment for every model class, so each template is compiled once per process.
+TEMPLATE_ENVIRONMENT: Environment = TemplateEnvironment(loader=TemplateLoader(), auto_reload=False)
+
+
+def set_template_cache_dir(directory: Path | None) -> None:
+    """Store compiled templates in ``directory`` so later processes skip compiling them, or stop if ``None``."""
+    TEMPLATE_ENVIRONMENT.bytecode_cache = None if directory is None else FileSystemBytecodeCache(str(directory))
+    TEMPLATE_ENVIRONMENT.cache.clear()
+    get_template.cache_clear()
+
+
 @lru_cache()
 def get_template(template_file_path: Path) -> Template:
-    loader = FileSystemLoader(str(TEMPLATE_DIR / template_file_path.parent))
-    environment: Environment = Environment(loader=loader)
-    return environment.get_template(template_file_path.name)
+    return TEMPLATE_ENVIRONMENT.get_template(str(template_file_path))
 
 
 def get_module_path(name: str, file_path: Path | None) -> List[str]:
@@ -6,6 +6,9 @@ from typing import Callable, Dict, Optional, TypeVar
 TK = TypeVar("TK")
 TV = TypeVar("TV")
 
+# The number of remote documents a parser keeps, as text and decoded, unless told otherwise.
+REMOTE_CACHE_SIZE: int = 256
+
 
 class LiteralType(Enum):
     All = "all"
@@ -30,4 +33,27 @@ class DefaultPutDict(Dict[TK, TV]):
         raise ValueError("Not found default and default_factory")
 
 
+class LRUPutDict(DefaultPutDict[TK, TV]):
+    """A :class:`DefaultPutDict` holding at most ``maxsize`` entries, evicting the least recently used."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get_or_put(
+        self,
+        key: TK,
+        default: Optional[TV] = None,
+        default_factory: Optional[Callable[[TK], TV]] = None,
+    ) -> TV:
+        if key in self:
+            # Dicts keep insertion order, so re-inserting marks the entry as most recently used.
+            value = self[key] = self.pop(key)
+            return value
+        value = super().get_or_put(key, default, default_factory)
+        while len(self) > self.maxsize:
+            del self[next(iter(self))]
+        return value
+
+
 __all__ = ["LiteralType"]
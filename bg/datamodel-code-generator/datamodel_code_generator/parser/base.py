@@ -1,13 +1,14 @@
 import re
-import sys
 from abc import ABC, abstractmethod
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from itertools import groupby
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     DefaultDict,
+    Deque,
     Dict,
     Iterable,
     Iterator,
@@ -24,7 +25,7 @@ from typing import (
 )
 from urllib.parse import ParseResult
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from datamodel_code_generator.format import PythonVersion
 from datamodel_code_generator.imports import (
@@ -34,6 +35,7 @@ from datamodel_code_generator.imports import (
     Import,
     Imports,
 )
+from datamodel_code_generator.loader import load_file, load_text
 from datamodel_code_generator.model import pydantic as pydantic_model
 from datamodel_code_generator.model import pydantic_v2 as pydantic_model_v2
 from datamodel_code_generator.model.base import (
@@ -45,8 +47,9 @@ from datamodel_code_generator.model.base import (
     DataModelFieldBase,
 )
 from datamodel_code_generator.model.enum import Enum, Member
-from datamodel_code_generator.parser import DefaultPutDict, LiteralType
+from datamodel_code_generator.parser import REMOTE_CACHE_SIZE, DefaultPutDict, LiteralType, LRUPutDict
 from datamodel_code_generator.reference import ModelResolver, Reference
+from datamodel_code_generator.remote import ReferenceLoader
 from datamodel_code_generator.types import DataType, DataTypeManager, StrictTypes
 from datamodel_code_generator.util import Protocol, runtime_checkable
 
@@ -94,6 +97,49 @@ def to_hashable(item: Any) -> Any:
     return item
 
 
+def get_field_fingerprint(field: DataModelFieldBase) -> Tuple[Any, ...]:
+    """Structural key of a field: the attributes its declaration and imports are generated from."""
+    return (
+        type(field),
+        field.name,
+        field.alias,
+        field.type_hint,
+        field.required,
+        field.nullable,
+        field.has_default,
+        field.represented_default,
+        field.strip_default_none,
+        field.use_annotated,
+        field.use_field_description,
+        field.use_default_kwarg,
+        field.const,
+        to_hashable(field.constraints),
+        to_hashable(field.extras),
+        field.data_type.is_optional,
+        field.data_type.strict,
+        to_hashable(list(field.data_type.all_imports)),
+    )
+
+
+def get_model_fingerprint(model: DataModel, class_name: Optional[str] = None) -> Tuple[Any, ...]:
+    """Structural key of a model: equal keys mean the models generate the same class.
+
+    The key is built from the model's template and the field and type structure the template
+    renders, so models are compared without rendering them.
+    """
+    return (
+        str(model.template_file_path),
+        class_name or model.class_name,
+        model.base_class,
+        tuple(model.decorators),
+        tuple(model.methods),
+        model.description,
+        to_hashable(model.extra_template_data),
+        tuple(get_field_fingerprint(f) for f in model.fields),
+        to_hashable(model._additional_imports),
+    )
+
+
 def dump_templates(templates: List[DataModel]) -> str:
     return "\n\n\n".join(str(m) for m in templates)
 
@@ -101,90 +147,152 @@ def dump_templates(templates: List[DataModel]) -> str:
 ReferenceMapSet = Dict[str, Set[str]]
 SortedDataModels = Dict[str, DataModel]
 
-MAX_RECURSION_COUNT: int = sys.getrecursionlimit()
+
+def _strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """Find the strongly connected components of a graph with an iterative Tarjan's algorithm.
+
+    Components are returned after every component they reach, so dependencies come first.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+    for start in graph:
+        if start in index:
+            continue
+        index[start] = lowlink[start] = len(index)
+        stack.append(start)
+        on_stack.add(start)
+        work: List[Tuple[str, Iterator[str]]] = [(start, iter(graph[start]))]
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(graph[successor])))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: List[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def _order_base_classes_first(members: List[str], data_models: Dict[str, DataModel]) -> List[str]:
+    """Order the members of a reference cycle so that base classes precede their subclasses."""
+    member_set = set(members)
+    ordered: List[str] = []
+    visited: Set[str] = set()
+    for member in members:
+        stack = [(member, False)]
+        while stack:
+            path, expanded = stack.pop()
+            if expanded:
+                ordered.append(path)
+                continue
+            if path in visited:
+                continue
+            visited.add(path)
+            stack.append((path, True))
+            bases = [b.reference.path for b in data_models[path].base_classes if b.reference]
+            stack.extend((b, False) for b in reversed(bases) if b in member_set and b not in visited)
+    return ordered
 
 
 def sort_data_models(
     unsorted_data_models: List[DataModel],
     sorted_data_models: Optional[SortedDataModels] = None,
     require_update_action_models: Optional[List[str]] = None,
-    recursion_count: int = MAX_RECURSION_COUNT,
 ) -> Tuple[List[DataModel], SortedDataModels, List[str]]:
+    """Order data models so that every model comes after the models it references.
+
+    The models are grouped into strongly connected components of the reference graph, which takes
+    linear time. Models outside reference cycles keep the order of resolving them in rounds over
+    the input: a model is placed in the first round in which all its references are placed, and
+    models of the same round keep their input order. Models in a cycle, or depending on one, follow
+    in the same manner with each cycle kept together and its base classes first. Cycle members and
+    self-referencing models are listed in ``require_update_action_models``, as are models placed
+    after a cycle whose base class is listed.
+
+    Returns the models placed after a cycle, the sorted models and the models requiring an update.
+    """
     if sorted_data_models is None:
         sorted_data_models = OrderedDict()
     if require_update_action_models is None:
         require_update_action_models = []
-    sorted_model_count: int = len(sorted_data_models)
-
-    unresolved_references: List[DataModel] = []
-    for model in unsorted_data_models:
-        if not model.reference_classes:
-            sorted_data_models[model.path] = model
-        elif model.path in model.reference_classes and len(model.reference_classes) == 1:
-            sorted_data_models[model.path] = model
-            require_update_action_models.append(model.path)
-        elif not model.reference_classes - {model.path} - set(sorted_data_models):
-            sorted_data_models[model.path] = model
-            if model.path in model.reference_classes:
-                require_update_action_models.append(model.path)
-        else:
-            unresolved_references.append(model)
-    if unresolved_references:
-        if sorted_model_count != len(sorted_data_models) and recursion_count:
-            try:
-                return sort_data_models(
-                    unresolved_references,
-                    sorted_data_models,
-                    require_update_action_models,
-                    recursion_count - 1,
-                )
-            except RecursionError:
-                pass
-
-        while True:
-            ordered_models: List[Tuple[int, DataModel]] = []
-            unresolved_reference_model_names = [m.path for m in unresolved_references]
-            for model in unresolved_references:
-                indexes = [
-                    unresolved_reference_model_names.index(b.reference.path)
-                    for b in model.base_classes
-                    if b.reference and b.reference.path in unresolved_reference_model_names
-                ]
-                if indexes:
-                    ordered_models.append((
-                        max(indexes),
-                        model,
-                    ))
-                else:
-                    ordered_models.append((
-                        -1,
-                        model,
-                    ))
-            sorted_unresolved_models = [m[1] for m in sorted(ordered_models, key=lambda m: m[0])]
-            if sorted_unresolved_models == unresolved_references:
-                break
-            unresolved_references = sorted_unresolved_models
-
-        unsorted_data_model_names = set(unresolved_reference_model_names)
-        for model in unresolved_references:
-            unresolved_model = model.reference_classes - {model.path} - set(sorted_data_models)
-            base_models = [getattr(s.reference, "path", None) for s in model.base_classes]
-            update_action_parent = set(require_update_action_models).intersection(base_models)
-            if not unresolved_model:
-                sorted_data_models[model.path] = model
-                if update_action_parent:
-                    require_update_action_models.append(model.path)
-                continue
-            if not unresolved_model - unsorted_data_model_names:
-                sorted_data_models[model.path] = model
-                require_update_action_models.append(model.path)
-                continue
 
-            unresolved_classes = ", ".join(
-                f"[class: {item.path} references: {item.reference_classes}]" for item in unresolved_references
-            )
-            raise Exception(f"A Parser can not resolve classes: {unresolved_classes}.")
-    return unresolved_references, sorted_data_models, require_update_action_models
+    data_models: Dict[str, DataModel] = {}
+    positions: Dict[str, int] = {}
+    for position, model in enumerate(unsorted_data_models):
+        data_models[model.path] = model
+        positions.setdefault(model.path, position)
+    resolved = set(sorted_data_models)
+    reference_classes = {path: model.reference_classes for path, model in data_models.items()}
+
+    graph: Dict[str, List[str]] = {}
+    for path, references in reference_classes.items():
+        graph[path] = [r for r in references if r != path and r not in resolved]
+    unresolved_references = [
+        data_models[path] for path, references in graph.items() if any(r not in data_models for r in references)
+    ]
+    if unresolved_references:
+        unresolved_classes = ", ".join(
+            f"[class: {item.path} references: {reference_classes[item.path]}]" for item in unresolved_references
+        )
+        raise Exception(f"A Parser can not resolve classes: {unresolved_classes}.")
+
+    sort_keys: Dict[str, Tuple[bool, int, int, int]] = {}
+    cyclic: Set[str] = set()
+    for component in _strongly_connected_components(graph):
+        members = set(component)
+        position = min(positions[path] for path in component)
+        is_cycle = len(component) > 1
+        after_cycle = is_cycle
+        round_ = 0
+        for path in component:
+            for reference in graph[path]:
+                if reference in members:
+                    continue
+                reference_after_cycle, reference_round, reference_position, _ = sort_keys[reference]
+                # A reference placed later in the input than this model is only seen in the next round.
+                round_ = max(round_, reference_round + (reference_position > position))
+                after_cycle = after_cycle or reference_after_cycle
+        if is_cycle:
+            cyclic.update(component)
+            component = _order_base_classes_first(sorted(component, key=positions.__getitem__), data_models)
+        for rank, path in enumerate(component):
+            sort_keys[path] = (after_cycle, round_, position, rank)
+
+    require_update = set(require_update_action_models)
+    placed_after_cycle: List[DataModel] = []
+    for path in sorted(sort_keys, key=sort_keys.__getitem__):
+        model = sorted_data_models[path] = data_models[path]
+        after_cycle = sort_keys[path][0]
+        if after_cycle:
+            placed_after_cycle.append(model)
+        if (
+            path in cyclic
+            or path in reference_classes[path]
+            or (after_cycle and any(b.reference and b.reference.path in require_update for b in model.base_classes))
+        ):
+            require_update.add(path)
+            require_update_action_models.append(path)
+    return placed_after_cycle, sorted_data_models, require_update_action_models
 
 
 def relative(current_module: str, reference: str) -> Tuple[str, str]:
@@ -283,16 +391,36 @@ class Result(BaseModel):
     source: Optional[Path] = None
 
 
+class ModuleInfo(BaseModel):
+    sources: List[str] = []
+    dependencies: List[str] = []
+    class_names: List[str] = []
+
+
 class Source(BaseModel):
+    """A schema document, given as text or as the file that holds it, which is only read when needed."""
+
     path: Path
-    text: str
+    content: Optional[str] = Field(default=None, alias="text")
+    file: Optional[Path] = None
+    encoding: str = "utf-8"
 
     @classmethod
     def from_path(cls, path: Path, base_path: Path, encoding: str) -> "Source":
-        return cls(
-            path=path.relative_to(base_path),
-            text=path.read_text(encoding=encoding),
-        )
+        return cls(path=path.relative_to(base_path), file=path, encoding=encoding)
+
+    @property
+    def text(self) -> str:
+        if self.content is None:
+            assert self.file is not None
+            return self.file.read_text(encoding=self.encoding)
+        return self.content
+
+    def load(self) -> Any:
+        """Decode the document, through :func:`~datamodel_code_generator.loader.load_file` if it is a file."""
+        if self.content is None and self.file is not None:
+            return load_file(self.file, self.encoding)
+        return load_text(self.text, self.path.suffix)
 
 
 class Parser(ABC):
@@ -364,6 +492,7 @@ class Parser(ABC):
         custom_formatters_kwargs: Optional[Dict[str, Any]] = None,
         use_pendulum: bool = False,
         http_query_parameters: Optional[Sequence[Tuple[str, str]]] = None,
+        reference_loader: Optional[ReferenceLoader] = None,
     ) -> None:
         self.data_type_manager: DataTypeManager = data_type_manager_type(
             python_version=target_python_version,
@@ -409,7 +538,10 @@ class Parser(ABC):
         self.field_extra_keys_without_x_prefix: Set[str] = field_extra_keys_without_x_prefix or set()
         self.field_include_all_keys: bool = field_include_all_keys
 
-        self.remote_text_cache: DefaultPutDict[str, str] = remote_text_cache or DefaultPutDict()
+        self.remote_text_cache: DefaultPutDict[str, str] = (
+            LRUPutDict(REMOTE_CACHE_SIZE) if remote_text_cache is None else remote_text_cache
+        )
+        self.reference_loader: ReferenceLoader = reference_loader or ReferenceLoader()
         self.current_source_path: Optional[Path] = None
         self.use_title_as_name: bool = use_title_as_name
         self.use_operation_id_as_name: bool = use_operation_id_as_name
@@ -500,15 +632,15 @@ class Parser(ABC):
             self.imports.append(new_import)
 
     def _get_text_from_url(self, url: str) -> str:
-        from datamodel_code_generator.http import get_body
-
         return self.remote_text_cache.get_or_put(
-            url,
-            default_factory=lambda url_: get_body(
-                url, self.http_headers, self.http_ignore_tls, self.http_query_parameters
-            ),
+            url, default_factory=lambda url_: self.reference_loader.load_text(url_, self._fetch_url)
         )
 
+    def _fetch_url(self, url: str) -> str:
+        from datamodel_code_generator.http import get_body
+
+        return get_body(url, self.http_headers, self.http_ignore_tls, self.http_query_parameters)
+
     @classmethod
     def get_url_path_parts(cls, url: ParseResult) -> List[str]:
         return [
@@ -525,9 +657,12 @@ class Parser(ABC):
         raise NotImplementedError
 
     def __delete_duplicate_models(self, models: List[DataModel]) -> None:
-        model_class_names: Dict[str, DataModel] = {}
+        remaining: Set[DataModel] = set(models)
+        removed: Set[DataModel] = set()
+        # The last distinct model of each class name and its fingerprint, computed when needed.
+        model_class_names: Dict[str, Tuple[DataModel, Optional[Tuple[Any, ...]]]] = {}
         model_to_duplicate_models: DefaultDict[DataModel, List[DataModel]] = defaultdict(list)
-        for model in models[:]:
+        for model in models:
             if isinstance(model, self.data_model_root_type):
                 root_data_type = model.fields[0].data_type
 
@@ -535,13 +670,14 @@ class Parser(ABC):
                     root_data_type.reference
                     and not root_data_type.is_dict
                     and not root_data_type.is_list
-                    and root_data_type.reference.source in models
+                    and root_data_type.reference.source in remaining
                     and root_data_type.reference.name
                     == self.model_resolver.get_class_name(model.reference.original_name, unique=False).name
                 ):
                     for child in model.reference.children[:]:
                         child.replace_reference(root_data_type.reference)
-                    models.remove(model)
+                    remaining.discard(model)
+                    removed.add(model)
                     for data_type in model.all_data_types:
                         if data_type.reference:
                             data_type.remove_reference()
@@ -555,32 +691,27 @@ class Parser(ABC):
                         if not child.base_classes:
                             child.set_base_class()
 
+            # A model is a duplicate of the last distinct model with the same class name, so each
+            # model is fingerprinted at most once, when a second model with its class name turns up.
             class_name = model.duplicate_class_name or model.class_name
+            model_key = None
             if class_name in model_class_names:
-                model_key = tuple(
-                    to_hashable(v)
-                    for v in (
-                        model.render(class_name=model.duplicate_class_name),
-                        model.imports,
-                    )
-                )
-                original_model = model_class_names[class_name]
-                original_model_key = tuple(
-                    to_hashable(v)
-                    for v in (
-                        original_model.render(class_name=original_model.duplicate_class_name),
-                        original_model.imports,
-                    )
-                )
+                original_model, original_model_key = model_class_names[class_name]
+                if original_model_key is None:
+                    original_model_key = get_model_fingerprint(original_model, original_model.duplicate_class_name)
+                    model_class_names[class_name] = (original_model, original_model_key)
+                model_key = get_model_fingerprint(model, model.duplicate_class_name)
                 if model_key == original_model_key:
                     model_to_duplicate_models[original_model].append(model)
                     continue
-            model_class_names[class_name] = model
+            model_class_names[class_name] = (model, model_key)
         for model, duplicate_models in model_to_duplicate_models.items():
             for duplicate_model in duplicate_models:
                 for child in duplicate_model.reference.children[:]:
                     child.replace_reference(model.reference)
-                models.remove(duplicate_model)
+                removed.add(duplicate_model)
+        if removed:
+            models[:] = [m for m in models if m not in removed]
 
     @classmethod
     def __replace_duplicate_name_in_module(cls, models: List[DataModel]) -> None:
@@ -795,21 +926,23 @@ class Parser(ABC):
     def __reuse_model(self, models: List[DataModel], require_update_action_models: List[str]) -> None:
         if not self.reuse_model:
             return None
-        model_cache: Dict[Tuple[str, ...], Reference] = {}
-        duplicates = []
-        for model in models[:]:
-            model_key = tuple(to_hashable(v) for v in (model.render(class_name="M"), model.imports))
+        model_cache: Dict[Tuple[Any, ...], Reference] = {}
+        require_update = set(require_update_action_models)
+        remaining: Set[DataModel] = set(models)
+        duplicates: Set[DataModel] = set()
+        inherited_models: Dict[DataModel, DataModel] = {}
+        for model in models:
+            model_key = get_model_fingerprint(model, "M")
             cached_model_reference = model_cache.get(model_key)
             if cached_model_reference:
                 if isinstance(model, Enum):
                     for child in model.reference.children[:]:
                         data_model = get_most_of_parent(child)
 
-                        if data_model in models:
+                        if data_model in remaining:
                             child.replace_reference(cached_model_reference)
-                    duplicates.append(model)
+                    duplicates.add(model)
                 else:
-                    index = models.index(model)
                     inherited_model = model.__class__(
                         fields=[],
                         base_classes=[cached_model_reference],
@@ -820,16 +953,18 @@ class Parser(ABC):
                         ),
                         custom_template_dir=model._custom_template_dir,
                     )
-                    if cached_model_reference.path in require_update_action_models:
+                    if cached_model_reference.path in require_update:
+                        require_update.add(inherited_model.path)
                         require_update_action_models.append(inherited_model.path)
-                    models.insert(index, inherited_model)
-                    models.remove(model)
+                    inherited_models[model] = inherited_model
+                    remaining.discard(model)
+                    remaining.add(inherited_model)
 
             else:
                 model_cache[model_key] = model.reference
 
-        for duplicate in duplicates:
-            models.remove(duplicate)
+        if duplicates or inherited_models:
+            models[:] = [inherited_models.get(m, m) for m in models if m not in duplicates]
 
     def __collapse_root_models(
         self, models: List[DataModel], unused_models: List[DataModel], imports: Imports
@@ -1053,6 +1188,30 @@ class Parser(ABC):
         format_: Optional[bool] = True,
         settings_path: Optional[Path] = None,
     ) -> Union[str, Dict[Tuple[str, ...], Result]]:
+        results = dict(self.iter_modules(with_import, format_, settings_path))
+
+        if [*results] == [("__init__.py",)]:
+            return results[("__init__.py",)].body
+
+        return results
+
+    def iter_modules(
+        self,
+        with_import: Optional[bool] = True,
+        format_: Optional[bool] = True,
+        settings_path: Optional[Path] = None,
+        workers: Optional[int] = None,
+        select: Optional[Callable[[Dict[Tuple[str, ...], ModuleInfo]], Set[Tuple[str, ...]]]] = None,
+    ) -> Iterator[Tuple[Tuple[str, ...], Result]]:
+        """Parse the source and yield each output module as soon as it is rendered.
+
+        Empty ``__init__.py`` modules of packages are yielded first; a package whose ``__init__.py``
+        has models is yielded again once rendered. With ``workers``, modules are rendered in a
+        thread pool while keeping their order, with at most one pending module per worker.
+
+        Before rendering, ``select`` is called with the source files, dependencies on other modules
+        and class names of every module with models, and only the modules it returns are rendered.
+        """
         self.parse_raw()
 
         if with_import:
@@ -1063,7 +1222,7 @@ class Parser(ABC):
 
         _, sorted_data_models, require_update_action_models = sort_data_models(self.results)
 
-        results: Dict[Tuple[str, ...], Result] = {}
+        module_names: Set[Tuple[str, ...]] = set()
 
         def module_key(data_model: DataModel) -> Tuple[str, ...]:
             return tuple(data_model.module_path)
@@ -1110,9 +1269,10 @@ class Parser(ABC):
             init = False
             if module:
                 parent = (*module[:-1], "__init__.py")
-                if parent not in results:
-                    results[parent] = Result(body="")
-                if (*module, "__init__.py") in results:
+                if parent not in module_names:
+                    module_names.add(parent)
+                    yield parent, Result(body="")
+                if (*module, "__init__.py") in module_names:
                     module = (*module, "__init__.py")
                     init = True
                 else:
@@ -1147,7 +1307,26 @@ class Parser(ABC):
         for module, models, init, imports, scoped_model_resolver in processed_models:
             self.__change_imported_model_name(models, imports, scoped_model_resolver)
 
-        for module, models, init, imports, scoped_model_resolver in processed_models:
+        if select is not None:
+            model_modules = {m.path: p.module for p in processed_models for m in p.models}
+            module_infos = {
+                p.module: ModuleInfo(
+                    sources=sorted({m.file_path.as_posix() for m in p.models if m.file_path}),
+                    dependencies=sorted({
+                        "/".join(model_modules[r])
+                        for m in p.models
+                        for r in m.reference_classes
+                        if r in model_modules and model_modules[r] != p.module
+                    }),
+                    class_names=[m.class_name for m in p.models],
+                )
+                for p in processed_models
+            }
+            selected = select(module_infos)
+            processed_models = [p for p in processed_models if p.module in selected]
+
+        def render(processed: Processed) -> Result:
+            models, imports = processed.models, processed.imports
             result: List[str] = []
             if with_import:
                 result += [str(self.imports), str(imports), "\n"]
@@ -1167,9 +1346,20 @@ class Parser(ABC):
             if code_formatter:
                 body = code_formatter.format_code(body)
 
-            results[module] = Result(body=body, source=models[0].file_path if models else None)
+            return Result(body=body, source=models[0].file_path if models else None)
 
-        if [*results] == [("__init__.py",)]:
-            return results[("__init__.py",)].body
+        if not workers or workers == 1:
+            for processed in processed_models:
+                yield processed.module, render(processed)
+            return
 
-        return results
+        with ThreadPoolExecutor(workers) as executor:
+            pending: Deque[Tuple[Tuple[str, ...], Future[Result]]] = deque()
+            for processed in processed_models:
+                pending.append((processed.module, executor.submit(render, processed)))
+                if len(pending) >= workers:
+                    module, future = pending.popleft()
+                    yield module, future.result()
+            while pending:
+                module, future = pending.popleft()
+                yield module, future.result()
@@ -22,7 +22,7 @@ from typing import (
     Type,
     Union,
 )
-from urllib.parse import ParseResult
+from urllib.parse import ParseResult, urlparse
 from warnings import warn
 
 from pydantic import (
@@ -31,14 +31,14 @@ from pydantic import (
 
 from datamodel_code_generator import (
     InvalidClassNameError,
-    load_yaml,
 )
 from datamodel_code_generator.format import PythonVersion
+from datamodel_code_generator.loader import load_file, load_text
 from datamodel_code_generator.model import DataModel, DataModelFieldBase
 from datamodel_code_generator.model import pydantic as pydantic_model
 from datamodel_code_generator.model.base import UNDEFINED, get_module_name
 from datamodel_code_generator.model.enum import Enum
-from datamodel_code_generator.parser import DefaultPutDict, LiteralType
+from datamodel_code_generator.parser import REMOTE_CACHE_SIZE, DefaultPutDict, LiteralType, LRUPutDict
 from datamodel_code_generator.parser.base import (
     SPECIAL_PATH_FORMAT,
     Parser,
@@ -48,6 +48,7 @@ from datamodel_code_generator.parser.base import (
     title_to_class_name,
 )
 from datamodel_code_generator.reference import ModelType, Reference, is_url
+from datamodel_code_generator.remote import ReferenceLoader
 from datamodel_code_generator.types import (
     DataType,
     DataTypeManager,
@@ -138,6 +139,16 @@ json_schema_data_formats: Dict[str, Dict[str, Types]] = {
 }
 
 
+def normalize_ref(value: Any) -> Any:
+    if isinstance(value, str) and "#" in value:
+        if value.endswith("#/"):
+            return value[:-1]
+        elif "#/" in value or value[0] == "#" or value[-1] == "#":
+            return value
+        return value.replace("#", "#/")
+    return value
+
+
 class JSONReference(_enum.Enum):
     LOCAL = "LOCAL"
     REMOTE = "REMOTE"
@@ -190,13 +201,7 @@ class JsonSchemaObject(BaseModel):
 
     @field_validator("ref")
     def validate_ref(cls, value: Any) -> Any:
-        if isinstance(value, str) and "#" in value:
-            if value.endswith("#/"):
-                return value[:-1]
-            elif "#/" in value or value[0] == "#" or value[-1] == "#":
-                return value
-            return value.replace("#", "#/")
-        return value
+        return normalize_ref(value)
 
     items: Union[List[JsonSchemaObject], JsonSchemaObject, bool, None] = None
     uniqueItems: Optional[bool] = None
@@ -337,6 +342,146 @@ EXCLUDE_FIELD_KEYS = (
 }
 
 
+# Returned by the converters below for values that only full validation handles correctly.
+_COMPLEX: Any = object()
+
+
+def _str(value: Any) -> Any:
+    return value if type(value) is str else _COMPLEX
+
+
+def _int(value: Any) -> Any:
+    # Exact types: validation would turn True into 1 and 1.0 into 1.
+    return value if type(value) is int else _COMPLEX
+
+
+def _bool(value: Any) -> Any:
+    return value if type(value) is bool else _COMPLEX
+
+
+def _number(value: Any) -> Any:
+    return UnionIntFloat(value) if type(value) in (int, float) else _COMPLEX
+
+
+def _any(value: Any) -> Any:
+    return value
+
+
+def _list(value: Any) -> Any:
+    return list(value) if type(value) is list else _COMPLEX
+
+
+def _strings(value: Any) -> Any:
+    return list(value) if type(value) is list and all(type(v) is str for v in value) else _COMPLEX
+
+
+def _type(value: Any) -> Any:
+    return value if type(value) is str else _strings(value)
+
+
+def _ref(value: Any) -> Any:
+    return normalize_ref(value) if type(value) is str else _COMPLEX
+
+
+def _items(value: Any) -> Any:
+    # Empty and false items are dropped by ``validate_items``; lists are tuple validation.
+    return build_schema_object(value) if type(value) is dict and value else _COMPLEX
+
+
+def _schema_or_bool(value: Any) -> Any:
+    if type(value) is bool:
+        return value
+    return build_schema_object(value) if type(value) is dict else _COMPLEX
+
+
+def _properties(value: Any) -> Any:
+    if type(value) is not dict:
+        return _COMPLEX
+    properties = {}
+    for name, property_ in value.items():
+        property_ = _schema_or_bool(property_)
+        if type(name) is not str or property_ is _COMPLEX:
+            return _COMPLEX
+        properties[name] = property_
+    return properties
+
+
+# The keywords build_schema_object handles itself: the field each sets and how its value is converted.
+SIMPLE_SCHEMA_KEYWORDS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "type": ("type", _type),
+    "format": ("format", _str),
+    "pattern": ("pattern", _str),
+    "minLength": ("minLength", _int),
+    "maxLength": ("maxLength", _int),
+    "minItems": ("minItems", _int),
+    "maxItems": ("maxItems", _int),
+    "minimum": ("minimum", _number),
+    "maximum": ("maximum", _number),
+    "uniqueItems": ("uniqueItems", _bool),
+    "nullable": ("nullable", _bool),
+    "readOnly": ("readOnly", _bool),
+    "writeOnly": ("writeOnly", _bool),
+    "description": ("description", _str),
+    "title": ("title", _str),
+    "required": ("required", _strings),
+    "enum": ("enum", _list),
+    "default": ("default", _any),
+    "example": ("example", _any),
+    "examples": ("examples", _any),
+    "$ref": ("ref", _ref),
+    "properties": ("properties", _properties),
+    "additionalProperties": ("additionalProperties", _schema_or_bool),
+    "items": ("items", _items),
+}
+
+# Keys that set a field of JsonSchemaObject, by name or alias; any other key only lands in ``extras``.
+_SCHEMA_OBJECT_KEYS: frozenset[str] = frozenset(
+    key for name, field in JsonSchemaObject.get_fields().items() for key in (name, field.alias) if key
+)
+_COMPLEX_SCHEMA_KEYS: frozenset[str] = _SCHEMA_OBJECT_KEYS - SIMPLE_SCHEMA_KEYWORDS.keys()
+_SCHEMA_OBJECT_DEFAULTS: Dict[str, Any] = {
+    name: field.get_default(call_default_factory=True) for name, field in JsonSchemaObject.get_fields().items()
+}
+# Fields whose default is a list or dict, which every object needs its own copy of.
+_MUTABLE_DEFAULTS: Tuple[str, ...] = tuple(
+    name for name, default in _SCHEMA_OBJECT_DEFAULTS.items() if isinstance(default, (list, dict))
+)
+
+
+def build_schema_object(raw: Dict[str, Any]) -> JsonSchemaObject:
+    """Build the same ``JsonSchemaObject`` as ``JsonSchemaObject.parse_obj(raw)``, validating only what needs it.
+
+    A node that uses only :data:`SIMPLE_SCHEMA_KEYWORDS`, with plain values, is constructed
+    directly from the dict, and so are its subschemas. Any other node, e.g. one with ``allOf``,
+    ``exclusiveMinimum`` or tuple ``items``, falls back to full validation.
+    """
+    if not _COMPLEX_SCHEMA_KEYS.isdisjoint(raw):
+        return JsonSchemaObject.parse_obj(raw)
+    values: Dict[str, Any] = {}
+    for key, value in raw.items():
+        keyword = SIMPLE_SCHEMA_KEYWORDS.get(key)
+        if keyword is None:
+            continue
+        field_name, convert = keyword
+        value = convert(value)
+        if value is _COMPLEX:
+            return JsonSchemaObject.parse_obj(raw)
+        values[field_name] = value
+    fields_set = {*values, "extras"}
+    for name in _MUTABLE_DEFAULTS:
+        if name not in values:
+            values[name] = _SCHEMA_OBJECT_DEFAULTS[name].copy()
+    # As in JsonSchemaObject.__init__.
+    values["extras"] = {k: v for k, v in raw.items() if k not in EXCLUDE_FIELD_KEYS}
+    # What model_construct does, without its per-field default lookups, which cost more than validation.
+    obj = JsonSchemaObject.__new__(JsonSchemaObject)
+    object.__setattr__(obj, "__dict__", {**_SCHEMA_OBJECT_DEFAULTS, **values})
+    object.__setattr__(obj, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
+
+
 class JsonSchemaParser(Parser):
     SCHEMA_PATHS: ClassVar[List[str]] = ["#/definitions", "#/$defs"]
     SCHEMA_OBJECT_TYPE: ClassVar[Type[JsonSchemaObject]] = JsonSchemaObject
@@ -409,6 +554,8 @@ class JsonSchemaParser(Parser):
         custom_formatters_kwargs: Optional[Dict[str, Any]] = None,
         use_pendulum: bool = False,
         http_query_parameters: Optional[Sequence[Tuple[str, str]]] = None,
+        reference_loader: Optional[ReferenceLoader] = None,
+        remote_object_cache_size: Optional[int] = REMOTE_CACHE_SIZE,
     ) -> None:
         super().__init__(
             source=source,
@@ -476,9 +623,13 @@ class JsonSchemaParser(Parser):
             custom_formatters_kwargs=custom_formatters_kwargs,
             use_pendulum=use_pendulum,
             http_query_parameters=http_query_parameters,
+            reference_loader=reference_loader,
         )
 
-        self.remote_object_cache: DefaultPutDict[str, Dict[str, Any]] = DefaultPutDict()
+        # ``remote_object_cache_size=None`` keeps every decoded remote document.
+        self.remote_object_cache: DefaultPutDict[str, Dict[str, Any]] = (
+            DefaultPutDict() if remote_object_cache_size is None else LRUPutDict(remote_object_cache_size)
+        )
         self.raw_obj: Dict[Any, Any] = {}
         self._root_id: Optional[str] = None
         self._root_id_base_path: Optional[str] = None
@@ -1391,7 +1542,7 @@ class JsonSchemaParser(Parser):
     def _get_ref_body_from_url(self, ref: str) -> Dict[Any, Any]:
         
         return self.remote_object_cache.get_or_put(
-            ref, default_factory=lambda key: load_yaml(self._get_text_from_url(key))
+            ref, default_factory=lambda key: load_text(self._get_text_from_url(key), Path(urlparse(key).path).suffix)
         )
 
     def _get_ref_body_from_remote(self, resolved_ref: str) -> Dict[Any, Any]:
@@ -1401,7 +1552,7 @@ class JsonSchemaParser(Parser):
 
         return self.remote_object_cache.get_or_put(
             str(full_path),
-            default_factory=lambda _: None,
+            default_factory=lambda _: load_file(full_path, self.encoding),
         )
 
     def resolve_ref(self, object_ref: str) -> Reference:
@@ -1493,6 +1644,30 @@ class JsonSchemaParser(Parser):
                 if isinstance(property_value, JsonSchemaObject):
                     self.parse_id(property_value, path)
 
+    def parse_raw_id(self, raw: Any, path: List[str]) -> None:
+        """Register the ``$id`` values of a raw subschema like :meth:`parse_id`, without validating it.
+
+        Walking the plain dict is much cheaper than building a ``JsonSchemaObject`` for a schema
+        that is only searched for ids and validated again when its models are parsed.
+        """
+        if not isinstance(raw, dict):
+            return
+        id_ = raw.get("$id")
+        if id_ and isinstance(id_, str):
+            self.model_resolver.add_id(id_, path)
+        items = raw.get("items")
+        for item in items if isinstance(items, list) else [items]:
+            self.parse_raw_id(item, path)
+        self.parse_raw_id(raw.get("additionalProperties"), path)
+        for keyword in ("patternProperties", "anyOf", "allOf", "properties"):
+            values = raw.get(keyword)
+            if isinstance(values, dict):
+                values = values.values()
+            elif not isinstance(values, list):
+                continue
+            for value in values:
+                self.parse_raw_id(value, path)
+
     @contextmanager
     def root_id_context(self, root_raw: Dict[str, Any]) -> Generator[None, None, None]:
         root_id: Optional[str] = root_raw.get("$id")
@@ -1507,7 +1682,13 @@ class JsonSchemaParser(Parser):
         raw: Dict[str, Any],
         path: List[str],
     ) -> None:
-        self.parse_obj(name, self.SCHEMA_OBJECT_TYPE.parse_obj(raw), path)
+        self.parse_obj(name, self.get_schema_object(raw), path)
+
+    def get_schema_object(self, raw: Dict[str, Any]) -> JsonSchemaObject:
+        """Turn a raw schema into a ``SCHEMA_OBJECT_TYPE``, through :func:`build_schema_object` if it is the default."""
+        if self.SCHEMA_OBJECT_TYPE is JsonSchemaObject:
+            return build_schema_object(raw)
+        return self.SCHEMA_OBJECT_TYPE.parse_obj(raw)
 
     def parse_obj(
         self,
@@ -1557,7 +1738,7 @@ class JsonSchemaParser(Parser):
 
     def parse_raw(self) -> None:
         for source, path_parts in self._get_context_source_path_parts():
-            self.raw_obj = load_yaml(source.text)
+            self.raw_obj = source.load()
             if self.custom_class_name_generator:
                 obj_name = self.raw_obj.get("title", "Model")
             else:
@@ -1592,7 +1773,7 @@ class JsonSchemaParser(Parser):
                     if self.model_resolver.add_ref(reserved_ref, resolved=True).loaded:
                         continue
                     
-                    self.raw_obj = load_yaml(source.text)
+                    self.raw_obj = source.load()
                     self.parse_json_pointer(self.raw_obj, reserved_ref, path_parts)
 
         if model_count != len(self.results):
@@ -1627,7 +1808,7 @@ class JsonSchemaParser(Parser):
                 
                 raw.pop("self", None)
                 # parse $id before parsing $ref
-                root_obj = self.SCHEMA_OBJECT_TYPE.parse_obj(raw)
+                root_obj = self.get_schema_object(raw)
                 self.parse_id(root_obj, path_parts)
                 definitions: Optional[Dict[Any, Any]] = None
                 for schema_path, split_schema_path in self.schema_paths:
@@ -1641,13 +1822,12 @@ class JsonSchemaParser(Parser):
                     definitions = {}
 
                 for key, model in definitions.items():
-                    obj = self.SCHEMA_OBJECT_TYPE.parse_obj(model)
-                    self.parse_id(obj, [*path_parts, schema_path, key])
+                    self.parse_raw_id(model, [*path_parts, schema_path, key])
 
                 if object_paths:
                     models = get_model_by_path(raw, object_paths)
                     model_name = object_paths[-1]
-                    self.parse_obj(model_name, self.SCHEMA_OBJECT_TYPE.parse_obj(models), path)
+                    self.parse_obj(model_name, self.get_schema_object(models), path)
                 else:
                     self.parse_obj(obj_name, root_obj, path_parts or ["#"])
                 for key, model in definitions.items():
@@ -1667,7 +1847,7 @@ class JsonSchemaParser(Parser):
                         path = reserved_path.split("/")
                         models = get_model_by_path(raw, object_paths)
                         model_name = object_paths[-1]
-                        self.parse_obj(model_name, self.SCHEMA_OBJECT_TYPE.parse_obj(models), path)
+                        self.parse_obj(model_name, self.get_schema_object(models), path)
                     previous_reserved_refs = reserved_refs
                     reserved_refs = set(self.reserved_refs.get(key) or [])
                     if previous_reserved_refs == reserved_refs:
@@ -270,6 +270,12 @@ def get_relative_path(base_path: PurePath, target_path: PurePath) -> PurePath:
     return Path(*[".." for _ in range(parent_count)], *children)
 
 
+class PathCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
 class ModelResolver:
     def __init__(
         self,
@@ -318,6 +324,35 @@ class ModelResolver:
         self.class_name_generator = custom_class_name_generator or self.default_class_name_generator
         self._base_path: Path = base_path or Path.cwd()
         self._current_base_path: Optional[Path] = self._base_path
+        # Results of filesystem queries, so each distinct path touches the filesystem once per run.
+        self._path_cache: Dict[Tuple[str, Path], Any] = {}
+        self._path_cache_hits: int = 0
+        self._path_cache_misses: int = 0
+
+    def _query_path(self, query: str, path: Path) -> Any:
+        key = (query, path)
+        if key in self._path_cache:
+            self._path_cache_hits += 1
+            return self._path_cache[key]
+        self._path_cache_misses += 1
+        result = self._path_cache[key] = getattr(path, query)()
+        return result
+
+    def _resolve_path(self, path: Path) -> Path:
+        return self._query_path("resolve", path)
+
+    def _path_exists(self, path: Path) -> bool:
+        return self._query_path("exists", path)
+
+    def _is_file(self, path: Path) -> bool:
+        return self._query_path("is_file", path)
+
+    def path_cache_info(self) -> PathCacheInfo:
+        return PathCacheInfo(self._path_cache_hits, self._path_cache_misses, len(self._path_cache))
+
+    def clear_path_cache(self) -> None:
+        self._path_cache.clear()
+        self._path_cache_hits = self._path_cache_misses = 0
 
     @property
     def current_base_path(self) -> Optional[Path]:
@@ -336,7 +371,7 @@ class ModelResolver:
     @contextmanager
     def current_base_path_context(self, base_path: Optional[Path]) -> Generator[None, None, None]:
         if base_path:
-            base_path = (self._base_path / base_path).resolve()
+            base_path = self._resolve_path(self._base_path / base_path)
         with context_variable(self.set_current_base_path, self.current_base_path, base_path):
             yield
 
@@ -390,7 +425,7 @@ class ModelResolver:
             return f"{"/".join(self.current_root)}#"
         if self.current_base_path and not self.base_url and joined_path[0] != "#" and not is_url(joined_path):
             file_path, *object_part = joined_path.split("#", 1)
-            resolved_file_path = Path(self.current_base_path, file_path).resolve()
+            resolved_file_path = self._resolve_path(Path(self.current_base_path, file_path))
             joined_path = get_relative_path(self._base_path, resolved_file_path).as_posix()
             if object_part:
                 joined_path += f"#{object_part[0]}"
@@ -406,7 +441,7 @@ class ModelResolver:
             file_path = "".join(joined_path[:delimiter])
             ref = f"{"".join(joined_path[:delimiter])}#{"".join(joined_path[delimiter + 1 :])}"
             if self.root_id_base_path and not (
-                is_url(joined_path) or Path(self._base_path, file_path).is_file()
+                is_url(joined_path) or self._is_file(Path(self._base_path, file_path))
             ):
                 ref = f"{self.root_id_base_path}/{ref}"
 
@@ -435,8 +470,8 @@ class ModelResolver:
                     Path(root_id_url.path).parent, target_url_path.parent
                 )
                 target_path = self.current_base_path / relative_target_base / target_url_path.name
-                if target_path.exists():
-                    return f"{target_path.resolve().relative_to(self._base_path)}#{path_part}"
+                if self._path_exists(target_path):
+                    return f"{self._resolve_path(target_path).relative_to(self._base_path)}#{path_part}"
 
         return ref
 
@@ -444,7 +479,7 @@ class ModelResolver:
         if is_url(ref) or not self.current_base_path:
             return False
         file_part, *_ = ref.split("#", 1)
-        absolute_path = Path(self._base_path, file_part).resolve().as_posix()
+        absolute_path = self._resolve_path(Path(self._base_path, file_part)).as_posix()
         if self.is_external_root_ref(ref):
             return absolute_path in self.after_load_files
         elif self.is_external_ref(ref):
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ReferenceLoader:
+    """Load the text of remote ``$ref`` documents.
+
+    A URL is looked up in the mirror directory first, where ``https://example.com/a/b.json`` is
+    ``<mirror_dir>/example.com/a/b.json``, then in the store directory, and only then fetched. Fetched
+    documents are kept in the store under the hash of their content, with a second entry mapping the
+    URL to that hash, so repeated runs do not download them again. With ``offline`` set, URLs that
+    are in neither directory are an error instead of being fetched.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], str] | None = None,
+        *,
+        store_dir: Path | None = None,
+        mirror_dir: Path | None = None,
+        offline: bool = False,
+    ) -> None:
+        self.fetch = fetch
+        self.store_dir = store_dir
+        self.mirror_dir = mirror_dir
+        self.offline = offline
+
+    def load_text(self, url: str, fetch: Callable[[str], str] | None = None) -> str:
+        """Load a document, using ``fetch`` to download it if the loader has no fetcher of its own."""
+        if self.mirror_dir is not None:
+            mirrored = self.mirror_path(url)
+            if mirrored.is_file():
+                return mirrored.read_text(encoding="utf-8")
+        if self.store_dir is not None:
+            stored = self._read_store(url)
+            if stored is not None:
+                return stored
+        fetch = self.fetch or fetch
+        if self.offline or fetch is None:
+            raise FileNotFoundError(f"{url} is not in the mirror or store and cannot be fetched")
+        text = fetch(url)
+        if self.store_dir is not None:
+            self._write_store(url, text)
+        return text
+
+    def mirror_path(self, url: str) -> Path:
+        assert self.mirror_dir is not None
+        parsed = urlparse(url)
+        return self.mirror_dir.joinpath(parsed.netloc, *[p for p in parsed.path.split("/") if p not in ("", ".", "..")])
+
+    def _object_path(self, digest: str) -> Path:
+        assert self.store_dir is not None
+        return self.store_dir / "objects" / digest[:2] / digest[2:]
+
+    def _url_path(self, url: str) -> Path:
+        assert self.store_dir is not None
+        return self.store_dir / "urls" / _sha256(url)
+
+    def _read_store(self, url: str) -> str | None:
+        try:
+            digest = self._url_path(url).read_text(encoding="utf-8").strip()
+            text = self._object_path(digest).read_text(encoding="utf-8")
+        except OSError:
+            return None
+        # A damaged object is fetched again rather than trusted.
+        return text if _sha256(text) == digest else None
+
+    def _write_store(self, url: str, text: str) -> None:
+        digest = _sha256(text)
+        self._write_atomic(self._object_path(digest), text)
+        self._write_atomic(self._url_path(url), digest)
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(text)
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from datamodel_code_generator import InputFileType, generate
+
+SCHEMAS = {
+    "pet.json": {
+        "title": "Pet",
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "owner": {"$ref": "owner.json"},
+            "tag": {"$ref": "nested/tag.json"},
+        },
+        "required": ["name"],
+    },
+    "owner.json": {
+        "title": "Owner",
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "address": {"type": "object", "properties": {"city": {"type": "string"}}},
+        },
+    },
+    "nested/tag.json": {"title": "Tag", "type": "object", "properties": {"label": {"type": "string", "maxLength": 10}}},
+}
+
+
+@pytest.fixture
+def schemas(tmp_path: Path) -> Path:
+    directory = tmp_path / "schemas"
+    for name, schema in SCHEMAS.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(schema))
+    return directory
+
+
+def run(schemas: Path, output: Path, **options: Any) -> Dict[str, str]:
+    generate(schemas, input_file_type=InputFileType.JsonSchema, output=output, disable_timestamp=True, **options)
+    return {p.relative_to(output).as_posix(): p.read_text() for p in sorted(output.rglob("*.py"))}
+
+
+@pytest.mark.parametrize("render_workers", [None, 2])
+def test_streamed_output_matches_collected_output(schemas: Path, tmp_path: Path, render_workers: Any) -> None:
+    expected = run(schemas, tmp_path / "collected")
+    assert sorted(expected) == ["__init__.py", "nested/__init__.py", "nested/tag.py", "owner.py", "pet.py"]
+    streamed = run(schemas, tmp_path / "streamed", stream_output=True, render_workers=render_workers)
+    assert streamed == expected
+
+
+def test_single_module_is_written_to_the_output_file(schemas: Path, tmp_path: Path) -> None:
+    output = tmp_path / "tag.py"
+    source = schemas / "nested" / "tag.json"
+    generate(source, input_file_type=InputFileType.JsonSchema, output=output, stream_output=True)
+    assert "class Tag(BaseModel):" in output.read_text()
+
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+
+from datamodel_code_generator import loader
+from datamodel_code_generator.loader import is_json, load_file, load_text
+from datamodel_code_generator.parser.base import Source
+from datamodel_code_generator.parser.jsonschema import JsonSchemaParser
+
+JSON = '{"title": "Pet", "default": 1e3, "created": "2020-01-01"}'
+
+
+@pytest.mark.parametrize(
+    ("head", "suffix", "expected"),
+    [
+        ("a: 1", ".json", True),
+        ("{}", ".YAML", False),
+        ("\ufeff  [1]", "", True),
+        (b"\n{}", ".txt", True),
+        ("a: {}", "", False),
+    ],
+)
+def test_format_detection(head, suffix, expected):
+    assert is_json(head, suffix) is expected
+
+
+def test_json_and_yaml_scalars():
+    assert load_text(JSON) == {"title": "Pet", "default": 1000.0, "created": "2020-01-01"}
+    # YAML documents keep YAML's rules: the exponent without a dot is a string, timestamps stay strings.
+    assert load_text(JSON, ".yaml") == {"title": "Pet", "default": "1e3", "created": "2020-01-01"}
+    assert load_text("default: 1e3\ncreated: 2020-01-01") == {"default": "1e3", "created": "2020-01-01"}
+
+
+def test_invalid_json_falls_back_to_yaml():
+    assert load_text("{title: Pet}", ".json") == {"title": "Pet"}
+
+
+@pytest.mark.parametrize("threshold", [loader.MMAP_THRESHOLD, 0])
+@pytest.mark.parametrize(
+    ("name", "text", "expected"),
+    [
+        ("pet.json", JSON, {"title": "Pet", "default": 1000.0, "created": "2020-01-01"}),
+        ("pet.yaml", "title: Pet\ndefault: 1e3\n", {"title": "Pet", "default": "1e3"}),
+        ("pet.json", "{title: Pet}", {"title": "Pet"}),
+        ("pet", JSON, {"title": "Pet", "default": 1000.0, "created": "2020-01-01"}),
+    ],
+)
+def test_load_file_matches_load_text(tmp_path: Path, monkeypatch, threshold, name, text, expected):
+    # A threshold of 0 maps every file into memory.
+    monkeypatch.setattr(loader, "MMAP_THRESHOLD", threshold)
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    assert load_file(path) == expected == load_text(text, path.suffix)
+
+
+def test_load_file_decodes_other_encodings(tmp_path: Path):
+    path = tmp_path / "pet.json"
+    path.write_text('{"title": "Café"}', encoding="latin-1")
+    assert load_file(path, "latin-1") == {"title": "Café"}
+
+
+def test_file_sources_are_read_only_when_needed(tmp_path: Path, monkeypatch):
+    path = tmp_path / "pet.json"
+    path.write_text(JSON, encoding="utf-8")
+    source = Source.from_path(path, tmp_path, "utf-8")
+    assert source.path == Path("pet.json")
+    assert source.content is None
+    loaded = []
+    monkeypatch.setattr("datamodel_code_generator.parser.base.load_file", lambda *args: loaded.append(args) or {})
+    assert source.load() == {}
+    assert loaded == [(path, "utf-8")]
+    assert source.text == JSON
+    assert Source(path=Path(), text=JSON).load()["default"] == 1000.0
+
+
+def test_parser_loads_file_sources_through_load_file(tmp_path: Path, monkeypatch):
+    path = tmp_path / "pet.json"
+    path.write_text('{"title": "Pet", "type": "object", "properties": {"weight": {"type": "number"}}}')
+    loaded = []
+
+    def spy(*args):
+        loaded.append(args[0])
+        return load_file(*args)
+
+    monkeypatch.setattr("datamodel_code_generator.parser.base.load_file", spy)
+    assert "class Pet(BaseModel):" in JsonSchemaParser(path).parse()
+    assert loaded == [path]
@@ -0,0 +1,117 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from datamodel_code_generator import DataModelType, PythonVersion
+from datamodel_code_generator.manifest import Manifest, options_hash, template_files
+from datamodel_code_generator.parser.base import ModuleInfo, Source
+
+
+def class_name(name: str) -> str:
+    return name.title()
+
+
+def manifest(inputs: dict, **modules: ModuleInfo) -> Manifest:
+    sources = [Source(path=Path(path), text=text) for path, text in inputs.items()]
+    result = Manifest.from_sources("options", sources)
+    result.modules = {name.replace("__", "/") + ".py": module for name, module in modules.items()}
+    return result
+
+
+MODULES = {
+    "pet": ModuleInfo(sources=["pet.json"], dependencies=["owner.py"], class_names=["Pet"]),
+    "owner": ModuleInfo(sources=["owner.json"], class_names=["Owner"]),
+    "tag": ModuleInfo(sources=["tag.json"], class_names=["Tag"]),
+}
+INPUTS = {"pet.json": "{}", "owner.json": "{}", "tag.json": "{}"}
+
+
+def test_unchanged_inputs_have_no_stale_modules():
+    previous = manifest(INPUTS, **MODULES)
+    assert manifest(INPUTS, **MODULES).stale_modules(previous) == set()
+    assert manifest(INPUTS, **MODULES).is_unchanged(previous)
+
+
+def test_changed_input_makes_its_module_and_dependents_stale():
+    previous = manifest(INPUTS, **MODULES)
+    current = manifest({**INPUTS, "owner.json": '{"title": "Owner"}'}, **MODULES)
+    assert current.stale_modules(previous) == {"owner.py", "pet.py"}
+    current = manifest({**INPUTS, "pet.json": '{"title": "Pet"}'}, **MODULES)
+    assert current.stale_modules(previous) == {"pet.py"}
+
+
+def test_changed_class_names_make_dependents_stale():
+    previous = manifest(INPUTS, **MODULES)
+    owner = ModuleInfo(sources=["owner.json"], class_names=["Owner", "Address"])
+    assert manifest(INPUTS, **{**MODULES, "owner": owner}).stale_modules(previous) == {"owner.py", "pet.py"}
+
+
+def test_removed_input_and_sourceless_modules():
+    previous = manifest(INPUTS, init=ModuleInfo(), **MODULES)
+    current = manifest({"pet.json": "{}", "owner.json": "{}"}, init=ModuleInfo(), pet=MODULES["pet"])
+    # The module built from text input has no source file, so any changed input makes it stale.
+    assert current.stale_modules(previous) == {"init.py"}
+
+
+def test_other_options_or_no_manifest_make_every_module_stale():
+    current = manifest(INPUTS, **MODULES)
+    other = manifest(INPUTS, **MODULES).model_copy(update={"options": "other"})
+    assert current.stale_modules(other) == set(current.modules)
+    assert current.stale_modules(None) == set(current.modules)
+
+
+def test_manifest_round_trips(tmp_path: Path):
+    path = tmp_path / "manifest.json"
+    current = manifest(INPUTS, **MODULES)
+    current.dump(path)
+    assert Manifest.load(path) == current
+    path.write_text("{}")
+    assert Manifest.load(path) is None
+    assert current.module_paths(tmp_path)["pet.py"] == tmp_path / "pet.py"
+
+
+OPTIONS = {
+    "output_model_type": DataModelType.PydanticV2BaseModel,
+    "target_python_version": PythonVersion.PY_311,
+    "custom_class_name_generator": class_name,
+    "aliases": {"b": "B", "a": "A"},
+    "custom_template_dir": Path("templates"),
+    "field_extra_keys": {"x-b", "x-a"},
+}
+
+
+def test_options_hash_is_stable_across_processes():
+    code = (
+        "import sys; sys.path.insert(0, 'tests'); from test_manifest import OPTIONS;"
+        "from datamodel_code_generator.manifest import options_hash; print(options_hash(OPTIONS))"
+    )
+    cwd = Path(__file__).parents[1]
+    other = subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True, check=True)
+    assert other.stdout.strip() == options_hash(OPTIONS)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"aliases": {"a": "A"}},
+        {"custom_class_name_generator": str.title},
+        {"target_python_version": PythonVersion.PY_312},
+    ],
+)
+def test_options_hash_changes_with_options(change: dict):
+    assert options_hash({**OPTIONS, **change}) != options_hash(OPTIONS)
+
+
+def test_options_hash_covers_template_contents(tmp_path: Path):
+    template = tmp_path / "pydantic_v2" / "BaseModel.jinja2"
+    template.parent.mkdir()
+    template.write_text("class {{ class_name }}: ...")
+    files = template_files(tmp_path)
+    assert template in files
+    assert len(files) > 1
+    before = options_hash(OPTIONS, files)
+    assert options_hash(OPTIONS, template_files(tmp_path)) == before
+    template.write_text("class {{ class_name }}:\n    pass")
+    assert options_hash(OPTIONS, template_files(tmp_path)) != before
@@ -0,0 +1,50 @@
+from typing import List
+
+from datamodel_code_generator.model.pydantic_v2 import BaseModel, DataModelField
+from datamodel_code_generator.parser.base import get_model_fingerprint
+from datamodel_code_generator.parser.jsonschema import JsonSchemaParser
+from datamodel_code_generator.reference import Reference
+from datamodel_code_generator.types import DataType
+
+
+def pet(path: str, *fields: str) -> BaseModel:
+    return BaseModel(
+        reference=Reference(path=path, name="Pet"),
+        fields=[DataModelField(name=name, data_type=DataType(type="str"), required=True) for name in fields],
+    )
+
+
+def delete_duplicates(models: List[BaseModel]) -> List[BaseModel]:
+    parser = JsonSchemaParser("{}")
+    parser._Parser__delete_duplicate_models(models)
+    return models
+
+
+def test_fingerprint_matches_rendered_output():
+    variants = [
+        {"name": "name", "data_type": DataType(type="str"), "required": True},
+        {"name": "name", "data_type": DataType(type="str"), "required": False},
+        {"name": "name", "data_type": DataType(type="int"), "required": True},
+        {"name": "name", "data_type": DataType(type="str"), "required": False, "default": "Rex"},
+        {"name": "name", "data_type": DataType(type="str"), "required": True, "alias": "Name"},
+        {"name": "title", "data_type": DataType(type="str"), "required": True},
+    ]
+    models = [
+        BaseModel(reference=Reference(path=f"{i}.json#/Pet", name="Pet"), fields=[DataModelField(**variant)])
+        for i, variant in enumerate(variants * 2)
+    ]
+    for first in models:
+        for second in models:
+            same_key = get_model_fingerprint(first) == get_model_fingerprint(second)
+            assert same_key == (first.render() == second.render())
+    assert get_model_fingerprint(models[0], "M") != get_model_fingerprint(models[0])
+
+
+def test_duplicates_of_the_last_model_with_a_class_name_are_removed():
+    first, duplicate = pet("a.json#/Pet", "name"), pet("b.json#/Pet", "name")
+    assert delete_duplicates([first, duplicate]) == [first]
+
+
+def test_earlier_models_with_the_same_class_name_are_not_merged():
+    first, other, again = pet("a.json#/Pet", "name"), pet("b.json#/Pet", "kind"), pet("c.json#/Pet", "name")
+    assert delete_duplicates([first, other, again]) == [first, other, again]
@@ -0,0 +1,57 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from datamodel_code_generator.reference import ModelResolver, PathCacheInfo
+
+
+@pytest.fixture
+def queries(monkeypatch) -> List[str]:
+    """Record the filesystem queries that reach ``Path``."""
+    calls: List[str] = []
+    for name in ("resolve", "exists", "is_file"):
+        original = getattr(Path, name)
+
+        def query(self, *args, _name=name, _original=original, **kwargs):
+            calls.append(_name)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, name, query)
+    return calls
+
+
+def test_path_queries_are_cached(tmp_path: Path, queries: List[str]):
+    (tmp_path / "pet.json").write_text("{}")
+    resolver = ModelResolver(base_path=tmp_path)
+    assert resolver.path_cache_info() == PathCacheInfo(0, 0, 0)
+    for _ in range(3):
+        assert resolver._resolve_path(tmp_path / "nested" / ".." / "pet.json") == tmp_path / "pet.json"
+        assert resolver._path_exists(tmp_path / "pet.json")
+        assert resolver._is_file(tmp_path / "pet.json")
+        assert not resolver._is_file(tmp_path / "missing.json")
+    assert queries == ["resolve", "exists", "is_file", "is_file"]
+    assert resolver.path_cache_info() == PathCacheInfo(hits=8, misses=4, currsize=4)
+
+
+def test_references_to_one_file_query_it_once(tmp_path: Path, queries: List[str]):
+    (tmp_path / "pet.json").write_text("{}")
+    resolver = ModelResolver(base_path=tmp_path)
+    queries.clear()
+    refs = [resolver.resolve_ref(f"pet.json#/definitions/{name}") for name in ("Pet", "Tag", "Owner")]
+    assert refs == ["pet.json#/definitions/Pet", "pet.json#/definitions/Tag", "pet.json#/definitions/Owner"]
+    assert queries == ["resolve"]
+    assert resolver.path_cache_info() == PathCacheInfo(hits=2, misses=1, currsize=1)
+
+
+def test_clear_path_cache(tmp_path: Path, queries: List[str]):
+    resolver = ModelResolver(base_path=tmp_path)
+    resolver._path_exists(tmp_path / "pet.json")
+    resolver._path_exists(tmp_path / "pet.json")
+    resolver.clear_path_cache()
+    assert resolver.path_cache_info() == PathCacheInfo(0, 0, 0)
+    # The file is created after the first query; a cleared cache sees it.
+    (tmp_path / "pet.json").write_text("{}")
+    assert resolver._path_exists(tmp_path / "pet.json")
+    assert queries == ["exists", "exists"]
+    assert resolver.path_cache_info() == PathCacheInfo(hits=0, misses=1, currsize=1)
@@ -0,0 +1,73 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from datamodel_code_generator.parser import REMOTE_CACHE_SIZE, LRUPutDict
+from datamodel_code_generator.parser.jsonschema import JsonSchemaParser
+from datamodel_code_generator.remote import ReferenceLoader
+
+URL = "https://example.com/schemas/pet.json"
+TEXT = '{"type": "object"}'
+
+
+def test_lru_put_dict_evicts_least_recently_used():
+    cache: LRUPutDict[str, str] = LRUPutDict(2)
+    assert cache.get_or_put("a", default_factory=str.upper) == "A"
+    cache.get_or_put("b", default="B")
+    # Reading "a" makes "b" the least recently used entry.
+    assert cache.get_or_put("a", default_factory=pytest.fail) == "A"
+    cache.get_or_put("c", default_factory=str.upper)
+    assert list(cache) == ["a", "c"]
+    with pytest.raises(ValueError, match="Not found default"):
+        cache.get_or_put("d")
+
+
+def test_parser_caches_are_bounded_by_default():
+    parser = JsonSchemaParser("{}")
+    assert isinstance(parser.remote_text_cache, LRUPutDict)
+    assert parser.remote_text_cache.maxsize == REMOTE_CACHE_SIZE
+    assert isinstance(parser.remote_object_cache, LRUPutDict)
+    assert parser.remote_object_cache.maxsize == REMOTE_CACHE_SIZE
+    assert not isinstance(JsonSchemaParser("{}", remote_object_cache_size=None).remote_object_cache, LRUPutDict)
+
+
+def test_loader_prefers_the_mirror(tmp_path: Path):
+    mirrored = tmp_path / "example.com" / "schemas" / "pet.json"
+    mirrored.parent.mkdir(parents=True)
+    mirrored.write_text(TEXT)
+    loader = ReferenceLoader(pytest.fail, mirror_dir=tmp_path)
+    assert loader.mirror_path("https://example.com/../schemas/./pet.json") == mirrored
+    assert loader.load_text(URL) == TEXT
+
+
+def test_loader_stores_fetched_documents_by_content(tmp_path: Path):
+    fetched: List[str] = []
+
+    def fetch(url: str) -> str:
+        fetched.append(url)
+        return TEXT
+
+    ReferenceLoader(fetch, store_dir=tmp_path).load_text(URL)
+    ReferenceLoader(fetch, store_dir=tmp_path).load_text("https://mirror.example.com/pet.json")
+    assert len(list((tmp_path / "objects").rglob("*"))) == 2  # One directory and one object.
+    assert len(list((tmp_path / "urls").iterdir())) == 2
+    assert ReferenceLoader(pytest.fail, store_dir=tmp_path).load_text(URL) == TEXT
+    assert fetched == [URL, "https://mirror.example.com/pet.json"]
+
+
+def test_loader_fetches_damaged_objects_again(tmp_path: Path):
+    ReferenceLoader(lambda _: TEXT, store_dir=tmp_path).load_text(URL)
+    (stored,) = (p for p in (tmp_path / "objects").rglob("*") if p.is_file())
+    stored.write_text("{}")
+    assert ReferenceLoader(lambda _: TEXT, store_dir=tmp_path).load_text(URL) == TEXT
+    assert stored.read_text() == TEXT
+
+
+def test_offline_loader_raises_on_a_miss(tmp_path: Path):
+    loader = ReferenceLoader(pytest.fail, store_dir=tmp_path, mirror_dir=tmp_path, offline=True)
+    with pytest.raises(FileNotFoundError, match="cannot be fetched"):
+        loader.load_text(URL)
+    with pytest.raises(FileNotFoundError):
+        ReferenceLoader().load_text(URL)
+    assert ReferenceLoader().load_text(URL, fetch=lambda _: TEXT) == TEXT
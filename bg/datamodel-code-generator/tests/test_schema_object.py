@@ -0,0 +1,99 @@
+import copy
+import json
+from typing import Any, Dict
+
+import pytest
+
+from datamodel_code_generator.parser.jsonschema import JsonSchemaObject, JsonSchemaParser, build_schema_object
+
+SCHEMAS = [
+    {},
+    {"type": "string", "maxLength": 5, "pattern": "^a", "format": "email", "description": "An address."},
+    {"type": ["integer", "null"], "minimum": 0, "maximum": 1.5, "default": 1, "x-unit": "m"},
+    {"type": "object", "properties": {"a": {"type": "string"}, "b": True}, "required": ["a"], "title": "T"},
+    {"type": "object", "additionalProperties": {"type": "integer"}, "readOnly": True, "nullable": True},
+    {"type": "array", "items": {"$ref": "#/definitions/Pet"}, "uniqueItems": True, "minItems": 1},
+    {"enum": ["a", "b"], "examples": ["a"], "const": "a"},
+    {"$ref": "pet.json#Pet"},
+    {"$ref": "#/"},
+    # Nodes that need validation, alone and below simple ones.
+    {"type": "array", "items": {}},
+    {"type": "array", "items": [{"type": "string"}]},
+    {"type": "integer", "minimum": 1, "exclusiveMinimum": True, "maximum": 5, "exclusiveMaximum": False},
+    {"type": "number", "multipleOf": 2},
+    {"type": "string", "maxLength": True},
+    {"type": "object", "properties": {"pet": {"allOf": [{"$ref": "#/definitions/Pet"}], "description": "A pet."}}},
+    {"oneOf": [{"type": "string"}, {"type": "object", "properties": {"a": {"type": "string"}}}]},
+    {"$id": "https://example.com/pet.json", "type": "object", "x-enum-varnames": ["A"], "discriminator": "kind"},
+]
+
+
+def assert_same_object(built: Any, validated: Any) -> None:
+    assert type(built) is type(validated)
+    if not isinstance(validated, JsonSchemaObject):
+        assert built == validated
+        return
+    assert built.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+    assert built.model_fields_set == validated.model_fields_set
+    assert built.extras == validated.extras
+    for name in ("items", "additionalProperties"):
+        assert_same_object(getattr(built, name), getattr(validated, name))
+    assert (built.properties or {}).keys() == (validated.properties or {}).keys()
+    for name, property_ in (validated.properties or {}).items():
+        assert_same_object(built.properties[name], property_)
+
+
+@pytest.mark.parametrize("raw", SCHEMAS)
+def test_built_objects_match_validated_ones(raw: Dict[str, Any]):
+    # The before-validators rewrite the input, so each side gets its own copy.
+    assert_same_object(build_schema_object(copy.deepcopy(raw)), JsonSchemaObject.parse_obj(copy.deepcopy(raw)))
+
+
+def test_built_objects_do_not_share_defaults():
+    first, second = build_schema_object({"type": "object"}), build_schema_object({"type": "object"})
+    first.required.append("a")
+    assert second.required == []
+    assert JsonSchemaObject.parse_obj({}).required == []
+
+
+class ValidatedSchemaObject(JsonSchemaObject):
+    pass
+
+
+class ValidatingParser(JsonSchemaParser):
+    SCHEMA_OBJECT_TYPE = ValidatedSchemaObject
+
+
+SCHEMA = {
+    "title": "Shop",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "maxLength": 20, "description": "The name."},
+        "pets": {"type": "array", "items": {"$ref": "#/definitions/Pet"}},
+        "owner": {"$ref": "#/definitions/Owner"},
+        "rating": {"type": "number", "minimum": 0, "exclusiveMaximum": 5},
+        "tags": {"type": "object", "additionalProperties": {"type": "string"}},
+    },
+    "required": ["name"],
+    "definitions": {
+        "Pet": {
+            "type": "object",
+            "properties": {
+                "kind": {"enum": ["cat", "dog"], "default": "cat"},
+                "age": {"type": ["integer", "null"], "minimum": 0},
+                "owner": {"allOf": [{"$ref": "#/definitions/Owner"}], "description": "Who owns it."},
+            },
+        },
+        "Owner": {
+            "type": "object",
+            "properties": {"email": {"type": "string", "format": "email"}, "x": {"const": 1, "x-extra": True}},
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def test_parse_output_is_unchanged():
+    expected = ValidatingParser(json.dumps(SCHEMA), field_constraints=True).parse()
+    assert "class Pet(BaseModel):" in expected
+    assert JsonSchemaParser(json.dumps(SCHEMA), field_constraints=True).parse() == expected
@@ -0,0 +1,86 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from datamodel_code_generator.parser.base import sort_data_models
+
+
+@dataclass
+class Reference:
+    path: str
+
+
+@dataclass
+class BaseClass:
+    reference: Optional[Reference]
+
+
+@dataclass(eq=False)
+class Model:
+    """Stand-in for a data model with the attributes the sort reads."""
+
+    path: str
+    references: List[str] = field(default_factory=list)
+    bases: List[str] = field(default_factory=list)
+
+    @property
+    def base_classes(self) -> List[BaseClass]:
+        return [BaseClass(Reference(b)) for b in self.bases]
+
+    @property
+    def reference_classes(self) -> frozenset:
+        return frozenset(self.references) | frozenset(self.bases)
+
+
+def paths(models) -> List[str]:
+    return [m.path for m in models]
+
+
+def test_models_follow_their_references():
+    models = [Model("#/a", ["#/b", "#/c"]), Model("#/b", ["#/c"]), Model("#/c"), Model("#/d")]
+    after_cycle, ordered, require_update = sort_data_models(models)
+    assert list(ordered) == ["#/c", "#/d", "#/b", "#/a"]
+    assert after_cycle == []
+    assert require_update == []
+
+
+def test_cycles_are_kept_together_and_marked_for_update():
+    models = [
+        Model("#/user", ["#/group", "#/name"]),
+        Model("#/group", ["#/user"]),
+        Model("#/name"),
+        Model("#/admin", [], ["#/user"]),
+    ]
+    after_cycle, ordered, require_update = sort_data_models(models)
+    assert list(ordered) == ["#/name", "#/user", "#/group", "#/admin"]
+    assert paths(after_cycle) == ["#/user", "#/group", "#/admin"]
+    # The subclass of a cycle member is updated after the cycle as well.
+    assert require_update == ["#/user", "#/group", "#/admin"]
+
+
+def test_base_classes_come_first_within_a_cycle():
+    models = [Model("#/child", ["#/parent"], ["#/parent"]), Model("#/parent", ["#/child"])]
+    _, ordered, require_update = sort_data_models(models)
+    assert list(ordered) == ["#/parent", "#/child"]
+    assert sorted(require_update) == ["#/child", "#/parent"]
+
+
+def test_self_references_need_an_update_but_are_not_cycles():
+    models = [Model("#/node", ["#/node", "#/leaf"]), Model("#/leaf")]
+    after_cycle, ordered, require_update = sort_data_models(models)
+    assert list(ordered) == ["#/leaf", "#/node"]
+    assert after_cycle == []
+    assert require_update == ["#/node"]
+
+
+def test_long_chains_do_not_recurse():
+    count = 5000
+    models = [Model(f"#/m{i}", [f"#/m{i + 1}"] if i + 1 < count else []) for i in range(count)]
+    _, ordered, _ = sort_data_models(models)
+    assert list(ordered) == [f"#/m{i}" for i in reversed(range(count))]
+
+
+def test_unresolved_references_raise():
+    with pytest.raises(Exception, match="can not resolve classes"):
+        sort_data_models([Model("#/a", ["#/missing"])])
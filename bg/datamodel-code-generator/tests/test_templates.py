@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from datamodel_code_generator.model.base import TEMPLATE_ENVIRONMENT, get_template, set_template_cache_dir
+from datamodel_code_generator.model.pydantic_v2 import BaseModel, DataModelField
+from datamodel_code_generator.reference import Reference
+from datamodel_code_generator.types import DataType
+
+
+def model(name: str) -> BaseModel:
+    return BaseModel(
+        reference=Reference(path=f"#/definitions/{name}", name=name),
+        fields=[DataModelField(name="id", data_type=DataType(type="int"), required=True)],
+    )
+
+
+def test_templates_are_compiled_once():
+    first, second = model("First"), model("Second")
+    assert first.template is second.template
+    assert get_template(Path("pydantic_v2/BaseModel.jinja2")) is first.template
+
+
+def test_bytecode_cache_keeps_rendering_unchanged(tmp_path: Path):
+    expected = model("Pet").render()
+    try:
+        set_template_cache_dir(tmp_path)
+        assert TEMPLATE_ENVIRONMENT.bytecode_cache is not None
+        assert model("Pet").render() == expected
+        assert list(tmp_path.iterdir())
+        # A fresh environment state loads the compiled templates from the cache directory.
+        set_template_cache_dir(tmp_path)
+        assert model("Pet").render() == expected
+    finally:
+        set_template_cache_dir(None)
+    assert TEMPLATE_ENVIRONMENT.bytecode_cache is None
@@ -1,12 +1,28 @@
-from .core import DynamicModel, SchemaGenerator, SchemaParser
-from .queries import TypedQueryEngine
-from .registry import TypeRegistry
-from .types import register_custom_types
-
 __version__ = "0.1.0"
 
+# Public names and the submodules that define them. Submodules are imported on first access, so
+# that importing chiaro stays cheap for tools that only need part of it.
+_EXPORTS = {
+    "BatchResult": "core",
+    "DriftReport": "core",
+    "DynamicModel": "core",
+    "IncrementalParser": "core",
+    "ParseResult": "core",
+    "SchemaBundleParser": "core",
+    "SchemaGenerator": "core",
+    "SchemaParser": "core",
+    "TypeRegistry": "registry",
+    "TypedQueryEngine": "queries",
+    "register_custom_types": "types",
+}
+
 __all__ = [
+    "BatchResult",
+    "DriftReport",
     "DynamicModel",
+    "IncrementalParser",
+    "ParseResult",
+    "SchemaBundleParser",
     "SchemaGenerator",
     "SchemaParser",
     "TypeRegistry",
@@ -14,5 +30,35 @@ __all__ = [
     "register_custom_types",
 ]
 
-# Register custom types on import
-register_custom_types()
+# Type checkers treat this constant like typing.TYPE_CHECKING, without importing typing at runtime.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .core import (
+        BatchResult,
+        DriftReport,
+        DynamicModel,
+        IncrementalParser,
+        ParseResult,
+        SchemaBundleParser,
+        SchemaGenerator,
+        SchemaParser,
+    )
+    from .queries import TypedQueryEngine
+    from .registry import TypeRegistry
+    from .types import register_custom_types
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    import importlib
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,209 @@
+import datetime
+import uuid
+from types import GenericAlias
+from typing import Annotated, Any, Literal, Union
+
+from pydantic import BaseModel, Field, create_model
+from pydantic_core import CoreSchema, SchemaValidator, core_schema
+
+from . import definitions as d
+from .definitions import ModelDef, SchemaDefinition, TypeDef
+
+SCALAR_TYPES: dict[str, Any] = {
+    d.ANY: Any,
+    d.STRING: str,
+    d.INTEGER: int,
+    d.NUMBER: float,
+    d.BOOLEAN: bool,
+    d.NULL: None,
+    d.DATETIME: datetime.datetime,
+    d.DATE: datetime.date,
+    d.TIME: datetime.time,
+    d.UUID: uuid.UUID,
+}
+
+CORE_SCALAR_SCHEMAS: dict[str, Any] = {
+    d.ANY: core_schema.any_schema,
+    d.STRING: core_schema.str_schema,
+    d.INTEGER: core_schema.int_schema,
+    d.NUMBER: core_schema.float_schema,
+    d.BOOLEAN: core_schema.bool_schema,
+    d.NULL: core_schema.none_schema,
+    d.DATETIME: core_schema.datetime_schema,
+    d.DATE: core_schema.date_schema,
+    d.TIME: core_schema.time_schema,
+    d.UUID: core_schema.uuid_schema,
+}
+
+
+class ModelBuilder[M: BaseModel]:
+    """Build dynamic Pydantic model classes from plain-data model definitions."""
+
+    def __init__(self, base: type[M]):
+        """
+        Initialize the builder.
+
+        :param base: The base class of every built model.
+        """
+        self.base = base
+        self.namespace: dict[str, type[M]] = {}
+
+    def build(
+        self, definition: SchemaDefinition, reuse: dict[str, type[M]] | None = None
+    ) -> dict[str, type[M]]:
+        """
+        Build every model of a schema definition.
+
+        Models that take part in reference cycles are created with forward references and rebuilt
+        once all classes of the definition exist.
+
+        :param definition: The schema definition to build.
+        :param reuse: Already built classes to use for models of the same name instead of building
+            them again.
+        :return: A mapping of model names to the classes of the definition.
+        """
+        reuse = reuse or {}
+        self.namespace.update(reuse)
+        built = {m.name: reuse.get(m.name) or self.build_model(m) for m in definition.models}
+        for model in built.values():
+            if not model.__pydantic_complete__:
+                model.model_rebuild(_types_namespace=self.namespace)
+        return built
+
+    def build_model(self, model_def: ModelDef) -> type[M]:
+        """
+        Build a single model class.
+
+        :param model_def: The definition of the model.
+        :return: The built class, which is also added to the builder's namespace.
+        """
+        fields: dict[str, Any] = {}
+        for field_def in model_def.fields:
+            kwargs: dict[str, Any] = {}
+            if field_def.alias is not None:
+                kwargs["alias"] = field_def.alias
+            if field_def.description is not None:
+                kwargs["description"] = field_def.description
+            default = ... if field_def.required else field_def.default
+            fields[field_def.name] = (self.annotation(field_def.type), Field(default, **kwargs))
+        cls_kwargs: dict[str, Any] = {}
+        if model_def.extra is not None:
+            cls_kwargs["extra"] = model_def.extra
+        if any(f.alias is not None for f in model_def.fields):
+            cls_kwargs["populate_by_name"] = True
+        model = create_model(
+            model_def.name,
+            __base__=self.base,
+            __doc__=model_def.description,
+            __cls_kwargs__=cls_kwargs or None,
+            **fields,
+        )
+        self.namespace[model_def.name] = model
+        return model
+
+    def annotation(self, type_def: TypeDef) -> Any:
+        """
+        Convert a type definition into a type annotation.
+
+        :param type_def: The type definition to convert.
+        :return: A type annotation usable in a Pydantic model.
+        """
+        if type_def.kind == d.MODEL:
+            assert type_def.ref is not None, "model type without a reference"
+            # Unbuilt models are referenced by name and resolved when the model is rebuilt.
+            return self.namespace.get(type_def.ref, type_def.ref)
+        if type_def.kind == d.LITERAL:
+            annotation: Any = Literal[type_def.values]
+        # Generic aliases are built directly: type checkers take only literal types in subscripts.
+        elif type_def.kind == d.LIST:
+            annotation = GenericAlias(list, (self.annotation(type_def.args[0]),))
+        elif type_def.kind == d.TUPLE:
+            annotation = GenericAlias(tuple, tuple(self.annotation(a) for a in type_def.args))
+        elif type_def.kind == d.DICT:
+            annotation = GenericAlias(dict, (str, self.annotation(type_def.args[0])))
+        elif type_def.kind == d.UNION:
+            annotation = Union[tuple(self.annotation(a) for a in type_def.args)]  # noqa: UP007
+        else:
+            annotation = SCALAR_TYPES[type_def.kind]
+        if type_def.constraints:
+            return Annotated[annotation, Field(**dict(type_def.constraints))]
+        return annotation
+
+
+class CoreSchemaBuilder:
+    """
+    Build pydantic-core validators directly from plain-data model definitions.
+
+    This backend skips model classes altogether: each model becomes a typed-dict core schema, so
+    building is cheaper than with :class:`ModelBuilder` and validation produces plain dicts keyed
+    by the schema's property names.
+    """
+
+    def build(self, definition: SchemaDefinition, root: str | int = "#") -> CoreSchema:
+        """
+        Build the core schema of one root of a schema definition.
+
+        :param definition: The schema definition to build.
+        :param root: The key of the root to validate against.
+        :return: The core schema; models are shared definitions, so recursion is supported.
+        """
+        return core_schema.definitions_schema(
+            core_schema.definition_reference_schema(definition.roots[root]),
+            [self.model_schema(m) for m in definition.models],
+        )
+
+    def validator(self, definition: SchemaDefinition, root: str | int = "#") -> SchemaValidator:
+        """
+        Build a validator for one root of a schema definition.
+
+        :param definition: The schema definition to build.
+        :param root: The key of the root to validate against.
+        :return: The validator.
+        """
+        return SchemaValidator(self.build(definition, root))
+
+    def model_schema(self, model_def: ModelDef) -> CoreSchema:
+        """
+        Build the core schema of a single model.
+
+        Optional fields default to their default value, or ``None``, as they do on model classes.
+
+        :param model_def: The definition of the model.
+        :return: A typed-dict core schema referenced by the model's name.
+        """
+        fields: dict[str, core_schema.TypedDictField] = {}
+        for field_def in model_def.fields:
+            schema = self.type_schema(field_def.type)
+            if not field_def.required:
+                schema = core_schema.with_default_schema(schema, default=field_def.default)
+            key = field_def.alias or field_def.name
+            fields[key] = core_schema.typed_dict_field(schema, required=field_def.required)
+        return core_schema.typed_dict_schema(
+            fields,
+            cls_name=model_def.name,
+            extra_behavior="forbid" if model_def.extra == "forbid" else None,
+            ref=model_def.name,
+        )
+
+    def type_schema(self, type_def: TypeDef) -> CoreSchema:
+        """
+        Convert a type definition into a core schema.
+
+        :param type_def: The type definition to convert.
+        :return: The core schema, with the type's constraints applied.
+        """
+        constraints = dict(type_def.constraints)
+        if type_def.kind == d.MODEL:
+            assert type_def.ref is not None, "model type without a reference"
+            return core_schema.definition_reference_schema(type_def.ref)
+        if type_def.kind == d.LITERAL:
+            return core_schema.literal_schema(list(type_def.values))
+        if type_def.kind == d.LIST:
+            return core_schema.list_schema(self.type_schema(type_def.args[0]), **constraints)
+        if type_def.kind == d.TUPLE:
+            return core_schema.tuple_schema([self.type_schema(a) for a in type_def.args], **constraints)
+        if type_def.kind == d.DICT:
+            return core_schema.dict_schema(core_schema.str_schema(), self.type_schema(type_def.args[0]))
+        if type_def.kind == d.UNION:
+            return core_schema.union_schema([self.type_schema(a) for a in type_def.args])
+        return CORE_SCALAR_SCHEMAS[type_def.kind](**constraints)
@@ -0,0 +1,259 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import pydantic
+from pydantic import TypeAdapter, ValidationError
+
+from .definitions import DEFINITION_FORMAT, SchemaDefinition
+
+DEFAULT_MAXSIZE = 512
+CACHE_DIR_ENV = "CHIARO_CACHE_DIR"
+
+
+def fingerprint(schema: Any) -> str:
+    """
+    Compute a canonical fingerprint of a JSON schema.
+
+    The fingerprint is the SHA-256 digest of the schema serialized with sorted keys and without
+    insignificant whitespace, so it does not depend on key order or formatting.
+
+    :param schema: The JSON schema, or any JSON-compatible value.
+    :return: The hexadecimal digest.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    A snapshot of the counters of a :class:`ModelCache`.
+
+    :param hits: The number of lookups that found a compiled model.
+    :param misses: The number of lookups that had to compile a model.
+    :param evictions: The number of models dropped to respect the size bound.
+    :param size: The number of models currently cached.
+    :param maxsize: The maximum number of models the cache holds.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ModelCache:
+    """Bounded, thread-safe LRU cache of compiled model classes keyed by schema fingerprint."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Initialize an empty cache.
+
+        :param maxsize: The maximum number of models to keep; least recently used ones are evicted.
+        """
+        if maxsize < 1:
+            msg = "maxsize must be at least 1"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self._models: OrderedDict[str, type] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._models
+
+    def get(self, key: str) -> type | None:
+        """
+        Look up a compiled model and mark it as most recently used.
+
+        :param key: The schema fingerprint.
+        :return: The cached model, or ``None`` if it is not cached.
+        """
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                self._misses += 1
+                return None
+            self._models.move_to_end(key)
+            self._hits += 1
+            return model
+
+    def put(self, key: str, model: type) -> type:
+        """
+        Store a compiled model, evicting the least recently used models if the cache is full.
+
+        If another thread stored a model under the same key first, that model is kept and returned
+        so that every caller sees the same class.
+
+        :param key: The schema fingerprint.
+        :param model: The compiled model.
+        :return: The model now cached under ``key``.
+        """
+        with self._lock:
+            cached = self._models.get(key)
+            if cached is not None:
+                self._models.move_to_end(key)
+                return cached
+            self._models[key] = model
+            while len(self._models) > self.maxsize:
+                self._models.popitem(last=False)
+                self._evictions += 1
+            return model
+
+    def get_or_compile(self, key: str, compile_: Callable[[], type]) -> type:
+        """
+        Return the cached model for a key, compiling and caching it on a miss.
+
+        Compilation runs outside the lock, so a slow compile does not block other lookups.
+
+        :param key: The schema fingerprint.
+        :param compile_: A callable that compiles the model.
+        :return: The cached or newly compiled model.
+        """
+        model = self.get(key)
+        if model is not None:
+            return model
+        return self.put(key, compile_())
+
+    def clear(self) -> None:
+        """Remove every cached model and reset the counters."""
+        with self._lock:
+            self._models.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Take a snapshot of the cache counters.
+
+        :return: The current counters.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._models),
+                maxsize=self.maxsize,
+            )
+
+
+class DiskCache:
+    """
+    Persistent cache of compiled schema definitions, shared safely between processes.
+
+    Each entry is a JSON file named after the schema fingerprint, inside a subdirectory named after
+    the definition format and the chiaro and Pydantic versions so that upgrades and compiler changes
+    never load stale definitions. Entries are
+    written to a temporary file and atomically renamed into place, so concurrent readers only ever
+    see complete files.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        """
+        Initialize the cache.
+
+        :param directory: The cache directory; it is created on first write.
+        """
+        self.root = Path(directory)
+        self._adapter: TypeAdapter[SchemaDefinition] = TypeAdapter(SchemaDefinition)
+
+    @cached_property
+    def directory(self) -> Path:
+        """The subdirectory holding the entries of the current definition format and versions."""
+        from . import __version__
+
+        return self.root / f"definitions-{DEFINITION_FORMAT}-chiaro-{__version__}-pydantic-{pydantic.VERSION}"
+
+    def path(self, key: str) -> Path:
+        """
+        Get the file that holds the entry for a key.
+
+        :param key: The schema fingerprint.
+        :return: The path of the cache entry.
+        """
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> SchemaDefinition | None:
+        """
+        Load a cached schema definition.
+
+        Missing, unreadable and corrupt entries are treated as cache misses.
+
+        :param key: The schema fingerprint.
+        :return: The cached definition, or ``None``.
+        """
+        try:
+            return self._adapter.validate_json(self.path(key).read_bytes())
+        except (OSError, ValidationError):
+            return None
+
+    def store(self, key: str, definition: SchemaDefinition) -> None:
+        """
+        Atomically write a schema definition to the cache.
+
+        Definitions that cannot be serialized (e.g. defaults that are not JSON values) and write
+        failures are skipped, since the cache is only an optimization.
+
+        :param key: The schema fingerprint.
+        :param definition: The compiled definition.
+        """
+        try:
+            data = self._adapter.dump_json(definition)
+        except ValueError:
+            return
+        tmp_name = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as tmp:
+                tmp_name = tmp.name
+                tmp.write(data)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_name, self.path(key))
+        except OSError:
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+
+    def get_or_compile(self, key: str, compile_: Callable[[], SchemaDefinition]) -> SchemaDefinition:
+        """
+        Return the cached definition for a key, compiling and storing it on a miss.
+
+        :param key: The schema fingerprint.
+        :param compile_: A callable that compiles the definition.
+        :return: The cached or newly compiled definition.
+        """
+        definition = self.load(key)
+        if definition is None:
+            definition = compile_()
+            self.store(key, definition)
+        return definition
+
+    def clear(self) -> None:
+        """Remove every entry written with the current definition format and versions."""
+        for entry in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                entry.unlink()
+
+
+# The process-wide cache used by DynamicModel.from_schema, SchemaParser and parse_json_schema.
+model_cache = ModelCache()
+
+# The process-wide on-disk cache, enabled by pointing CHIARO_CACHE_DIR at a directory.
+disk_cache: DiskCache | None = DiskCache(os.environ[CACHE_DIR_ENV]) if os.environ.get(CACHE_DIR_ENV) else None
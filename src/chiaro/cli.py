@@ -0,0 +1,32 @@
+import argparse
+from collections.abc import Sequence
+from pathlib import Path
+
+from .codegen import compile_schemas
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the ``chiaro`` command line interface.
+
+    :param argv: The command line arguments, without the program name; defaults to ``sys.argv``.
+    :return: The exit status.
+    """
+    parser = argparse.ArgumentParser(prog="chiaro", description="Work with JSON schemas and their data models.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_parser = commands.add_parser(
+        "compile",
+        help="compile JSON schemas into importable Python modules of models",
+        description="Write one byte-compiled module of DynamicModel subclasses per schema file.",
+    )
+    compile_parser.add_argument("schemas", nargs="+", type=Path, help="the JSON schema files")
+    compile_parser.add_argument("-o", "--output", type=Path, required=True, help="the package directory to write")
+    args = parser.parse_args(argv)
+
+    try:
+        written = compile_schemas(args.schemas, args.output)
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"chiaro: error: {error}\n")
+    for path in written:
+        print(path)
+    return 0
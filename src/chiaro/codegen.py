@@ -0,0 +1,227 @@
+import json
+import keyword
+import math
+import py_compile
+import re
+from collections.abc import Iterable
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from . import definitions as d
+from .compiler import SchemaCompiler
+from .definitions import ModelDef, SchemaDefinition, TypeDef
+
+SCALAR_SOURCES: dict[str, tuple[str | None, str]] = {
+    d.ANY: ("typing", "Any"),
+    d.STRING: (None, "str"),
+    d.INTEGER: (None, "int"),
+    d.NUMBER: (None, "float"),
+    d.BOOLEAN: (None, "bool"),
+    d.NULL: (None, "None"),
+    d.DATETIME: ("datetime", "datetime.datetime"),
+    d.DATE: ("datetime", "datetime.date"),
+    d.TIME: ("datetime", "datetime.time"),
+    d.UUID: ("uuid", "uuid.UUID"),
+}
+
+# Import sections of generated modules, in order.
+IMPORT_SECTIONS = (("datetime", "typing", "uuid"), ("pydantic",), ("chiaro.core",))
+
+
+def module_name(path: str | Path) -> str:
+    """
+    Derive a valid module name from a schema file name.
+
+    :param path: The path of the schema file.
+    :return: A lowercase identifier that is not a keyword.
+    """
+    name = re.sub(r"\W+", "_", Path(path).name.split(".")[0]).strip("_").lower() or "schema"
+    if name[0].isdigit() or keyword.iskeyword(name):
+        name = f"schema_{name}"
+    return name
+
+
+class ModuleRenderer:
+    """
+    Render plain-data model definitions as the source of a Python module.
+
+    Every model becomes a :class:`~chiaro.core.DynamicModel` subclass that behaves like the class
+    :class:`~chiaro.builder.ModelBuilder` builds at runtime. Defaults and aliases are declared
+    inside ``Annotated`` metadata, so class bodies bind no names that could shadow a type used in
+    an annotation, and annotations are postponed so that models can reference each other in any
+    order.
+    """
+
+    def __init__(self):
+        self._imports: set[tuple[str, str | None]] = set()
+        self._reserved: set[str] = set()
+
+    def render(self, definition: SchemaDefinition, source: str | None = None) -> str:
+        """
+        Render a schema definition as a module.
+
+        :param definition: The schema definition to render.
+        :param source: The name of the schema the definition was compiled from, for the header.
+        :return: The module source.
+        """
+        self._imports = set()
+        # Imported names that a model would shadow are referenced through their module instead.
+        self._reserved = {m.name for m in definition.models}
+        defined: set[str] = set()
+        incomplete: list[str] = []
+        classes = []
+        for model_def in definition.models:
+            classes.append(self.render_model(model_def))
+            defined.add(model_def.name)
+            refs = model_def.model_refs
+            if not refs <= defined or not refs.isdisjoint(incomplete):
+                incomplete.append(model_def.name)
+
+        header = f'"""Models generated by chiaro from {source or "a JSON schema"}. Do not edit."""'
+        roots = sorted(set(definition.roots.values()))
+        others = sorted(m.name for m in definition.models if m.name not in roots)
+        lines = [header, "", "from __future__ import annotations", "", *self._render_imports(), ""]
+        lines.append(f"__all__ = {[*roots, *others]!r}")
+        for block in classes:
+            lines.extend(["", "", block])
+        if incomplete:
+            # Models that reference models defined after them are completed once all exist.
+            lines.extend(["", ""])
+            lines.extend(f"{name}.model_rebuild()" for name in incomplete)
+        return "\n".join(lines) + "\n"
+
+    def render_model(self, model_def: ModelDef) -> str:
+        """
+        Render a single model as a class definition.
+
+        :param model_def: The definition of the model.
+        :return: The class source.
+        """
+        body: list[str] = []
+        if model_def.description:
+            body.extend([self._docstring(model_def.description), ""])
+        config: dict[str, str | bool] = {}
+        if model_def.extra is not None:
+            config["extra"] = model_def.extra
+        if any(f.alias is not None for f in model_def.fields):
+            config["populate_by_name"] = True
+        if config:
+            settings = ", ".join(f"{k}={v!r}" for k, v in config.items())
+            body.extend([f"model_config = {self._name('pydantic', 'ConfigDict')}({settings})", ""])
+        for field_def in model_def.fields:
+            arguments = [] if field_def.required else [self._value(field_def.default)]
+            if field_def.alias is not None:
+                arguments.append(f"alias={field_def.alias!r}")
+            if field_def.description is not None:
+                arguments.append(f"description={field_def.description!r}")
+            # Constraints of the field's own type go into the same Field as its default.
+            arguments.extend(f"{k}={self._value(v)}" for k, v in field_def.type.constraints)
+            annotation = self.annotation(replace(field_def.type, constraints=()))
+            annotated, field = self._name("typing", "Annotated"), self._name("pydantic", "Field")
+            body.append(f"{field_def.name}: {annotated}[{annotation}, {field}({', '.join(arguments)})]")
+        if not body:
+            body.append("pass")
+        while body[-1] == "":
+            body.pop()
+        indented = "\n".join(f"    {line}" if line else "" for line in body)
+        return f"class {model_def.name}({self._name('chiaro.core', 'DynamicModel')}):\n{indented}"
+
+    def annotation(self, type_def: TypeDef) -> str:
+        """
+        Render a type definition as an annotation expression.
+
+        :param type_def: The type definition to render.
+        :return: The annotation source.
+        """
+        if type_def.kind == d.MODEL:
+            return str(type_def.ref)
+        if type_def.kind == d.LITERAL:
+            source = f"{self._name('typing', 'Literal')}[{', '.join(self._value(v) for v in type_def.values)}]"
+        elif type_def.kind == d.LIST:
+            source = f"list[{self.annotation(type_def.args[0])}]"
+        elif type_def.kind == d.TUPLE:
+            source = f"tuple[{', '.join(self.annotation(a) for a in type_def.args)}]"
+        elif type_def.kind == d.DICT:
+            source = f"dict[str, {self.annotation(type_def.args[0])}]"
+        elif type_def.kind == d.UNION:
+            source = f"{self._name('typing', 'Union')}[{', '.join(self.annotation(a) for a in type_def.args)}]"
+        else:
+            module, source = SCALAR_SOURCES[type_def.kind]
+            if module == "typing":
+                source = self._name(module, source)
+            elif module is not None:
+                self._imports.add((module, None))
+        if type_def.constraints:
+            arguments = ", ".join(f"{k}={self._value(v)}" for k, v in type_def.constraints)
+            return f"{self._name('typing', 'Annotated')}[{source}, {self._name('pydantic', 'Field')}({arguments})]"
+        return source
+
+    def _name(self, module: str, name: str) -> str:
+        if name in self._reserved:
+            self._imports.add((module, None))
+            return f"{module}.{name}"
+        self._imports.add((module, name))
+        return name
+
+    def _render_imports(self) -> list[str]:
+        lines: list[str] = []
+        for section in IMPORT_SECTIONS:
+            modules = sorted(m for m, n in self._imports if m in section and n is None)
+            names = {m: sorted(n for k, n in self._imports if k == m and n is not None) for m in section}
+            block = [f"import {m}" for m in modules]
+            block.extend(f"from {m} import {', '.join(n)}" for m, n in sorted(names.items()) if n)
+            if block:
+                lines.extend([*block, ""])
+        return lines[:-1]
+
+    @classmethod
+    def _value(cls, value: Any) -> str:
+        # The repr of infinite and NaN floats is not a valid expression.
+        if isinstance(value, float) and not math.isfinite(value):
+            return f'float("{value}")'
+        if isinstance(value, list):
+            return f"[{', '.join(cls._value(v) for v in value)}]"
+        if isinstance(value, dict):
+            return f"{{{', '.join(f'{cls._value(k)}: {cls._value(v)}' for k, v in value.items())}}}"
+        return repr(value)
+
+    @staticmethod
+    def _docstring(text: str) -> str:
+        if '"""' in text or "\\" in text or text.endswith('"'):
+            return repr(text)
+        return f'"""{text}"""'
+
+
+def compile_schemas(paths: Iterable[str | Path], output: str | Path) -> list[Path]:
+    """
+    Compile JSON schema files into a package of model modules and byte-compile them.
+
+    Each schema file becomes one module named after the file. The package's ``__init__.py`` is
+    created if it does not exist yet.
+
+    :param paths: The JSON schema files.
+    :param output: The package directory to write the modules to.
+    :return: The paths of the written modules.
+    """
+    package = Path(output)
+    package.mkdir(parents=True, exist_ok=True)
+    init = package / "__init__.py"
+    if not init.exists():
+        init.write_text('"""Models generated by chiaro."""\n')
+    sources = [Path(p) for p in paths]
+    names = [module_name(p) for p in sources]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        msg = f"Schema files map to the same module: {', '.join(duplicates)}"
+        raise ValueError(msg)
+    written = []
+    for path, name in zip(sources, names, strict=True):
+        schema = json.loads(path.read_text())
+        definition = SchemaCompiler(schema).compile()
+        target = package / f"{name}.py"
+        target.write_text(ModuleRenderer().render(definition, source=path.name))
+        written.append(target)
+    for target in [init, *written]:
+        py_compile.compile(str(target), doraise=True)
+    return written
@@ -0,0 +1,535 @@
+import keyword
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+from urllib.parse import unquote, urljoin
+
+from pydantic import BaseModel
+
+from . import definitions as d
+from .cache import fingerprint
+from .definitions import FieldDef, ModelDef, SchemaDefinition, TypeDef
+from .index import SchemaIndex
+
+STRING_FORMATS: dict[str, str] = {
+    "date-time": d.DATETIME,
+    "date": d.DATE,
+    "time": d.TIME,
+    "uuid": d.UUID,
+}
+
+CONSTRAINT_KEYWORDS: dict[str, str] = {
+    "minLength": "min_length",
+    "maxLength": "max_length",
+    "pattern": "pattern",
+    "minimum": "ge",
+    "maximum": "le",
+    "exclusiveMinimum": "gt",
+    "exclusiveMaximum": "lt",
+    "multipleOf": "multiple_of",
+    "minItems": "min_length",
+    "maxItems": "max_length",
+}
+
+LITERAL_VALUE_TYPES = (str, int, float, bool, type(None))
+
+LOCAL_DEFINITION_PREFIXES = ("#/definitions/", "#/$defs/")
+
+
+def class_name(title: str, default: str = "Model") -> str:
+    """
+    Convert a schema title or definition key into a valid class name.
+
+    :param title: The title or key to convert.
+    :param default: The name to use when nothing usable remains.
+    :return: An UpperCamelCase identifier.
+    """
+    words = re.split(r"[^A-Za-z0-9]+", title)
+    name = "".join(w[:1].upper() + w[1:] for w in words if w)
+    if not name:
+        return default
+    if name[0].isdigit():
+        name = f"{default}{name}"
+    elif keyword.iskeyword(name):
+        name = f"{name}{default}"
+    return name
+
+
+def field_name(name: str, taken: set[str]) -> str:
+    """
+    Convert a property name into a valid, unused Pydantic field name.
+
+    :param name: The property name from the schema.
+    :param taken: The field names already used by the model.
+    :return: A valid identifier that does not clash with ``taken`` or ``BaseModel`` attributes.
+    """
+    valid = re.sub(r"\W", "_", name) or "field"
+    if valid[0].isdigit() or valid.startswith("_"):
+        valid = f"field_{valid.lstrip('_')}"
+    if keyword.iskeyword(valid) or valid.startswith("model_") or hasattr(BaseModel, valid):
+        valid = f"{valid}_"
+    candidate, count = valid, 1
+    while candidate in taken:
+        candidate = f"{valid}_{count}"
+        count += 1
+    return candidate
+
+
+def unescape_pointer(token: str) -> str:
+    """
+    Decode one reference token of a JSON pointer.
+
+    :param token: The escaped token.
+    :return: The decoded token.
+    """
+    return unquote(token).replace("~1", "/").replace("~0", "~")
+
+
+def iter_refs(schema: Any) -> Iterator[str]:
+    """
+    Iterate over every ``$ref`` inside a subschema.
+
+    :param schema: The subschema to search.
+    :return: An iterator over the reference strings.
+    """
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                yield ref
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+class SchemaCompiler:
+    """Compile JSON schemas into plain-data model definitions."""
+
+    def __init__(self, schema: dict | None = None, index: SchemaIndex | None = None, *, fold: bool = True):
+        """
+        Initialize the compiler.
+
+        :param schema: The JSON schema document that local references resolve against, if any.
+        :param index: A prebuilt index of ``schema``, shared between compilers of the same document.
+        :param fold: Whether to fold inline objects into existing models with the same fields. A
+            parallel compile folds once its components are merged instead.
+        """
+        self.schema: dict = schema if schema is not None else {}
+        self.models: dict[str, ModelDef] = {}
+        self._names: set[str] = set()
+        # The reference index: documents and embedded resources by $id, for references between
+        # documents, and the pointer index of each document by object id.
+        self._documents: dict[str, dict] = {}
+        self._bases: dict[int, str] = {}
+        self._indexes: dict[int, SchemaIndex] = {id(self.schema): index} if index is not None else {}
+        # The definition table: compiled references by definition key (the reference itself,
+        # unless documents are compiled together).
+        self.definitions: dict[str, TypeDef] = {}
+        self._keys: dict[tuple[int, str], str] = {}
+        self._fingerprints: dict[int, str] = {}
+        self._resolving: set[str] = set()
+        # Compiled model shapes, for sharing one model between identical inline objects, and the
+        # names of the models compiled from inline objects.
+        self._shapes: dict[str, str] = {}
+        self.inline_models: set[str] = set()
+        self._fold = fold
+        # How the name of each model was chosen: the model whose name it extends and the suffix, or
+        # None and the whole preferred name.
+        self.name_sources: dict[str, tuple[str | None, str]] = {}
+        self._naming: str | None = None
+        self._shared = False
+
+    def compile(self) -> SchemaDefinition:
+        """
+        Compile the document's root schema.
+
+        :return: The schema definition whose ``"#"`` root is the model for the document.
+        """
+        self.add_document(self.schema)
+        root = self.compile_root(self.schema, "#")
+        return SchemaDefinition(models=tuple(self.models.values()), roots={"#": root})
+
+    def compile_many(self, schemas: Iterable[dict]) -> SchemaDefinition:
+        """
+        Compile several documents with one shared reference index and definition table.
+
+        Documents can reference each other through their ``$id``. Subschemas that are identical in
+        every document, such as a ``definitions`` section shared by a bundle of schemas, are
+        compiled once and map to the same model.
+
+        :param schemas: The JSON schema documents.
+        :return: The schema definition, with roots keyed by each document's ``$id`` or, for
+            documents without one, by their position.
+        """
+        documents = list(schemas)
+        self._shared = True
+        for document in documents:
+            self.add_document(document)
+        roots: dict[str | int, str] = {}
+        for index, document in enumerate(documents):
+            key = document.get("$id") or index
+            if key in roots:
+                msg = f"Duplicate schema id: {key!r}"
+                raise ValueError(msg)
+            with self._document(document):
+                roots[key] = self.compile_root(document, "#")
+        return SchemaDefinition(models=tuple(self.models.values()), roots=roots)
+
+    def add_document(self, schema: dict) -> None:
+        """
+        Add a document to the reference index so that other documents can reference it.
+
+        Embedded resources (subschemas with their own ``$id``) and anchors are indexed as well.
+
+        :param schema: The JSON schema document.
+        """
+        index = self._index(schema)
+        self._documents.update(index.resources)
+        self._bases.update(index.bases)
+        if isinstance(schema.get("$id"), str):
+            self._documents[schema["$id"]] = schema
+
+    def define(self, ref: str, type_def: TypeDef) -> None:
+        """
+        Register a reference that was already compiled, so that it is not compiled again.
+
+        :param ref: The local reference.
+        :param type_def: The compiled type of the reference; the models it names are reserved.
+        """
+        self.definitions[ref] = type_def
+        self._names |= type_def.model_refs
+
+    def add_model(self, model_def: ModelDef, *, inline: bool = False) -> str:
+        """
+        Add a model that was already compiled, reserving its name.
+
+        :param model_def: The model definition.
+        :param inline: Whether the model was compiled from an inline object; if its fields match an
+            existing model, it is folded into that model and its name is released.
+        :return: The name of the model that holds the definition.
+        """
+        if self._fold:
+            shape = self._shape(model_def)
+            if inline and shape in self._shapes:
+                self._names.discard(model_def.name)
+                return self._shapes[shape]
+            self._shapes.setdefault(shape, model_def.name)
+        self.models[model_def.name] = model_def
+        self._names.add(model_def.name)
+        if inline:
+            self.inline_models.add(model_def.name)
+        return model_def.name
+
+    def compile_root(self, schema: dict, ref: str | None = None, name: str | None = None) -> str:
+        """
+        Compile a schema that must produce a model class.
+
+        :param schema: The object schema to compile.
+        :param ref: The local reference under which other subschemas can reach this schema.
+        :param name: A class name already reserved for the model, if any.
+        :return: The name of the compiled model.
+        """
+        key = self._definition_key(ref) if ref is not None else None
+        compiled = self.definitions.get(key) if key is not None else None
+        if compiled is not None and compiled.kind == d.MODEL and compiled.ref is not None:
+            return compiled.ref
+        schema = self._merge_all_of(schema)
+        if not self._is_object(schema):
+            msg = "The root of a schema must describe an object."
+            raise ValueError(msg)
+        preferred = class_name(schema.get("title", "Model"))
+        if name is None:
+            name = self.reserve(preferred)
+        self.name_sources[name] = (None, preferred)
+        if key is not None:
+            self.definitions[key] = TypeDef(d.MODEL, ref=name)
+        self._compile_model(name, schema)
+        return name
+
+    def resolve(self, ref: str) -> Any:
+        """
+        Resolve a local ``$ref`` against the current document.
+
+        Pointers and anchors are looked up in the document's index, which is built on first use.
+
+        :param ref: The reference, e.g. ``"#/definitions/Address"``.
+        :return: The referenced subschema.
+        """
+        if not ref.startswith("#"):
+            msg = f"Unresolvable reference: {ref!r}"
+            raise ValueError(msg)
+        target: Any = self._index(self.schema).get(ref)
+        if target is not None:
+            return target
+        # Pointers into instance data (enum values, defaults) are not indexed.
+        target = self.schema
+        for token in filter(None, ref[1:].split("/")):
+            key = unescape_pointer(token)
+            try:
+                target = target[int(key)] if isinstance(target, list) else target[key]
+            except (KeyError, IndexError, ValueError):
+                msg = f"Unresolvable reference: {ref!r}"
+                raise ValueError(msg) from None
+        return target
+
+    def compile_type(self, schema: Any, name: str) -> TypeDef:
+        """
+        Compile a subschema into a type definition.
+
+        :param schema: The subschema to compile.
+        :param name: The class name to use if the subschema needs its own model.
+        :return: The compiled type definition.
+        """
+        if not isinstance(schema, dict):
+            return TypeDef(d.ANY)
+        if "$ref" in schema:
+            return self.compile_ref(schema["$ref"])
+        if "const" in schema:
+            return self._literal((schema["const"],))
+        if "enum" in schema:
+            return self._literal(tuple(schema["enum"]))
+        for combinator in ("anyOf", "oneOf"):
+            if combinator in schema:
+                members = [self.compile_type(s, f"{name}{i}") for i, s in enumerate(schema[combinator])]
+                return members[0] if len(members) == 1 else TypeDef(d.UNION, args=tuple(members))
+        if "allOf" in schema:
+            return self.compile_type(self._merge_all_of(schema), name)
+
+        type_ = schema.get("type")
+        if isinstance(type_, list):
+            members = [self.compile_type({**schema, "type": t}, name) for t in type_]
+            return members[0] if len(members) == 1 else TypeDef(d.UNION, args=tuple(members))
+        if type_ == "null":
+            return TypeDef(d.NULL)
+        if type_ == "boolean":
+            return TypeDef(d.BOOLEAN)
+        if type_ == "integer":
+            return TypeDef(d.INTEGER, constraints=self._constraints(schema))
+        if type_ == "number":
+            return TypeDef(d.NUMBER, constraints=self._constraints(schema))
+        if type_ == "string":
+            kind = STRING_FORMATS.get(schema.get("format", ""), d.STRING)
+            return TypeDef(kind, constraints=self._constraints(schema) if kind == d.STRING else ())
+        if type_ == "array" or "items" in schema or "prefixItems" in schema:
+            return self._compile_array(schema, name)
+        if self._is_object(schema):
+            return self._compile_object(schema, name)
+        return TypeDef(d.ANY)
+
+    def compile_ref(self, ref: str) -> TypeDef:
+        """
+        Compile the subschema behind a reference, or return its entry in the definition table.
+
+        :param ref: The reference, local or to another indexed document.
+        :return: The compiled type definition.
+        """
+        uri, _, fragment = ref.partition("#")
+        if uri:
+            base = self._bases.get(id(self.schema), self.schema.get("$id", ""))
+            document = self._documents.get(urljoin(base, uri), self._documents.get(uri))
+            if document is None:
+                msg = f"Unresolvable reference: {ref!r}"
+                raise ValueError(msg)
+            with self._document(document):
+                return self.compile_ref(f"#{fragment}")
+        key = self._definition_key(ref)
+        if key in self.definitions:
+            return self.definitions[key]
+        if key in self._resolving:
+            # A recursive reference to something that is not a model cannot be expressed.
+            return TypeDef(d.ANY)
+        target = self._merge_all_of(self.resolve(ref))
+        token = unescape_pointer(ref.rsplit("/", 1)[-1])
+        if isinstance(target, dict) and target.get("properties") is not None:
+            preferred = class_name(target.get("title", token))
+            model_name = self.reserve(preferred)
+            self.name_sources[model_name] = (None, preferred)
+            # Register before compiling fields so that cycles resolve to the model name.
+            self.definitions[key] = TypeDef(d.MODEL, ref=model_name)
+            return self._compile_model(model_name, target)
+        self._resolving.add(key)
+        naming, self._naming = self._naming, None
+        try:
+            type_def = self.compile_type(target, class_name(token))
+        finally:
+            self._resolving.discard(key)
+            self._naming = naming
+        self.definitions[key] = type_def
+        return type_def
+
+    def _definition_key(self, ref: str) -> str:
+        """
+        Compute the key of a local reference in the shared definition table.
+
+        A subschema without references is identified by its content alone. A subschema whose
+        references all point into ``definitions``/``$defs`` also depends on those sections, and any
+        other subschema on the whole document.
+        """
+        if not self._shared:
+            return ref
+        memo = (id(self.schema), ref)
+        if memo not in self._keys:
+            target = self.resolve(ref)
+            refs = set(iter_refs(target))
+            if not refs:
+                context = ""
+            elif all(r.startswith(LOCAL_DEFINITION_PREFIXES) for r in refs):
+                context = ",".join(self._fingerprint(self.schema.get(k)) for k in ("definitions", "$defs"))
+            else:
+                context = self._fingerprint(self.schema)
+            self._keys[memo] = f"{self._fingerprint(target)}:{fingerprint(context)}"
+        return self._keys[memo]
+
+    def _index(self, document: dict) -> SchemaIndex:
+        # Documents stay alive during compilation, so object ids are stable keys.
+        index = self._indexes.get(id(document))
+        if index is None:
+            index = self._indexes[id(document)] = SchemaIndex(document)
+        return index
+
+    def _fingerprint(self, value: Any) -> str:
+        # Documents stay alive during compilation, so object ids are stable memo keys.
+        if id(value) not in self._fingerprints:
+            self._fingerprints[id(value)] = fingerprint(value)
+        return self._fingerprints[id(value)]
+
+    @contextmanager
+    def _document(self, document: dict) -> Iterator[None]:
+        previous, self.schema = self.schema, document
+        try:
+            yield
+        finally:
+            self.schema = previous
+
+    def _compile_array(self, schema: dict, name: str) -> TypeDef:
+        constraints = self._constraints(schema)
+        items = schema.get("prefixItems", schema.get("items"))
+        if isinstance(items, list):
+            args = tuple(self.compile_type(s, f"{name}{i}") for i, s in enumerate(items))
+            return TypeDef(d.TUPLE, args=args, constraints=constraints)
+        item_type = self.compile_type(items, f"{name}Item") if items is not None else TypeDef(d.ANY)
+        return TypeDef(d.LIST, args=(item_type,), constraints=constraints)
+
+    def _compile_object(self, schema: dict, name: str) -> TypeDef:
+        if schema.get("properties") is not None:
+            preferred = class_name(schema.get("title", name))
+            model_name = self.reserve(preferred)
+            if "title" in schema or self._naming is None:
+                self.name_sources[model_name] = (None, preferred)
+            else:
+                # Names derived from the enclosing model's name extend it.
+                self.name_sources[model_name] = (self._naming, preferred[len(self._naming) :])
+            return self._compile_model(model_name, schema, inline=True)
+        additional = schema.get("additionalProperties")
+        if isinstance(additional, dict):
+            return TypeDef(d.DICT, args=(self.compile_type(additional, f"{name}Value"),))
+        pattern_properties = schema.get("patternProperties")
+        if isinstance(pattern_properties, dict) and pattern_properties:
+            members = tuple(self.compile_type(s, f"{name}Value") for s in pattern_properties.values())
+            value = members[0] if len(members) == 1 else TypeDef(d.UNION, args=members)
+            return TypeDef(d.DICT, args=(value,))
+        return TypeDef(d.DICT, args=(TypeDef(d.ANY),))
+
+    def _compile_model(self, name: str, schema: dict, *, inline: bool = False) -> TypeDef:
+        """
+        Compile an object schema with properties into a model.
+
+        Inline objects (not reachable through a reference) whose compiled fields match an existing
+        model are folded into it: the reserved name is released and the existing model is used.
+        """
+        required = set(schema.get("required", ()))
+        fields: list[FieldDef] = []
+        taken: set[str] = set()
+        naming, self._naming = self._naming, name
+        for prop, subschema in (schema.get("properties") or {}).items():
+            attr = field_name(prop, taken)
+            taken.add(attr)
+            is_required = prop in required
+            has_default = isinstance(subschema, dict) and "default" in subschema
+            fields.append(
+                FieldDef(
+                    name=attr,
+                    type=self.compile_type(subschema, f"{name}{class_name(prop, 'Field')}"),
+                    required=is_required,
+                    alias=prop if attr != prop else None,
+                    default=subschema["default"] if has_default and not is_required else None,
+                    description=subschema.get("description") if isinstance(subschema, dict) else None,
+                )
+            )
+        self._naming = naming
+        model_def = ModelDef(
+            name=name,
+            fields=tuple(fields),
+            extra="forbid" if schema.get("additionalProperties") is False else None,
+            description=schema.get("description"),
+        )
+        return TypeDef(d.MODEL, ref=self.add_model(model_def, inline=inline))
+
+    @staticmethod
+    def _shape(model_def: ModelDef) -> str:
+        # The repr tells apart values that compare equal, such as 1, 1.0 and True, and also
+        # covers unhashable defaults.
+        return repr((model_def.fields, model_def.extra, model_def.description))
+
+    def _merge_all_of(self, schema: Any) -> Any:
+        if not isinstance(schema, dict) or "allOf" not in schema:
+            return schema
+        merged = {k: v for k, v in schema.items() if k != "allOf"}
+        properties = dict(merged.get("properties") or {})
+        required = list(merged.get("required", ()))
+        for member in schema["allOf"]:
+            if isinstance(member, dict) and "$ref" in member:
+                member = {**self.resolve(member["$ref"]), **{k: v for k, v in member.items() if k != "$ref"}}
+            member = self._merge_all_of(member)
+            if not isinstance(member, dict):
+                continue
+            properties.update(member.get("properties") or {})
+            required.extend(r for r in member.get("required", ()) if r not in required)
+            for key, value in member.items():
+                merged.setdefault(key, value)
+        if properties:
+            merged["properties"] = properties
+        if required:
+            merged["required"] = required
+        return merged
+
+    def _literal(self, values: tuple[Any, ...]) -> TypeDef:
+        if all(isinstance(v, LITERAL_VALUE_TYPES) for v in values):
+            return TypeDef(d.LITERAL, values=values)
+        return TypeDef(d.ANY)
+
+    def reserve(self, name: str) -> str:
+        """
+        Reserve a unique class name, adding a numeric suffix if the name is taken.
+
+        :param name: The preferred name.
+        :return: The reserved name.
+        """
+        candidate, count = name, 1
+        while candidate in self._names:
+            candidate = f"{name}{count}"
+            count += 1
+        self._names.add(candidate)
+        return candidate
+
+    @staticmethod
+    def _constraints(schema: dict) -> tuple[tuple[str, Any], ...]:
+        constraints: dict[str, Any] = {}
+        for keyword_, argument in CONSTRAINT_KEYWORDS.items():
+            value = schema.get(keyword_)
+            if value is None or isinstance(value, bool):
+                continue
+            constraints[argument] = value
+        # Draft 4 expresses exclusive bounds as booleans next to minimum/maximum.
+        if schema.get("exclusiveMinimum") is True and "ge" in constraints:
+            constraints["gt"] = constraints.pop("ge")
+        if schema.get("exclusiveMaximum") is True and "le" in constraints:
+            constraints["lt"] = constraints.pop("le")
+        return tuple(sorted(constraints.items()))
+
+    @staticmethod
+    def _is_object(schema: Any) -> bool:
+        return isinstance(schema, dict) and (schema.get("type") == "object" or "properties" in schema)
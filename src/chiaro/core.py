@@ -1,18 +1,198 @@
-from pydantic import BaseModel
+import copy
+import types
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Annotated, Any, ClassVar, Self, Union, cast, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
+from pydantic.fields import FieldInfo
+from pydantic_core import ErrorDetails, SchemaValidator, from_json
+
+from .builder import CoreSchemaBuilder, ModelBuilder
+from .cache import DiskCache, ModelCache, disk_cache, fingerprint, model_cache
+from .compiler import SchemaCompiler
+from .definitions import SchemaDefinition, stale_models
+from .parallel import ParallelSchemaCompiler
+
+# The number of failed validations whose errors a DriftReport keeps.
+MAX_DRIFT_ERRORS = 10
+# Defaults of these types are shared by instances constructed from trusted data; others are copied.
+IMMUTABLE_DEFAULT_TYPES = (types.NoneType, bool, int, float, str, bytes)
+
+_object_new = object.__new__
+_object_setattr = object.__setattr__
 
 
 class DynamicModel(BaseModel):
     """Base class for dynamically created Pydantic models."""
 
+    # Caches kept on each model class itself, not inherited, and set by the first call that needs them.
+    __list_adapter__: ClassVar[TypeAdapter[list[Any]]]
+    __projections__: ClassVar[dict[frozenset[str], type["DynamicModel"]]]
+    __trusted_plan__: ClassVar["_TrustedPlan"]
+
     @classmethod
     def from_schema(cls, schema: dict) -> type["DynamicModel"]:
         """
         Create a dynamic model class from a given JSON schema.
 
+        Identical schemas share one compiled class through the process-wide model cache.
+
         :param schema: The JSON schema to create the model from.
         :return: A dynamically created Pydantic model class.
         """
-        # Logic to dynamically create a model from a schema
+        return SchemaParser(schema).parse()
+
+    @classmethod
+    def validate_many(cls, records: Iterable[Any]) -> "BatchResult":
+        """
+        Validate a batch of records with a single call into pydantic-core.
+
+        When some records are invalid, the valid ones are validated again in a second call, so a
+        batch costs at most two calls however many records fail.
+
+        :param records: The records to validate, as dicts or other objects the model accepts.
+        :return: The instances of the valid records and the errors of the invalid ones.
+        """
+        records = records if isinstance(records, list) else list(records)
+        try:
+            return BatchResult(cls._list_adapter().validate_python(records), {})
+        except ValidationError as error:
+            return cls._validate_valid(records, error)
+
+    @classmethod
+    def validate_many_json(cls, data: str | bytes | bytearray) -> "BatchResult":
+        """
+        Validate a JSON array of records with a single call into pydantic-core.
+
+        :param data: The JSON document, which must be an array.
+        :return: The instances of the valid records and the errors of the invalid ones.
+        :raises pydantic.ValidationError: If the document is not valid JSON or not an array.
+        """
+        try:
+            return BatchResult(cls._list_adapter().validate_json(data), {})
+        except ValidationError as error:
+            if any(not e["loc"] for e in error.errors()):
+                raise
+            return cls._validate_valid(from_json(data), error)
+
+    @classmethod
+    def _list_adapter(cls) -> TypeAdapter[list[Any]]:
+        # Kept on the class itself, not inherited, so that every model validates its own type.
+        adapter = cls.__dict__.get("__list_adapter__")
+        if adapter is None:
+            # list[cls], spelled so that type checkers accept a class only known at runtime.
+            adapter = TypeAdapter(cast("type[list[Any]]", types.GenericAlias(list, (cls,))))
+            cls.__list_adapter__ = adapter
+        return adapter
+
+    @classmethod
+    def _validate_valid(cls, records: list, error: ValidationError) -> "BatchResult":
+        errors: defaultdict[int, list[ErrorDetails]] = defaultdict(list)
+        for detail in error.errors():
+            # Errors of a list are located by the index of the item first.
+            errors[cast(int, detail["loc"][0])].append({**detail, "loc": detail["loc"][1:]})
+        valid = [i for i in range(len(records)) if i not in errors]
+        instances: list[DynamicModel | None] = [None] * len(records)
+        for i, instance in zip(valid, cls._list_adapter().validate_python([records[i] for i in valid]), strict=True):
+            instances[i] = instance
+        return BatchResult(instances, dict(errors))
+
+    @classmethod
+    def from_trusted(cls, data: dict, *, drift: "DriftReport | None" = None) -> Self:
+        """
+        Create an instance from data that is already known to be valid, without validating it.
+
+        The data is adopted as is, like with ``model_construct``, except that nested models are
+        constructed too; defaults fill in missing fields and unknown keys are dropped (or kept as
+        extra fields, if the model allows them). With a drift report, one record in
+        every ``drift.sample_every`` is fully validated instead, and a failure is recorded in the
+        report rather than raised.
+
+        :param data: The record, keyed by field names or aliases.
+        :param drift: The report to sample records for, if any.
+        :return: The instance; for a sampled record that fails validation, the unvalidated one.
+        """
+        if drift is not None and drift.sample():
+            try:
+                return cls.model_validate(data)
+            except ValidationError as error:
+                drift.record(error)
+        return cls._construct(data)
+
+    @classmethod
+    def from_trusted_many(cls, records: Iterable[dict], *, drift: "DriftReport | None" = None) -> list[Self]:
+        """
+        Create instances from records that are already known to be valid (see :meth:`from_trusted`).
+
+        :param records: The records.
+        :param drift: The report to sample records for, if any.
+        :return: The instances, in order.
+        """
+        if drift is None:
+            construct = cls._construct
+            return [construct(record) for record in records]
+        return [cls.from_trusted(record, drift=drift) for record in records]
+
+    @classmethod
+    def projection(cls, *paths: str) -> type["DynamicModel"]:
+        """
+        Create a model with only some of the fields of this one, to validate just what is needed.
+
+        A path is a field name or alias, or a dotted path into a nested model, such as
+        ``"customer.address.city"``, which keeps only that field of the nested models. Selecting a
+        field itself keeps it whole. Fields outside the projection are ignored in the input.
+        Projections are cached on the model, so the same paths return the same class.
+
+        :param paths: The fields to keep.
+        :return: The projection model.
+        :raises ValueError: If a path names an unknown field or goes into a field without models.
+        """
+        key = frozenset(paths)
+        projections = cls.__dict__.get("__projections__")
+        if projections is None:
+            projections = {}
+            cls.__projections__ = projections
+        model = projections.get(key)
+        if model is None:
+            model = projections.setdefault(key, _project(cls, key))
+        return model
+
+    @classmethod
+    def _construct(cls, data: dict) -> Self:
+        # Sets the instance's attributes directly, which skips the per-field work of model_construct.
+        plan = cls.__dict__.get("__trusted_plan__")
+        if plan is None:
+            plan = _TrustedPlan.of(cls)
+            cls.__trusted_plan__ = plan
+        values = {**plan.defaults, **data}
+        fields_set = set(data)
+        unknown = fields_set - plan.keys
+        extra = None
+        if unknown:
+            fields_set -= unknown
+            extra = {key: values.pop(key) for key in unknown}
+        for alias, name in plan.aliases:
+            if alias in values:
+                values[name] = values.pop(alias)
+                fields_set.discard(alias)
+                fields_set.add(name)
+        for name, info in plan.factories:
+            if name not in values:
+                values[name] = info.get_default(call_default_factory=True, validated_data=values)
+        for name, convert in plan.converters:
+            value = values.get(name)
+            if value is not None:
+                values[name] = convert(value)
+        if plan.hooks:
+            return cls.model_construct(fields_set, **values, **(extra or {}))
+        instance = _object_new(cls)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+        _object_setattr(instance, "__pydantic_extra__", extra if plan.extra_allowed else None)
+        _object_setattr(instance, "__pydantic_private__", None)
+        return instance
 
     def to_schema(self) -> dict:
         """
@@ -23,19 +203,355 @@ class DynamicModel(BaseModel):
         # Logic to convert the model instance back to a JSON schema
 
 
+def _project(model: type[DynamicModel], paths: Iterable[str]) -> type[DynamicModel]:
+    fields = model.model_fields
+    names = {info.alias: name for name, info in fields.items() if info.alias} | {name: name for name in fields}
+    # The nested paths of each selected field; None keeps the field whole.
+    selected: dict[str, set[str] | None] = {}
+    for path in paths:
+        head, _, rest = path.partition(".")
+        name = names.get(head)
+        if name is None:
+            msg = f"Unknown field {head!r} of {model.__name__} in projection path {path!r}"
+            raise ValueError(msg)
+        nested = selected.setdefault(name, set())
+        if nested is None or not rest:
+            selected[name] = None
+        else:
+            nested.add(rest)
+    definitions: dict[str, Any] = {}
+    for name, info in fields.items():
+        if name not in selected:
+            continue
+        annotation = info.annotation
+        nested = selected[name]
+        if nested is not None:
+            annotation = _project_annotation(annotation, nested)
+            if annotation is info.annotation:
+                msg = f"Field {name!r} of {model.__name__} has no nested fields to project"
+                raise ValueError(msg)
+        definitions[name] = (annotation, copy.copy(info))
+    cls_kwargs = {"populate_by_name": True} if any(fields[name].alias for name in definitions) else None
+    return create_model(
+        f"{model.__name__}Projection",
+        __base__=DynamicModel,
+        __doc__=model.__doc__,
+        __cls_kwargs__=cls_kwargs,
+        **definitions,
+    )
+
+
+def _project_annotation(annotation: Any, paths: set[str]) -> Any:
+    # Replaces the models in a type with their projections; returns the type itself if it has none.
+    if isinstance(annotation, type) and issubclass(annotation, DynamicModel):
+        return annotation.projection(*paths)
+    args = get_args(annotation)
+    if not args:
+        return annotation
+    projected = tuple(_project_annotation(a, paths) for a in args)
+    if all(p is a for p, a in zip(projected, args, strict=True)):
+        return annotation
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return Annotated[projected]
+    if origin in (Union, types.UnionType):
+        return Union[projected]  # noqa: UP007
+    return origin[projected]
+
+
+@dataclass(frozen=True)
+class _TrustedPlan:
+    # What constructing a model from trusted data has to do besides adopting the data as is.
+    keys: frozenset[str]
+    defaults: dict[str, Any]
+    factories: tuple[tuple[str, FieldInfo], ...]
+    aliases: tuple[tuple[str, str], ...]
+    converters: tuple[tuple[str, Callable[[Any], Any]], ...]
+    extra_allowed: bool
+    hooks: bool
+
+    @classmethod
+    def of(cls, model: type[DynamicModel]) -> "_TrustedPlan":
+        fields = model.model_fields
+        defaults = {}
+        factories = []
+        for name, info in fields.items():
+            if info.is_required():
+                continue
+            # Mutable defaults are copied for every instance, as validation does.
+            if info.default_factory is None and isinstance(info.default, IMMUTABLE_DEFAULT_TYPES):
+                defaults[name] = info.default
+            else:
+                factories.append((name, info))
+        aliases = tuple((info.alias, name) for name, info in fields.items() if info.alias not in (None, name))
+        converters = []
+        for name, info in fields.items():
+            convert = _trusted_converter(info.annotation)
+            if convert is not None:
+                converters.append((name, convert))
+        return cls(
+            keys=frozenset(fields.keys() | {alias for alias, _ in aliases}),
+            defaults=defaults,
+            factories=tuple(factories),
+            aliases=aliases,
+            converters=tuple(converters),
+            extra_allowed=model.model_config.get("extra") == "allow",
+            # Private attributes and post-init hooks are only set up by model_construct.
+            hooks=bool(model.__private_attributes__) or model.__pydantic_post_init__ is not None,
+        )
+
+
+def _trusted_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    # Returns how to construct the nested models in a value of this type, or None if there are none.
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, DynamicModel):
+        return lambda value: annotation._construct(value) if isinstance(value, dict) else value
+    if origin is Annotated:
+        return _trusted_converter(args[0])
+    if origin in (Union, types.UnionType):
+        members = [a for a in args if a is not types.NoneType]
+        # Which member of a union of several types a value belongs to is only known by validating it.
+        return _trusted_converter(members[0]) if len(members) == 1 else None
+    if origin is list:
+        item = _trusted_converter(args[0])
+        if item is not None:
+            return lambda value: [item(v) for v in value] if isinstance(value, list) else value
+    elif origin is dict:
+        entry = _trusted_converter(args[1])
+        if entry is not None:
+            return lambda value: {k: entry(v) for k, v in value.items()} if isinstance(value, dict) else value
+    elif origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        element = _trusted_converter(args[0])
+        if element is not None:
+            return lambda value: tuple(element(v) for v in value) if isinstance(value, list | tuple) else value
+    elif origin is tuple:
+        items = [_trusted_converter(a) for a in args]
+        if any(items):
+            return lambda value: tuple(c(v) if c else v for c, v in zip(items, value, strict=False))
+    return None
+
+
 class SchemaParser:
     """Class to parse JSON schemas and create dynamic Pydantic models."""
 
-    def __init__(self, schema: dict):
+    def __init__(
+        self,
+        schema: dict,
+        *,
+        cache: ModelCache | None = model_cache,
+        disk_cache: DiskCache | None = disk_cache,
+        workers: int | None = None,
+    ):
+        """
+        Initialize the parser.
+
+        :param schema: The JSON schema to parse.
+        :param cache: The cache of compiled models to use, or ``None`` to always compile.
+        :param disk_cache: The persistent cache of compiled definitions to use, or ``None``.
+        :param workers: The number of processes to compile a large schema with (see
+            :class:`~chiaro.parallel.ParallelSchemaCompiler`), or ``None`` to compile in the
+            calling process.
+        """
         self.schema = schema
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.workers = workers
 
     def parse(self) -> type[DynamicModel]:
         """
         Parse the schema and create a dynamic model.
 
+        When a cache is configured, a schema with the same fingerprint as a previously parsed one
+        returns the already-compiled class. On a miss, a disk cache lets the class be rebuilt from
+        a stored definition without compiling the schema again.
+
         :return: A dynamically created Pydantic model class.
         """
-        # Logic to parse the schema and create a dynamic model
+        key = fingerprint(self.schema)
+        if self.cache is None:
+            return self._compile(key)
+        return self.cache.get_or_compile(key, lambda: self._compile(key))
+
+    def parse_projection(self, *paths: str) -> type[DynamicModel]:
+        """
+        Parse the schema into a model with only some of its fields (see :meth:`DynamicModel.projection`).
+
+        :param paths: The fields to keep, as field names, aliases or dotted paths into nested models.
+        :return: The projection model, cached on the class of the whole schema.
+        """
+        return self.parse().projection(*paths)
+
+    def parse_validator(self) -> SchemaValidator:
+        """
+        Parse the schema into a pydantic-core validator, without creating model classes.
+
+        The validator is built directly from the compiled schema, which is faster than creating
+        models; validating returns plain dicts keyed by the schema's property names. The disk
+        cache is used for the compiled schema, but validators are not kept in the model cache.
+
+        :return: The validator of the schema's root.
+        """
+        definition = self._definition(fingerprint(self.schema))
+        return CoreSchemaBuilder().validator(definition)
+
+    def _compile(self, key: str) -> type[DynamicModel]:
+        definition = self._definition(key)
+        return ModelBuilder(DynamicModel).build(definition)[definition.roots["#"]]
+
+    def _definition(self, key: str) -> SchemaDefinition:
+        if self.workers is None:
+            compile_ = SchemaCompiler(self.schema).compile
+        else:
+            compile_ = self._compile_parallel
+        return compile_() if self.disk_cache is None else self.disk_cache.get_or_compile(key, compile_)
+
+    def _compile_parallel(self) -> SchemaDefinition:
+        with ParallelSchemaCompiler(self.schema, self.workers) as compiler:
+            return compiler.compile()
+
+
+class SchemaBundleParser:
+    """Class to parse a bundle of JSON schemas that share definitions and references."""
+
+    def __init__(self, schemas: Iterable[dict]):
+        """
+        Initialize the parser.
+
+        :param schemas: The JSON schemas to parse. Schemas can reference each other by ``$id``.
+        """
+        self.schemas = list(schemas)
+
+    def parse(self) -> dict[str | int, type[DynamicModel]]:
+        """
+        Parse all schemas with one shared definition table and reference index.
+
+        Every distinct subschema is compiled once, so schemas that repeat the same definitions
+        share the same model classes for them.
+
+        :return: A mapping of each schema's ``$id`` (or position, if it has none) to its model class.
+        """
+        definition = SchemaCompiler().compile_many(self.schemas)
+        models = ModelBuilder(DynamicModel).build(definition)
+        return {key: models[name] for key, name in definition.roots.items()}
+
+
+@dataclass(frozen=True)
+class ParseResult:
+    """
+    The outcome of an incremental parse, kept to re-parse a changed schema later.
+
+    :param key: The fingerprint of the parsed schema.
+    :param definition: The compiled definition of the schema.
+    :param models: The model classes by name.
+    :param rebuilt: The names of the models that were built by this parse rather than reused.
+    """
+
+    key: str
+    definition: SchemaDefinition
+    models: dict[str, type[DynamicModel]]
+    rebuilt: frozenset[str] = frozenset()
+
+    @property
+    def model(self) -> type[DynamicModel]:
+        """The model class of the schema's root."""
+        return self.models[self.definition.roots["#"]]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    The outcome of validating a batch of records against a model.
+
+    :param instances: The validated instances in the order of the records, with ``None`` in place
+        of every invalid record.
+    :param errors: The validation errors of each invalid record by its index, with locations
+        relative to the record.
+    """
+
+    instances: list[DynamicModel | None]
+    errors: dict[int, list[ErrorDetails]]
+
+    @property
+    def valid(self) -> list[DynamicModel]:
+        """The instances of the valid records, in order."""
+        return [instance for instance in self.instances if instance is not None]
+
+
+@dataclass
+class DriftReport:
+    """
+    Sampled validation of records constructed in trusted mode, to detect upstream schema drift.
+
+    :param sample_every: Fully validate one record in this many, starting with the first.
+    :param constructed: The number of records constructed with this report.
+    :param sampled: The number of records that were validated.
+    :param drifted: The number of validated records that failed validation.
+    :param errors: The validation errors of the most recent failed records.
+    """
+
+    sample_every: int = 100
+    constructed: int = 0
+    sampled: int = 0
+    drifted: int = 0
+    errors: deque[list[ErrorDetails]] = field(default_factory=lambda: deque(maxlen=MAX_DRIFT_ERRORS))
+
+    def __post_init__(self) -> None:
+        if self.sample_every < 1:
+            msg = "sample_every must be at least 1"
+            raise ValueError(msg)
+
+    @property
+    def drift_rate(self) -> float:
+        """The fraction of validated records that failed validation."""
+        return self.drifted / self.sampled if self.sampled else 0.0
+
+    def sample(self) -> bool:
+        """Count a constructed record and return whether it is one to validate."""
+        self.constructed += 1
+        if (self.constructed - 1) % self.sample_every:
+            return False
+        self.sampled += 1
+        return True
+
+    def record(self, error: ValidationError) -> None:
+        """Record the failed validation of a sampled record."""
+        self.drifted += 1
+        self.errors.append(error.errors())
+
+
+class IncrementalParser:
+    """Class to re-parse a changed JSON schema, rebuilding only the models the change affects."""
+
+    def __init__(self, schema: dict):
+        """
+        Initialize the parser.
+
+        :param schema: The JSON schema to parse.
+        """
+        self.schema = schema
+
+    def parse(self, previous: ParseResult | None = None) -> ParseResult:
+        """
+        Parse the schema, reusing the classes of a previous parse wherever possible.
+
+        The compiled definitions of both schemas are compared model by model. A model is rebuilt if
+        its definition changed or if it references a rebuilt model; every other model keeps its
+        class, so existing instances and references to it stay valid.
+
+        :param previous: The result of parsing an earlier version of the schema, if any.
+        :return: The parse result, which holds the root model in :attr:`ParseResult.model`.
+        """
+        key = fingerprint(self.schema)
+        if previous is not None and previous.key == key:
+            return ParseResult(key, previous.definition, previous.models)
+        definition = SchemaCompiler(self.schema).compile()
+        reuse: dict[str, type] = {}
+        if previous is not None:
+            stale = stale_models(previous.definition, definition)
+            reuse = {m.name: previous.models[m.name] for m in definition.models if m.name not in stale}
+        models = ModelBuilder(DynamicModel).build(definition, reuse)
+        return ParseResult(key, definition, models, frozenset(models.keys() - reuse.keys()))
 
 
 class SchemaGenerator:
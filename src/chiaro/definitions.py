@@ -0,0 +1,169 @@
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+# The version of the compiled definition format, part of the on-disk cache key. Bump it whenever the
+# definitions the schema compiler produces for a schema change, so stale cache entries are ignored.
+DEFINITION_FORMAT = 2
+
+# Kinds of type expressions understood by the model builder.
+ANY = "any"
+STRING = "str"
+INTEGER = "int"
+NUMBER = "float"
+BOOLEAN = "bool"
+NULL = "none"
+DATETIME = "datetime"
+DATE = "date"
+TIME = "time"
+UUID = "uuid"
+LITERAL = "literal"
+LIST = "list"
+TUPLE = "tuple"
+DICT = "dict"
+UNION = "union"
+MODEL = "model"
+
+
+@dataclass(frozen=True)
+class TypeDef:
+    """
+    A plain-data description of a field type.
+
+    Type definitions are produced by the schema compiler and consumed by the model builder. They
+    contain no Python classes, so they can be compared, hashed into fingerprints and serialized.
+
+    :param kind: The kind of type, one of the module-level kind constants.
+    :param args: Nested type definitions (list items, dict values, union members, tuple items).
+    :param values: Allowed values for a ``literal`` type.
+    :param ref: The name of the referenced model for a ``model`` type.
+    :param constraints: Pydantic ``Field`` constraints as sorted ``(name, value)`` pairs.
+    """
+
+    kind: str
+    args: tuple["TypeDef", ...] = ()
+    values: tuple[Any, ...] = ()
+    ref: str | None = None
+    constraints: tuple[tuple[str, Any], ...] = ()
+
+    @property
+    def model_refs(self) -> set[str]:
+        """
+        Collect the names of all models referenced by this type.
+
+        :return: The referenced model names.
+        """
+        refs = {self.ref} if self.kind == MODEL and self.ref else set()
+        for arg in self.args:
+            refs |= arg.model_refs
+        return refs
+
+    def renamed(self, names: dict[str, str]) -> "TypeDef":
+        """
+        Rename the models referenced by this type.
+
+        :param names: A mapping of old to new model names; other names are kept.
+        :return: The type with renamed model references.
+        """
+        if not names:
+            return self
+        ref = names.get(self.ref, self.ref) if self.ref is not None else None
+        return replace(self, ref=ref, args=tuple(arg.renamed(names) for arg in self.args))
+
+
+@dataclass(frozen=True)
+class FieldDef:
+    """
+    A plain-data description of a model field.
+
+    :param name: The Python attribute name of the field.
+    :param type: The type of the field.
+    :param required: Whether the field must be present.
+    :param alias: The original property name when it differs from ``name``.
+    :param default: The default value of an optional field.
+    :param description: The description of the field.
+    """
+
+    name: str
+    type: TypeDef
+    required: bool = False
+    alias: str | None = None
+    default: Any = None
+    description: str | None = None
+
+
+@dataclass(frozen=True)
+class ModelDef:
+    """
+    A plain-data description of a dynamic model class.
+
+    :param name: The class name of the model, unique within its schema definition.
+    :param fields: The fields of the model, in schema order.
+    :param extra: The Pydantic ``extra`` behaviour, or ``None`` for the default.
+    :param description: The description of the model, used as its docstring.
+    """
+
+    name: str
+    fields: tuple[FieldDef, ...] = ()
+    extra: str | None = None
+    description: str | None = None
+
+    @property
+    def model_refs(self) -> set[str]:
+        """
+        Collect the names of all models referenced by the fields of this model.
+
+        :return: The referenced model names.
+        """
+        refs: set[str] = set()
+        for field_def in self.fields:
+            refs |= field_def.type.model_refs
+        return refs
+
+    def renamed(self, names: dict[str, str]) -> "ModelDef":
+        """
+        Rename this model and the models referenced by its fields.
+
+        :param names: A mapping of old to new model names; other names are kept.
+        :return: The renamed model definition.
+        """
+        if not names:
+            return self
+        fields = tuple(replace(f, type=f.type.renamed(names)) for f in self.fields)
+        return replace(self, name=names.get(self.name, self.name), fields=fields)
+
+
+@dataclass(frozen=True)
+class SchemaDefinition:
+    """
+    The compiled form of one or more JSON schemas.
+
+    :param models: The model definitions, ordered so that models come after the models they
+        reference wherever the reference graph allows it.
+    :param roots: A mapping of schema keys (``"#"`` for a single schema, ids or positions for a
+        bundle) to root model names.
+    """
+
+    models: tuple[ModelDef, ...]
+    roots: dict[str | int, str] = field(default_factory=dict)
+
+
+def stale_models(previous: SchemaDefinition, current: SchemaDefinition) -> set[str]:
+    """
+    Find the models of a new definition that cannot reuse the classes built for an old one.
+
+    A model is stale if it is new, if its definition changed, or if it references a stale model,
+    directly or through the reference graph. Models in unchanged reference cycles stay fresh.
+
+    :param previous: The definition the existing classes were built from.
+    :param current: The new definition.
+    :return: The names of the models of ``current`` that must be rebuilt.
+    """
+    old = {m.name: m for m in previous.models}
+    models = {m.name: m for m in current.models}
+    fresh = {name for name, model in models.items() if old.get(name) == model}
+    changed = True
+    while changed:
+        stale = {name for name in fresh if not models[name].model_refs <= fresh}
+        fresh -= stale
+        changed = bool(stale)
+    return set(models) - fresh
@@ -0,0 +1,92 @@
+from typing import Any
+from urllib.parse import unquote, urldefrag, urljoin
+
+# Keywords whose values are instance data rather than subschemas.
+DATA_KEYWORDS = frozenset(("const", "default", "enum", "examples"))
+
+
+def escape_pointer(token: str) -> str:
+    """
+    Encode one reference token of a JSON pointer.
+
+    :param token: The raw token.
+    :return: The escaped token.
+    """
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+class SchemaIndex:
+    """
+    Index of every addressable subschema of a JSON schema document.
+
+    The index is built in a single walk of the document and maps each JSON pointer fragment
+    (``"#/definitions/Address"``), each ``$anchor`` of the root resource (``"#address"``) and the
+    absolute URI of every embedded ``$id`` and anchor to its subschema, so resolving a reference is
+    a dictionary lookup.
+    """
+
+    def __init__(self, document: Any, base: str = ""):
+        """
+        Index a document.
+
+        :param document: The JSON schema document.
+        :param base: The URI that relative ``$id`` values of the document resolve against.
+        """
+        self.document = document
+        self.pointers: dict[str, Any] = {}
+        self.resources: dict[str, Any] = {}
+        self.bases: dict[int, str] = {}
+        self._walk(base)
+
+    def __len__(self) -> int:
+        return len(self.pointers)
+
+    def get(self, ref: str) -> Any:
+        """
+        Look up a fragment reference such as ``"#/definitions/Address"`` or ``"#address"``.
+
+        :param ref: The reference, starting with ``#``.
+        :return: The subschema, or ``None`` if the index does not contain it.
+        """
+        target = self.pointers.get(ref)
+        if target is None and "%" in ref:
+            target = self.pointers.get(unquote(ref))
+        return target
+
+    def base(self, resource: Any) -> str:
+        """
+        Get the absolute base URI of an indexed resource.
+
+        :param resource: The document or a subschema with an ``$id``.
+        :return: The base URI, or ``""`` if the resource has none.
+        """
+        return self.bases.get(id(resource), "")
+
+    def _walk(self, base: str) -> None:
+        stack: list[tuple[Any, str, str, bool]] = [(self.document, "#", base, True)]
+        while stack:
+            node, pointer, base, in_root = stack.pop()
+            self.pointers[pointer] = node
+            if isinstance(node, dict):
+                id_ = node.get("$id")
+                anchors = [node.get("$anchor")]
+                if isinstance(id_, str) and id_.startswith("#"):
+                    # Drafts 6 and 7 spell anchors as plain-name fragment ids.
+                    anchors.append(id_[1:])
+                elif isinstance(id_, str):
+                    base = urldefrag(urljoin(base, id_)).url
+                    in_root = in_root and pointer == "#"
+                    self.bases[id(node)] = base
+                    self.resources[base] = node
+                for anchor in anchors:
+                    if isinstance(anchor, str) and anchor:
+                        self.resources[f"{base}#{anchor}"] = node
+                        if in_root:
+                            self.pointers[f"#{anchor}"] = node
+                for key, value in node.items():
+                    if key not in DATA_KEYWORDS and isinstance(value, dict | list):
+                        stack.append((value, f"{pointer}/{escape_pointer(key)}", base, in_root))
+            elif isinstance(node, list):
+                for position, value in enumerate(node):
+                    if isinstance(value, dict | list):
+                        stack.append((value, f"{pointer}/{position}", base, in_root))
@@ -0,0 +1,503 @@
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from types import TracebackType
+from typing import IO, Any, Literal, Self
+
+from pydantic import ValidationError
+from pydantic_core import SchemaValidator, to_json
+
+from .compiler import SchemaCompiler, class_name
+from .definitions import ModelDef, SchemaDefinition, TypeDef
+from .index import SchemaIndex
+from .stream import CHUNK_SIZE, LineError, Source, iter_chunks
+
+# Top-level keys that hold reusable subschemas rather than part of the root model.
+DEFINITION_SECTIONS = ("definitions", "$defs", "components")
+
+# The index of the schema compiled by a worker process, built once by the pool initializer.
+_worker_index: SchemaIndex | None = None
+# The validator and output mode of a validation worker process, set once by the pool initializer.
+_worker_validator: SchemaValidator | None = None
+_worker_mode: str = "python"
+
+Component = tuple[tuple[str, ...], dict[str, TypeDef]]
+NameSources = dict[str, tuple[str | None, str]]
+CompiledComponent = tuple[tuple[ModelDef, ...], dict[str, TypeDef], frozenset[str], NameSources]
+
+
+def reference_graph(schema: dict, index: SchemaIndex | None = None) -> dict[str, set[str]]:
+    """
+    Build the graph of local references reachable from the root of a schema.
+
+    The root is the node ``"#"`` (without its definition sections); every other node is a
+    ``$ref`` string and its edges are the references its subschema depends on, including those
+    pulled in by ``allOf`` members. References that cannot be resolved become nodes without edges,
+    so the error surfaces when they are compiled.
+
+    :param schema: The JSON schema document.
+    :param index: A prebuilt index of ``schema``, if any.
+    :return: A mapping of each reference to the references it depends on.
+    """
+    compiler = SchemaCompiler(schema, index)
+    root = {k: v for k, v in schema.items() if k not in DEFINITION_SECTIONS}
+    graph: dict[str, set[str]] = {}
+    stack = ["#"]
+    while stack:
+        ref = stack.pop()
+        if ref in graph:
+            continue
+        try:
+            target = root if ref == "#" else compiler.resolve(ref)
+        except ValueError:
+            target = None
+        graph[ref] = set(_iter_dependencies(compiler, target))
+        stack.extend(graph[ref] - graph.keys())
+    return graph
+
+
+def strongly_connected_components(graph: dict[str, set[str]]) -> list[tuple[str, ...]]:
+    """
+    Find the strongly connected components of a dependency graph with Tarjan's algorithm.
+
+    :param graph: A mapping of each node to the nodes it depends on.
+    :return: The components, each sorted, with every component after the ones it depends on.
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[tuple[str, ...]] = []
+    for start in sorted(graph):
+        if start in index:
+            continue
+        index[start] = lowlink[start] = len(index)
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(sorted(graph[start])))]
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(sorted(graph.get(successor, ())))))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(tuple(sorted(component)))
+    return components
+
+
+def compile_component(index: SchemaIndex, refs: tuple[str, ...], known: dict[str, TypeDef]) -> CompiledComponent:
+    """
+    Compile the references of one strongly connected component.
+
+    :param index: The index of the JSON schema document.
+    :param refs: The references of the component.
+    :param known: The compiled types of the references the component depends on.
+    :return: The new models, the compiled types of the component's references, the names of the
+        models compiled from inline objects, and how each model's name was chosen (see
+        :attr:`~chiaro.compiler.SchemaCompiler.name_sources`). Inline objects are not folded.
+    """
+    compiler = SchemaCompiler(index.document, index, fold=False)
+    for ref, type_def in known.items():
+        compiler.define(ref, type_def)
+    for ref in refs:
+        compiler.compile_ref(ref)
+    compiled = {ref: type_def for ref, type_def in compiler.definitions.items() if ref not in known}
+    models = tuple(compiler.models.values())
+    return models, compiled, frozenset(compiler.inline_models), compiler.name_sources
+
+
+class ParallelSchemaCompiler:
+    """
+    Compile a large JSON schema into plain-data model definitions using several processes.
+
+    The reference graph of the schema is split into strongly connected components, which are
+    compiled in waves: each wave holds the components whose dependencies are already compiled,
+    and its components are compiled independently in a process pool, without folding inline
+    objects. The parent merges the results and compiles the root, then names the models and folds
+    inline objects in the order a serial compile reaches them, so the definition is the same as
+    a serial compile's whatever the number of workers or the scheduling.
+
+    The worker processes start on first use and are reused by later calls to :meth:`compile`
+    until :meth:`close` is called or the ``with`` block that holds the compiler ends.
+    """
+
+    def __init__(self, schema: dict, workers: int | None = None):
+        """
+        Initialize the compiler.
+
+        :param schema: The JSON schema to compile.
+        :param workers: The number of worker processes, or ``None`` for one per CPU. With a single
+            worker the components are compiled in the calling process.
+        """
+        if workers is not None and workers < 1:
+            msg = "workers must be at least 1"
+            raise ValueError(msg)
+        self.schema = schema
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes, if they were started."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def compile(self) -> SchemaDefinition:
+        """
+        Compile the schema's root and every definition it reaches.
+
+        :return: The schema definition whose ``"#"`` root is the model for the document.
+        """
+        index = SchemaIndex(self.schema)
+        compiler = SchemaCompiler(self.schema, index, fold=False)
+        if not compiler._is_object(compiler._merge_all_of(self.schema)):
+            msg = "The root of a schema must describe an object."
+            raise ValueError(msg)
+        # Reserve the root's name first so that it matches a serial compile.
+        root_name = compiler.reserve(class_name(self.schema.get("title", "Model")))
+        graph = reference_graph(self.schema, index)
+        components = strongly_connected_components(graph)
+        broken = self._broken(compiler, graph, components)
+        waves = self._waves(graph, [c for c in components if "#" not in c and c[0] not in broken])
+        for wave in waves:
+            tasks = [(refs, self._known(compiler, graph, refs)) for refs in wave]
+            if self.workers == 1 or len(tasks) == 1:
+                results: Iterable[CompiledComponent] = (compile_component(index, *t) for t in tasks)
+            else:
+                chunksize = max(1, len(tasks) // (self.workers * 4))
+                results = self._start().map(_compile_in_worker, tasks, chunksize=chunksize)
+            for result in results:
+                self._merge(compiler, result)
+        root = compiler.compile_root(self.schema, "#", name=root_name)
+        return self._serial_definition(compiler, root)
+
+    def _start(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Workers are spawned rather than forked, which is unsafe in threaded parents.
+            context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(self.workers, context, initializer=_init_worker, initargs=(self.schema,))
+        return self._pool
+
+    @staticmethod
+    def _broken(compiler: SchemaCompiler, graph: dict[str, set[str]], components: list[tuple[str, ...]]) -> set[str]:
+        # References reached only through keywords the compiler ignores may not resolve. Components
+        # that depend on such a reference are not compiled on their own; their dependents compile
+        # them if they need them, and report the error then, as a serial compile does.
+        broken: set[str] = set()
+        for component in components:
+            for member in component:
+                if member != "#" and not _resolves(compiler, member):
+                    broken.update(component)
+            if any(r in broken for m in component for r in graph[m]):
+                broken.update(component)
+        return broken
+
+    @staticmethod
+    def _waves(graph: dict[str, set[str]], components: list[tuple[str, ...]]) -> list[list[tuple[str, ...]]]:
+        # Components come after their dependencies, so one pass assigns every component a level.
+        level: dict[str, int] = {}
+        waves: list[list[tuple[str, ...]]] = []
+        for component in components:
+            members = set(component)
+            depth = max((level[r] + 1 for m in component for r in graph[m] if r not in members), default=0)
+            for member in component:
+                level[member] = depth
+            if depth == len(waves):
+                waves.append([])
+            waves[depth].append(component)
+        return waves
+
+    @staticmethod
+    def _known(compiler: SchemaCompiler, graph: dict[str, set[str]], refs: tuple[str, ...]) -> dict[str, TypeDef]:
+        members = set(refs)
+        dependencies = sorted({r for m in refs for r in graph[m]} - members)
+        return {r: compiler.definitions[r] for r in dependencies if r in compiler.definitions}
+
+    @staticmethod
+    def _merge(compiler: SchemaCompiler, component: CompiledComponent) -> None:
+        # Components are compiled in isolation, so their model names can clash with each other;
+        # they only need to be unique until the models are named in serial order.
+        models, compiled, inline, sources = component
+        names = {m.name: compiler.reserve(m.name) for m in models}
+        for model in models:
+            compiler.add_model(model.renamed(names), inline=model.name in inline)
+        for name, (base, suffix) in sources.items():
+            compiler.name_sources[names[name]] = (names[base] if base is not None else None, suffix)
+        for ref, type_def in compiled.items():
+            compiler.define(ref, type_def.renamed(names))
+
+    @staticmethod
+    def _serial_definition(compiler: SchemaCompiler, root: str) -> SchemaDefinition:
+        # A serial compile reserves a model's name when it reaches the model, depth first in field
+        # order, and adds the model, or folds an inline one into an existing model with the same
+        # fields, once its fields are compiled. Replaying that walk over the merged models gives
+        # the same names, the same folds and the same order.
+        names: dict[str, str] = {}
+        taken: set[str] = set()
+        shapes: dict[str, str] = {}
+        models: dict[str, ModelDef] = {}
+
+        def visit(name: str) -> None:
+            base, suffix = compiler.name_sources[name]
+            preferred = names[base] + suffix if base is not None else suffix
+            candidate, count = preferred, 1
+            while candidate in taken:
+                candidate = f"{preferred}{count}"
+                count += 1
+            taken.add(candidate)
+            names[name] = candidate
+            model = compiler.models[name]
+            refs = [ref for field in model.fields for ref in _iter_model_refs(field.type)]
+            for ref in refs:
+                if ref not in names:
+                    visit(ref)
+            model = model.renamed({ref: names[ref] for ref in (name, *refs) if names[ref] != ref})
+            shape = SchemaCompiler._shape(model)
+            if name in compiler.inline_models and shape in shapes:
+                taken.discard(candidate)
+                names[name] = shapes[shape]
+                return
+            models[candidate] = model
+            shapes.setdefault(shape, candidate)
+
+        visit(root)
+        return SchemaDefinition(models=tuple(models.values()), roots={"#": names[root]})
+
+
+class ParallelValidator:
+    """
+    Validate newline-delimited JSON with a pool of worker processes.
+
+    Each worker compiles the schema once, when it starts, into a validator (see
+    :meth:`~chiaro.core.SchemaParser.parse_validator`). The parent only reads the input in chunks of
+    whole lines and ships the raw bytes; workers split and validate them and send back plain dicts,
+    or JSON bytes in ``"json"`` mode. Results come back in input order, and only a few chunks per
+    worker are in flight at a time, so memory use does not grow with the input.
+    """
+
+    def __init__(
+        self,
+        schema: dict,
+        workers: int | None = None,
+        *,
+        mode: Literal["python", "json"] = "python",
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """
+        Initialize the validator; the worker processes start on first use.
+
+        :param schema: The JSON schema to validate against.
+        :param workers: The number of worker processes, or ``None`` for one per CPU. With a single
+            worker the records are validated in the calling process.
+        :param mode: ``"python"`` to return each valid record as a dict, or ``"json"`` to return it
+            as compact JSON bytes, which are cheaper to send between processes.
+        :param chunk_size: The number of bytes to read and send to a worker at a time.
+        """
+        if workers is not None and workers < 1:
+            msg = "workers must be at least 1"
+            raise ValueError(msg)
+        if mode not in ("python", "json"):
+            msg = f"Unknown mode: {mode!r}"
+            raise ValueError(msg)
+        self.schema = schema
+        self.workers = workers or os.cpu_count() or 1
+        self.mode = mode
+        self.chunk_size = chunk_size
+        self._pool: ProcessPoolExecutor | None = None
+        self._validator: SchemaValidator | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes, if they were started."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def validate_ndjson(self, source: Source) -> Iterator[dict | bytes | LineError]:
+        """
+        Validate a newline-delimited JSON file, skipping blank lines.
+
+        :param source: The path of the file, or a file object opened in binary or text mode, which
+            is not closed. Text is encoded as UTF-8 before it is sent to the workers.
+        :return: An iterator over each valid record, as a dict or JSON bytes depending on the mode,
+            and a :class:`~chiaro.stream.LineError` for each invalid one, in file order.
+        """
+        context: AbstractContextManager[IO[Any]] = (
+            open(source, "rb") if isinstance(source, str | os.PathLike) else nullcontext(source)  # noqa: SIM115
+        )
+        with context as file:
+            chunks = iter_chunks(file, self.chunk_size)
+            yield from self.validate_chunks((first, _encode(chunk)) for first, chunk in chunks)
+
+    def validate_chunks(self, chunks: Iterable[tuple[int, bytes]]) -> Iterator[dict | bytes | LineError]:
+        """
+        Validate chunks of newline-delimited JSON.
+
+        :param chunks: The number of the first line of each chunk and the chunk, which must hold
+            whole lines, as produced by :func:`~chiaro.stream.iter_chunks`.
+        :return: An iterator over the results of the chunks' lines, in order.
+        """
+        if self.workers == 1:
+            if self._validator is None:
+                self._validator = _compile_validator(self.schema)
+            for chunk in chunks:
+                yield from validate_chunk(self._validator, chunk, self.mode)
+            return
+        pool = self._start()
+        pending: deque[Future[list[dict | bytes | LineError]]] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_validate_in_worker, chunk))
+            if len(pending) >= self.workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    def _start(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Workers are spawned rather than forked, which is unsafe in threaded parents.
+            context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(
+                self.workers, context, initializer=_init_validator, initargs=(self.schema, self.mode)
+            )
+        return self._pool
+
+
+def validate_chunk(
+    validator: SchemaValidator,
+    chunk: tuple[int, bytes],
+    mode: str = "python",
+) -> list[dict | bytes | LineError]:
+    """
+    Validate the lines of one chunk of newline-delimited JSON, skipping blank lines.
+
+    :param validator: The validator of the records.
+    :param chunk: The number of the chunk's first line and the chunk.
+    :param mode: ``"python"`` to return valid records as dicts, or ``"json"`` as JSON bytes.
+    :return: The result of each non-blank line, in order.
+    """
+    first, lines = chunk
+    results: list[dict | bytes | LineError] = []
+    for number, line in enumerate(lines.split(b"\n"), first):
+        if not line or line.isspace():
+            continue
+        try:
+            record = validator.validate_json(line)
+        except ValidationError as error:
+            results.append(LineError(number, error.errors()))
+            continue
+        results.append(to_json(record) if mode == "json" else record)
+    return results
+
+
+def _encode(chunk: str | bytes) -> bytes:
+    return chunk.encode() if isinstance(chunk, str) else chunk
+
+
+def _iter_model_refs(type_def: TypeDef) -> Iterator[str]:
+    # The models a type references, in the order the compiler reaches them.
+    if type_def.ref is not None:
+        yield type_def.ref
+    for arg in type_def.args:
+        yield from _iter_model_refs(arg)
+
+
+def _iter_dependencies(compiler: SchemaCompiler, schema: Any) -> Iterator[str]:
+    inlined: set[str] = set()
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                yield ref
+            members = node.get("allOf")
+            # allOf members that are references are inlined, so their own references count too.
+            for member in members if isinstance(members, list) else ():
+                ref = member.get("$ref") if isinstance(member, dict) else None
+                if isinstance(ref, str) and ref not in inlined:
+                    inlined.add(ref)
+                    try:
+                        stack.append(compiler.resolve(ref))
+                    except ValueError:
+                        continue
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def _resolves(compiler: SchemaCompiler, ref: str) -> bool:
+    try:
+        compiler.resolve(ref)
+    except ValueError:
+        return False
+    return True
+
+
+def _init_worker(schema: dict) -> None:
+    global _worker_index
+    _worker_index = SchemaIndex(schema)
+
+
+def _compile_in_worker(task: Component) -> CompiledComponent:
+    assert _worker_index is not None, "worker was not initialized"
+    return compile_component(_worker_index, *task)
+
+
+def _compile_validator(schema: dict) -> SchemaValidator:
+    # Imported here because the core module builds on this one.
+    from .core import SchemaParser
+
+    return SchemaParser(schema).parse_validator()
+
+
+def _init_validator(schema: dict, mode: str) -> None:
+    global _worker_validator, _worker_mode
+    _worker_validator = _compile_validator(schema)
+    _worker_mode = mode
+
+
+def _validate_in_worker(chunk: tuple[int, bytes]) -> list[dict | bytes | LineError]:
+    assert _worker_validator is not None, "worker was not initialized"
+    return validate_chunk(_worker_validator, chunk, _worker_mode)
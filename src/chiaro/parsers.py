@@ -1,4 +1,6 @@
-from .core import DynamicModel, SchemaParser
+from collections.abc import Iterable
+
+from .core import DynamicModel, SchemaBundleParser, SchemaParser
 
 
 def parse_json_schema(schema: dict) -> type[DynamicModel]:
@@ -10,3 +12,16 @@ def parse_json_schema(schema: dict) -> type[DynamicModel]:
     """
     parser = SchemaParser(schema)
     return parser.parse()
+
+
+def parse_json_schemas(schemas: Iterable[dict]) -> dict[str | int, type[DynamicModel]]:
+    """
+    Parse a bundle of JSON schemas into dynamic Pydantic models.
+
+    Definitions shared by several schemas are resolved and compiled only once.
+
+    :param schemas: The JSON schemas to parse.
+    :return: A mapping of each schema's ``$id`` (or position, if it has none) to its model class.
+    """
+    parser = SchemaBundleParser(schemas)
+    return parser.parse()
@@ -1,6 +1,7 @@
+from collections.abc import Iterable
 from typing import Any
 
-from .core import DynamicModel
+from .core import BatchResult, DynamicModel
 
 
 class TypedQueryEngine:
@@ -29,7 +30,7 @@ class TypedQueryEngine:
         """
         self.model = model
 
-    def query(self, query_string: str) -> Any:  # noqa: ANN401
+    def query(self, query_string: str) -> Any:
         """
         Execute a type-safe query on the model's data.
 
@@ -49,18 +50,37 @@ class TypedQuery:
         :param model: The Pydantic model class to query.
         """
         self.model = model
-        self.query_parts = []
+        self.query_parts: list[str] = []
+        self.selected: list[str] = []
+
+    @property
+    def projection(self) -> type[DynamicModel]:
+        """The model to validate records against: a projection on the selected fields, if any."""
+        return self.model.projection(*self.selected) if self.selected else self.model
 
     def select(self, *fields: str) -> "TypedQuery":
         """
         Specify the fields to select in the query.
 
-        :param fields: The fields to select.
+        Records are then validated only against the selected fields (see :attr:`projection`).
+        Repeated calls add to the selection, so ``select("a").select("b")`` selects both fields.
+
+        :param fields: The fields to select, which may be dotted paths into nested models.
         :return: The TypedQuery instance for method chaining.
         """
         self.query_parts.append(f"SELECT {', '.join(fields)}")
+        self.selected.extend(fields)
         return self
 
+    def validate(self, records: Iterable[Any]) -> BatchResult:
+        """
+        Validate input records against the query's projection.
+
+        :param records: The records to validate.
+        :return: The instances of the valid records and the errors of the invalid ones.
+        """
+        return self.projection.validate_many(records)
+
     def where(self, condition: str) -> "TypedQuery":
         """
         Specify the condition for the query.
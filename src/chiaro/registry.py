@@ -2,7 +2,12 @@ from collections.abc import Callable
 
 
 class TypeRegistry:
-    """Singleton class to maintain custom type definitions and their serialization/deserialization logic."""
+    """
+    Singleton class to maintain custom type definitions and their serialization/deserialization logic.
+
+    The built-in custom types are registered when the registry is first used, rather than when
+    chiaro is imported.
+    """
 
     _instance = None
     _types: dict[str, dict[str, Callable]] = {}
@@ -10,6 +15,10 @@ class TypeRegistry:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            # Imported here because the types module registers itself through this class.
+            from .types import register_custom_types
+
+            register_custom_types()
         return cls._instance
 
     def register_type(self, type_name: str, serializer: Callable, deserializer: Callable) -> None:
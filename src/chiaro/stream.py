@@ -0,0 +1,102 @@
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import ErrorDetails
+
+if TYPE_CHECKING:
+    from .core import DynamicModel
+
+CHUNK_SIZE = 1 << 20
+
+Source = str | os.PathLike[str] | IO[bytes] | IO[str]
+
+
+@dataclass(frozen=True)
+class LineError:
+    """
+    The validation errors of one line of a newline-delimited JSON file.
+
+    :param line: The line number, counted from 1 and including blank lines.
+    :param errors: The validation errors; a line that is not valid JSON has a ``json_invalid`` error.
+    """
+
+    line: int
+    errors: list[ErrorDetails]
+
+
+def iter_chunks[T: (str, bytes)](file: IO[T], chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[int, T]]:
+    """
+    Read a file in large chunks that end at line boundaries.
+
+    A line that spans reads is joined from its parts, so chunks hold whole lines and are only
+    longer than ``chunk_size`` when a single line is.
+
+    :param file: The file to read, opened in binary or text mode.
+    :param chunk_size: The number of bytes or characters to read at a time.
+    :return: An iterator over the number of the first line of each chunk and the chunk.
+    """
+    pending: list[T] = []
+    number = 1
+    while chunk := file.read(chunk_size):
+        newline = b"\n" if isinstance(chunk, bytes) else "\n"
+        end = chunk.rfind(newline) + 1
+        if not end:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:end])
+        lines = chunk[:0].join(pending)
+        yield number, lines
+        number += lines.count(newline)
+        pending = [chunk[end:]]
+    rest = pending[0][:0].join(pending) if pending else None
+    if rest:
+        yield number, rest
+
+
+def validate_ndjson(
+    source: Source,
+    model: type[BaseModel],
+    *,
+    chunk_size: int = CHUNK_SIZE,
+    fields: Iterable[str] | None = None,
+) -> Iterator[BaseModel | LineError]:
+    """
+    Validate a newline-delimited JSON file record by record, in bounded memory.
+
+    The file is read in chunks of whole lines (see :func:`iter_chunks`) and each line is validated
+    on its own with ``model_validate_json`` as soon as its chunk is split, so a malformed line
+    cannot shift the records after it. Blank lines are skipped. Memory use depends on the chunk
+    size, not on the size of the file.
+
+    :param source: The path of the file, or a file object opened in binary or text mode, which is
+        not closed.
+    :param model: The model to validate each record against.
+    :param chunk_size: The number of bytes to read at a time.
+    :param fields: The fields to validate, as for :meth:`~chiaro.core.DynamicModel.projection`;
+        records are then instances of the projection of ``model``, which must be a dynamic model.
+    :return: An iterator over the instance of each valid record and a :class:`LineError` for each
+        invalid one, in file order.
+    """
+    if fields is not None:
+        model = cast("type[DynamicModel]", model).projection(*fields)
+    return _validate_lines(source, model, chunk_size)
+
+
+def _validate_lines(source: Source, model: type[BaseModel], chunk_size: int) -> Iterator[BaseModel | LineError]:
+    validate = model.model_validate_json
+    context: AbstractContextManager[IO[Any]] = (
+        open(source, "rb") if isinstance(source, str | os.PathLike) else nullcontext(source)  # noqa: SIM115
+    )
+    with context as file:
+        for first, chunk in iter_chunks(file, chunk_size):
+            for number, line in enumerate(chunk.split(b"\n" if isinstance(chunk, bytes) else "\n"), first):
+                if not line or line.isspace():
+                    continue
+                try:
+                    yield validate(line)
+                except ValidationError as error:
+                    yield LineError(number, error.errors())
@@ -0,0 +1,69 @@
+import pytest
+
+from chiaro.compiler import SchemaCompiler
+from chiaro.core import DynamicModel
+from chiaro.parsers import parse_json_schemas
+
+ADDRESS = {
+    "type": "object",
+    "title": "Address",
+    "properties": {"street": {"type": "string"}, "city": {"type": "string"}},
+    "required": ["street"],
+}
+
+
+def test_parse_json_schemas_keys_by_id_and_position():
+    models = parse_json_schemas([
+        {"$id": "https://example.com/person.json", "type": "object", "properties": {"name": {"type": "string"}}},
+        {"type": "object", "properties": {"sku": {"type": "string"}}},
+    ])
+    assert set(models) == {"https://example.com/person.json", 1}
+    assert all(issubclass(model, DynamicModel) for model in models.values())
+    assert models[1](sku="A-1").sku == "A-1"
+
+
+def test_shared_definitions_compile_once():
+    person = {
+        "type": "object",
+        "title": "Person",
+        "properties": {"home": {"$ref": "#/definitions/Address"}},
+        "definitions": {"Address": ADDRESS},
+    }
+    company = {
+        "type": "object",
+        "title": "Company",
+        "properties": {"office": {"$ref": "#/$defs/Address"}},
+        "$defs": {"Address": ADDRESS},
+    }
+    models = parse_json_schemas([person, company])
+    home = models[0].model_fields["home"].annotation
+    office = models[1].model_fields["office"].annotation
+    assert home is office
+    assert models[0](home={"street": "Main St"}).home.street == "Main St"
+
+
+def test_identical_schemas_share_a_root():
+    compiler = SchemaCompiler()
+    definition = compiler.compile_many([ADDRESS, dict(ADDRESS)])
+    assert definition.roots[0] == definition.roots[1]
+    assert len(definition.models) == 1
+
+
+def test_cross_document_references():
+    address = {"$id": "https://example.com/address.json", **ADDRESS}
+    person = {
+        "$id": "https://example.com/person.json",
+        "type": "object",
+        "properties": {"home": {"$ref": "address.json"}, "work": {"$ref": "https://example.com/address.json"}},
+    }
+    models = parse_json_schemas([person, address])
+    address_model = models["https://example.com/address.json"]
+    person_model = models["https://example.com/person.json"]
+    assert person_model.model_fields["home"].annotation is address_model
+    assert person_model.model_fields["work"].annotation is address_model
+
+
+def test_duplicate_ids_are_rejected():
+    schema = {"$id": "https://example.com/a.json", "type": "object", "properties": {}}
+    with pytest.raises(ValueError, match="Duplicate"):
+        parse_json_schemas([schema, schema])
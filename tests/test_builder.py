@@ -0,0 +1,82 @@
+import pytest
+from pydantic_core import ValidationError
+
+from chiaro.builder import CoreSchemaBuilder
+from chiaro.compiler import SchemaCompiler
+from chiaro.core import SchemaParser
+
+SCHEMA = {
+    "title": "Order",
+    "type": "object",
+    "properties": {
+        "id": {"type": "string", "pattern": "^[A-Z]+-[0-9]+$"},
+        "quantity": {"type": "integer", "minimum": 1, "maximum": 10},
+        "price": {"type": "number", "exclusiveMinimum": 0},
+        "status": {"enum": ["new", "paid"]},
+        "kind": {"const": "order"},
+        "tags": {"type": "array", "items": {"type": "string", "maxLength": 3}, "maxItems": 2},
+        "point": {"type": "array", "prefixItems": [{"type": "number"}, {"type": "number"}]},
+        "ref": {"oneOf": [{"type": "integer"}, {"type": "string"}]},
+        "note": {"type": ["string", "null"], "default": "none"},
+        "parent": {"$ref": "#"},
+        "class": {"type": "boolean"},
+    },
+    "required": ["id", "quantity"],
+    "additionalProperties": False,
+}
+
+VALID = {
+    "id": "AB-1",
+    "quantity": 2,
+    "price": 9.5,
+    "status": "paid",
+    "kind": "order",
+    "tags": ["a", "bc"],
+    "point": [1, 2.5],
+    "ref": "x",
+    "parent": {"id": "AB-0", "quantity": 1},
+    "class": True,
+}
+
+INVALID = [
+    {"id": "ab-1", "quantity": 2},
+    {"id": "AB-1", "quantity": 0},
+    {"id": "AB-1", "quantity": 2, "price": 0},
+    {"id": "AB-1", "quantity": 2, "status": "lost"},
+    {"id": "AB-1", "quantity": 2, "kind": "invoice"},
+    {"id": "AB-1", "quantity": 2, "tags": ["a", "b", "c"]},
+    {"id": "AB-1", "quantity": 2, "tags": ["abcd"]},
+    {"id": "AB-1", "quantity": 2, "point": [1]},
+    {"id": "AB-1", "quantity": 2, "ref": 1.5},
+    {"id": "AB-1", "quantity": 2, "parent": {"id": "AB-0"}},
+    {"id": "AB-1", "quantity": 2, "unknown": 1},
+    {"quantity": 2},
+]
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return CoreSchemaBuilder().validator(SchemaCompiler(SCHEMA).compile())
+
+
+def test_validates_into_dicts_keyed_by_property(validator):
+    result = validator.validate_python(VALID)
+    assert result["class"] is True
+    assert result["point"] == (1.0, 2.5)
+    assert result["note"] == "none"
+    assert result["parent"]["parent"] is None
+    assert validator.validate_json(b'{"id": "AB-1", "quantity": 3}')["quantity"] == 3
+
+
+@pytest.mark.parametrize("data", INVALID)
+def test_rejects_what_the_model_backend_rejects(validator, data):
+    model_cls = SchemaParser(SCHEMA, cache=None).parse()
+    with pytest.raises(ValidationError):
+        model_cls.model_validate(data)
+    with pytest.raises(ValidationError):
+        validator.validate_python(data)
+
+
+def test_parser_builds_validator():
+    validator = SchemaParser(SCHEMA, cache=None).parse_validator()
+    assert validator.validate_python({"id": "A-1", "quantity": 1})["id"] == "A-1"
@@ -0,0 +1,99 @@
+import pytest
+
+from chiaro.cache import DiskCache, ModelCache, fingerprint
+from chiaro.compiler import SchemaCompiler
+from chiaro.core import DynamicModel, SchemaParser
+from chiaro.definitions import DEFINITION_FORMAT
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "string"}, "age": {"type": "integer", "minimum": 0}},
+    "required": ["id"],
+}
+
+
+def test_fingerprint_ignores_key_order():
+    reordered = {"required": ["id"], "properties": {"age": {"minimum": 0, "type": "integer"}, "id": {"type": "string"}}}
+    reordered["type"] = "object"
+    assert fingerprint(SCHEMA) == fingerprint(reordered)
+    assert fingerprint(SCHEMA) != fingerprint({**SCHEMA, "required": []})
+
+
+def test_parser_returns_cached_class():
+    cache = ModelCache()
+    first = SchemaParser(SCHEMA, cache=cache).parse()
+    second = SchemaParser(dict(reversed(SCHEMA.items())), cache=cache).parse()
+    assert first is second
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_parser_without_cache_compiles_new_class():
+    assert SchemaParser(SCHEMA, cache=None).parse() is not SchemaParser(SCHEMA, cache=None).parse()
+
+
+def test_from_schema_uses_process_wide_cache():
+    assert DynamicModel.from_schema(SCHEMA) is DynamicModel.from_schema(SCHEMA)
+
+
+def test_lru_eviction():
+    cache = ModelCache(maxsize=2)
+    cache.put("a", int)
+    cache.put("b", str)
+    assert cache.get("a") is int
+    cache.put("c", float)
+    assert "b" not in cache
+    assert "a" in cache
+    assert cache.stats().evictions == 1
+
+
+def test_put_keeps_first_model():
+    cache = ModelCache()
+    assert cache.put("a", int) is int
+    assert cache.put("a", str) is int
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError, match="maxsize"):
+        ModelCache(maxsize=0)
+
+
+def test_disk_cache_rebuilds_without_compiling(tmp_path, monkeypatch):
+    disk = DiskCache(tmp_path)
+    first = SchemaParser(SCHEMA, cache=None, disk_cache=disk).parse()
+    assert disk.path(fingerprint(SCHEMA)).exists()
+    assert disk.directory.parent == tmp_path
+
+    def fail(self):
+        raise AssertionError("schema was compiled again")
+
+    monkeypatch.setattr(SchemaCompiler, "compile", fail)
+    second = SchemaParser(SCHEMA, cache=None, disk_cache=DiskCache(tmp_path)).parse()
+    assert second is not first
+    assert second.model_json_schema() == first.model_json_schema()
+    assert second(id="1", age=2).age == 2
+
+
+def test_disk_cache_ignores_corrupt_entries(tmp_path):
+    disk = DiskCache(tmp_path)
+    key = fingerprint(SCHEMA)
+    disk.directory.mkdir(parents=True)
+    disk.path(key).write_text("{not json")
+    assert disk.load(key) is None
+    SchemaParser(SCHEMA, cache=None, disk_cache=disk).parse()
+    assert disk.load(key) is not None
+    assert not list(disk.directory.glob("*.tmp"))
+
+
+def test_disk_cache_is_keyed_by_definition_format(tmp_path, monkeypatch):
+    SchemaParser(SCHEMA, cache=None, disk_cache=DiskCache(tmp_path)).parse()
+    assert DiskCache(tmp_path).load(fingerprint(SCHEMA)) is not None
+    monkeypatch.setattr("chiaro.cache.DEFINITION_FORMAT", DEFINITION_FORMAT + 1)
+    assert DiskCache(tmp_path).load(fingerprint(SCHEMA)) is None
+
+
+def test_disk_cache_clear(tmp_path):
+    disk = DiskCache(tmp_path)
+    SchemaParser(SCHEMA, cache=None, disk_cache=disk).parse()
+    disk.clear()
+    assert disk.load(fingerprint(SCHEMA)) is None
@@ -0,0 +1,130 @@
+import importlib
+import json
+import math
+
+import pytest
+from pydantic import ValidationError
+
+from chiaro.cli import main
+from chiaro.codegen import ModuleRenderer, compile_schemas, module_name
+from chiaro.compiler import SchemaCompiler, class_name
+from chiaro.core import DynamicModel, SchemaParser
+
+SCHEMA = {
+    "title": "Order",
+    "type": "object",
+    "description": 'An "order".',
+    "properties": {
+        "id": {"type": "string", "pattern": "^A"},
+        "field": {"$ref": "#/definitions/Field"},
+        "when": {"type": "string", "format": "date-time"},
+        "kind": {"enum": ["a", 1]},
+        "str": {"type": "integer", "default": 3},
+        "tags": {"type": "array", "items": {"type": "string", "maxLength": 2}},
+        "class": {"type": ["string", "null"]},
+    },
+    "required": ["id"],
+    "additionalProperties": False,
+    "definitions": {
+        "Field": {"type": "object", "properties": {"back": {"$ref": "#"}, "n": {"$ref": "#/definitions/None"}}},
+        "None": {"type": "object", "properties": {"x": {"type": "number", "minimum": 0}}},
+    },
+}
+
+VALID = {"id": "A1", "field": {"back": {"id": "A2"}, "n": {"x": 1}}, "kind": 1, "class": None, "tags": ["ab"]}
+INVALID = [
+    {"id": "B1"},
+    {"id": "A1", "tags": ["abc"]},
+    {"id": "A1", "other": 1},
+    {"id": "A1", "field": {"n": {"x": -1}}},
+]
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch, request):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    name = f"models_{request.node.name.replace('[', '_').replace(']', '_').replace('-', '_')}"
+    return name, tmp_path / name
+
+
+def test_module_name():
+    assert module_name("schemas/Order-Schema.v1.json") == "order_schema"
+    assert module_name("1st.json") == "schema_1st"
+    assert module_name("class.json") == "schema_class"
+
+
+def test_class_names_avoid_keywords():
+    assert class_name("None") == "NoneModel"
+
+
+def test_generated_module_matches_runtime_model(package):
+    name, directory = package
+    schema_path = directory.parent / "order.json"
+    schema_path.write_text(json.dumps(SCHEMA))
+    written = compile_schemas([schema_path], directory)
+    assert written == [directory / "order.py"]
+    assert list((directory / "__pycache__").glob("order.*.pyc"))
+
+    module = importlib.import_module(f"{name}.order")
+    assert module.__all__[0] == "Order"
+    generated = module.Order
+    runtime = SchemaParser(SCHEMA, cache=None).parse()
+    assert issubclass(generated, DynamicModel)
+    assert generated.__doc__ == 'An "order".'
+    assert generated.model_validate(VALID).model_dump() == runtime.model_validate(VALID).model_dump()
+    for data in INVALID:
+        with pytest.raises(ValidationError):
+            runtime.model_validate(data)
+        with pytest.raises(ValidationError):
+            generated.model_validate(data)
+
+
+def test_non_finite_floats_are_rendered_as_expressions(package):
+    name, directory = package
+    inf = float("inf")
+    schema = {
+        "title": "Reading",
+        "type": "object",
+        "properties": {
+            "value": {"type": "number", "default": inf, "maximum": inf},
+            "limits": {"type": "array", "items": {"type": "number"}, "default": [-inf, float("nan")]},
+            "kind": {"enum": [inf, "x"]},
+        },
+    }
+    schema_path = directory.parent / "reading.json"
+    schema_path.write_text(json.dumps(schema))
+    compile_schemas([schema_path], directory)
+    reading = importlib.import_module(f"{name}.reading").Reading
+    assert reading().value == inf
+    assert reading().limits[0] == -inf
+    assert math.isnan(reading().limits[1])
+    assert reading(kind=inf).kind == inf
+
+
+def test_imported_names_are_qualified_when_models_shadow_them():
+    source = ModuleRenderer().render(SchemaCompiler(SCHEMA).compile(), source="order.json")
+    assert "class Field(DynamicModel):" in source
+    assert "pydantic.Field(None, ge=0)" in source
+    assert "from typing import Annotated, Any, Literal, Union" not in source
+    assert "Field.model_rebuild()" in source
+
+
+def test_duplicate_module_names_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="same module"):
+        compile_schemas([tmp_path / "a.json", tmp_path / "sub" / "a.json"], tmp_path / "out")
+
+
+def test_cli_compile(package, capsys):
+    name, directory = package
+    schema_path = directory.parent / "order.json"
+    schema_path.write_text(json.dumps(SCHEMA))
+    assert main(["compile", str(schema_path), "-o", str(directory)]) == 0
+    assert capsys.readouterr().out.strip() == str(directory / "order.py")
+    assert importlib.import_module(f"{name}.order").Order(id="A1").str == 3
+
+
+def test_cli_reports_errors(tmp_path, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["compile", str(tmp_path / "missing.json"), "-o", str(tmp_path / "out")])
+    assert excinfo.value.code == 1
+    assert "chiaro: error:" in capsys.readouterr().err
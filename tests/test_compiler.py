@@ -0,0 +1,113 @@
+import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from chiaro.compiler import SchemaCompiler
+from chiaro.core import DynamicModel, SchemaParser
+
+
+def parse(schema: dict) -> type[DynamicModel]:
+    return SchemaParser(schema, cache=None).parse()
+
+
+def test_scalar_types_and_constraints():
+    model_cls = parse({
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "minLength": 1},
+            "age": {"type": "integer", "minimum": 0},
+            "createdAt": {"type": "string", "format": "date-time"},
+        },
+        "required": ["name"],
+    })
+    instance = model_cls(name="a", age=1, createdAt="2023-01-01T00:00:00")
+    assert instance.createdAt == datetime.datetime(2023, 1, 1)
+    with pytest.raises(ValidationError):
+        model_cls(name="", age=1)
+    with pytest.raises(ValidationError):
+        model_cls(name="a", age=-1)
+    with pytest.raises(ValidationError):
+        model_cls(age=1)
+
+
+def test_enum_const_and_nullable():
+    model_cls = parse({
+        "type": "object",
+        "properties": {
+            "kind": {"enum": ["a", "b"]},
+            "version": {"const": 1},
+            "note": {"type": ["string", "null"]},
+        },
+    })
+    assert model_cls(kind="a", version=1, note=None).kind == "a"
+    with pytest.raises(ValidationError):
+        model_cls(kind="c")
+
+
+def test_refs_and_recursion():
+    model_cls = parse({
+        "title": "Node",
+        "type": "object",
+        "properties": {
+            "children": {"type": "array", "items": {"$ref": "#"}},
+            "address": {"$ref": "#/definitions/Address"},
+        },
+        "definitions": {"Address": {"type": "object", "properties": {"street": {"type": "string"}}}},
+    })
+    instance = model_cls(children=[{"children": []}], address={"street": "Main"})
+    assert type(instance.children[0]) is model_cls
+    assert instance.address.street == "Main"
+
+
+def test_invalid_property_names_are_aliased():
+    model_cls = parse({"type": "object", "properties": {"class": {"type": "string"}, "a-b": {"type": "string"}}})
+    instance = model_cls.model_validate({"class": "x", "a-b": "y"})
+    assert instance.model_dump(by_alias=True) == {"class": "x", "a-b": "y"}
+
+
+def test_additional_properties_false_forbids_extra():
+    model_cls = parse({"type": "object", "properties": {"a": {"type": "string"}}, "additionalProperties": False})
+    with pytest.raises(ValidationError):
+        model_cls(a="x", b="y")
+
+
+def test_root_must_be_object():
+    with pytest.raises(ValueError, match="object"):
+        parse({"type": "string"})
+
+
+def test_identical_inline_objects_share_a_model():
+    money = {"type": "object", "properties": {"amount": {"type": "number"}, "currency": {"type": "string"}}}
+    reordered = {"properties": {"amount": {"type": "number"}, "currency": {"type": "string"}}, "type": "object"}
+    model_cls = parse({
+        "type": "object",
+        "properties": {
+            "price": money,
+            "tax": reordered,
+            "discount": {**money, "title": "Discount"},
+            "limit": {"type": "object", "properties": {"amount": {"type": "integer"}}},
+            "lines": {"type": "array", "items": {"type": "object", "properties": {"total": money}}},
+        },
+    })
+    fields = model_cls.model_fields
+    price = fields["price"].annotation
+    assert fields["tax"].annotation is price
+    assert fields["discount"].annotation is price
+    assert fields["limit"].annotation is not price
+    assert fields["lines"].annotation.__args__[0].model_fields["total"].annotation is price
+
+
+def test_inline_objects_reuse_identical_definitions():
+    schema = {
+        "type": "object",
+        "properties": {
+            "home": {"$ref": "#/definitions/Address"},
+            "work": {"type": "object", "properties": {"city": {"type": "string"}}},
+        },
+        "definitions": {"Address": {"type": "object", "properties": {"city": {"type": "string"}}}},
+    }
+    definition = SchemaCompiler(schema).compile()
+    assert [m.name for m in definition.models] == ["Address", "Model"]
+    model_cls = parse(schema)
+    assert model_cls.model_fields["work"].annotation is model_cls.model_fields["home"].annotation
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import chiaro
+from chiaro.registry import TypeRegistry
+
+
+def run(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run a fresh interpreter, without the coverage hooks of the test process."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("COV_CORE")}
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True, env=env)
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Run a statement under ``python -X importtime`` and return cumulative microseconds by module."""
+    result = run("-X", "importtime", "-c", statement)
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def test_import_does_not_load_submodules():
+    times = import_times("import chiaro")
+    assert "chiaro" in times
+    loaded = {name for name in times if name.startswith(("chiaro.", "pydantic"))}
+    assert loaded == set()
+
+
+def test_import_does_not_load_heavy_modules():
+    loaded = set(run("-c", "import sys, chiaro; print(*sys.modules)").stdout.split())
+    assert "chiaro" in loaded
+    assert loaded.isdisjoint({"chiaro.core", "chiaro.compiler", "chiaro.parallel", "chiaro.codegen", "pydantic"})
+
+
+def test_public_names_resolve_lazily():
+    assert chiaro.DynamicModel is sys.modules["chiaro.core"].DynamicModel
+    assert "SchemaParser" in dir(chiaro)
+    with pytest.raises(AttributeError, match="no_such_name"):
+        chiaro.no_such_name  # noqa: B018
+
+
+def test_builtin_types_are_registered_on_first_use():
+    assert TypeRegistry().get_serializer("DateTime") is not None
@@ -0,0 +1,73 @@
+import copy
+
+from chiaro.core import IncrementalParser
+from chiaro.definitions import (
+    FieldDef,
+    ModelDef,
+    SchemaDefinition,
+    TypeDef,
+    stale_models,
+)
+
+SCHEMA = {
+    "title": "Order",
+    "type": "object",
+    "properties": {
+        "customer": {"$ref": "#/definitions/Customer"},
+        "lines": {"type": "array", "items": {"$ref": "#/definitions/Line"}},
+    },
+    "definitions": {
+        "Customer": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "address": {"$ref": "#/definitions/Address"}},
+        },
+        "Address": {"type": "object", "properties": {"city": {"type": "string"}}},
+        "Line": {
+            "type": "object",
+            "properties": {"sku": {"type": "string"}, "parent": {"$ref": "#/definitions/Line"}},
+        },
+    },
+}
+
+
+def model(name, *refs):
+    fields = tuple(FieldDef(name=r.lower(), type=TypeDef("model", ref=r)) for r in refs)
+    return ModelDef(name=name, fields=fields)
+
+
+def test_stale_models_follow_references():
+    previous = SchemaDefinition(models=(model("A"), model("B", "A"), model("C", "C"), model("D", "B")))
+    current = SchemaDefinition(models=(model("A", "C"), model("B", "A"), model("C", "C"), model("D", "B")))
+    assert stale_models(previous, current) == {"A", "B", "D"}
+    assert stale_models(current, current) == set()
+
+
+def test_unchanged_models_keep_their_identity():
+    first = IncrementalParser(SCHEMA).parse()
+    assert first.rebuilt == {"Order", "Customer", "Address", "Line"}
+    changed = copy.deepcopy(SCHEMA)
+    changed["definitions"]["Address"]["properties"]["zip"] = {"type": "string"}
+    second = IncrementalParser(changed).parse(first)
+    assert second.rebuilt == {"Order", "Customer", "Address"}
+    assert second.models["Line"] is first.models["Line"]
+    assert second.model is not first.model
+    order = second.model(customer={"address": {"zip": "0150"}}, lines=[{"sku": "A"}])
+    assert order.customer.address.zip == "0150"
+    assert isinstance(order.lines[0], first.models["Line"])
+
+
+def test_unchanged_schema_reuses_everything():
+    first = IncrementalParser(SCHEMA).parse()
+    second = IncrementalParser(copy.deepcopy(SCHEMA)).parse(first)
+    assert second.rebuilt == frozenset()
+    assert second.model is first.model
+
+
+def test_removed_models_are_dropped():
+    first = IncrementalParser(SCHEMA).parse()
+    changed = copy.deepcopy(SCHEMA)
+    del changed["properties"]["lines"]
+    second = IncrementalParser(changed).parse(first)
+    assert "Line" not in second.models
+    assert second.rebuilt == {"Order"}
+    assert second.models["Customer"] is first.models["Customer"]
@@ -0,0 +1,75 @@
+import pytest
+
+from chiaro.compiler import SchemaCompiler
+from chiaro.index import SchemaIndex, escape_pointer
+from chiaro.parsers import parse_json_schemas
+
+SCHEMA = {
+    "$id": "https://example.com/root.json",
+    "type": "object",
+    "properties": {"a/b": {"type": "string"}, "tilde~": {"type": "integer"}},
+    "definitions": {
+        "Item": {"$anchor": "item", "type": "object", "properties": {"tags": {"items": [{"type": "string"}]}}},
+        "Nested": {"$id": "nested.json", "$anchor": "inner", "type": "object", "properties": {}},
+        "Legacy": {"$id": "#legacy", "type": "object"},
+    },
+    "enum": [{"$id": "https://example.com/data.json"}],
+}
+
+
+def test_escape_pointer():
+    assert escape_pointer("a/b~c") == "a~1b~0c"
+
+
+def test_pointers_cover_every_subschema():
+    index = SchemaIndex(SCHEMA)
+    assert index.get("#") is SCHEMA
+    assert index.get("#/properties/a~1b") == {"type": "string"}
+    assert index.get("#/properties/tilde~0") == {"type": "integer"}
+    assert index.get("#/definitions/Item/properties/tags/items/0") == {"type": "string"}
+    assert index.get("#/definitions/Item") is index.get("#item")
+    assert index.get("#legacy") is SCHEMA["definitions"]["Legacy"]
+    assert index.get("#/missing") is None
+
+
+def test_percent_encoded_pointers():
+    index = SchemaIndex({"definitions": {"a b": {"type": "string"}}})
+    assert index.get("#/definitions/a%20b") == {"type": "string"}
+
+
+def test_resources_are_absolute():
+    index = SchemaIndex(SCHEMA)
+    nested = SCHEMA["definitions"]["Nested"]
+    assert index.resources["https://example.com/nested.json"] is nested
+    assert index.resources["https://example.com/nested.json#inner"] is nested
+    assert index.resources["https://example.com/root.json#item"] is SCHEMA["definitions"]["Item"]
+    assert index.base(nested) == "https://example.com/nested.json"
+    # Anchors of embedded resources are not fragments of the root resource.
+    assert index.get("#inner") is None
+    # Instance data is not indexed.
+    assert "https://example.com/data.json" not in index.resources
+
+
+def test_compiler_resolves_through_the_index():
+    compiler = SchemaCompiler(SCHEMA)
+    assert compiler.resolve("#item") is SCHEMA["definitions"]["Item"]
+    assert compiler.resolve("#/enum/0") == {"$id": "https://example.com/data.json"}
+    with pytest.raises(ValueError, match="Unresolvable"):
+        compiler.resolve("#/definitions/Missing")
+
+
+def test_references_to_embedded_resources():
+    models = parse_json_schemas([
+        {
+            "$id": "https://example.com/order.json",
+            "type": "object",
+            "properties": {"line": {"$ref": "line.json"}, "note": {"$ref": "#note"}},
+            "definitions": {
+                "Line": {"$id": "line.json", "type": "object", "properties": {"sku": {"type": "string"}}},
+                "Note": {"$anchor": "note", "type": "object", "properties": {"text": {"type": "string"}}},
+            },
+        }
+    ])
+    order = models["https://example.com/order.json"](line={"sku": "A"}, note={"text": "hi"})
+    assert order.line.sku == "A"
+    assert order.note.text == "hi"
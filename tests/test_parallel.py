@@ -0,0 +1,206 @@
+import io
+import json
+
+import pytest
+
+from chiaro.compiler import SchemaCompiler
+from chiaro.core import SchemaParser
+from chiaro.parallel import (
+    ParallelSchemaCompiler,
+    ParallelValidator,
+    reference_graph,
+    strongly_connected_components,
+)
+from chiaro.stream import LineError, iter_chunks, validate_ndjson
+
+SCHEMA = {
+    "title": "Catalog",
+    "type": "object",
+    "properties": {
+        "products": {"type": "array", "items": {"$ref": "#/definitions/Product"}},
+        "owner": {"$ref": "#/definitions/Person"},
+        "root": {"$ref": "#"},
+    },
+    "definitions": {
+        "Product": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "vendor": {"$ref": "#/definitions/Company"}},
+        },
+        "Company": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "address": {"$ref": "#/definitions/Address"}},
+        },
+        "Person": {
+            "type": "object",
+            "properties": {"friend": {"$ref": "#/definitions/Person"}, "address": {"$ref": "#/definitions/Address"}},
+        },
+        "Address": {"type": "object", "title": "Product", "properties": {"city": {"type": "string"}}},
+        "Unused": {"type": "object", "properties": {}},
+    },
+}
+
+
+def test_reference_graph_is_reachable_part_only():
+    graph = reference_graph(SCHEMA)
+    assert graph["#"] == {"#", "#/definitions/Product", "#/definitions/Person"}
+    assert graph["#/definitions/Person"] == {"#/definitions/Person", "#/definitions/Address"}
+    assert "#/definitions/Unused" not in graph
+
+
+def test_components_follow_their_dependencies():
+    graph = {"a": {"b"}, "b": {"c"}, "c": {"b"}, "d": set()}
+    components = strongly_connected_components(graph)
+    assert components == [("b", "c"), ("a",), ("d",)]
+
+
+def field_models(definition):
+    return {(m.name, f.name): f.type.model_refs for m in definition.models for f in m.fields}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_result_matches_serial_compile(workers):
+    expected = SchemaCompiler(SCHEMA).compile()
+    definition = ParallelSchemaCompiler(SCHEMA, workers=workers).compile()
+    assert field_models(definition) == field_models(expected)
+    assert definition == expected
+    assert definition.roots == {"#": "Catalog"}
+
+
+CLASHING = {
+    "title": "Root",
+    "type": "object",
+    "properties": {"z": {"$ref": "#/$defs/Z"}, "a": {"$ref": "#/$defs/A"}},
+    "$defs": {
+        "Z": {"title": "Thing", "type": "object", "properties": {"x": {"type": "string"}}},
+        "A": {"title": "Thing", "type": "object", "properties": {"y": {"type": "string"}}},
+    },
+}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_clashing_titles_are_named_in_serial_order(workers):
+    definition = ParallelSchemaCompiler(CLASHING, workers=workers).compile()
+    assert field_models(definition)[("Root", "z")] == {"Thing"}
+    assert field_models(definition)[("Root", "a")] == {"Thing1"}
+    assert definition == SchemaCompiler(CLASHING).compile()
+
+
+ADDRESS = {"type": "object", "properties": {"street": {"type": "string"}, "city": {"type": "string"}}}
+
+INLINE = {
+    "title": "Directory",
+    "type": "object",
+    "properties": {
+        "person": {"$ref": "#/definitions/Person"},
+        "company": {"$ref": "#/definitions/Company"},
+        "shop": {"$ref": "#/definitions/Shop"},
+    },
+    "definitions": {
+        "Person": {"type": "object", "properties": {"home": ADDRESS}},
+        "Company": {"type": "object", "properties": {"office": ADDRESS}},
+        "Shop": {"type": "object", "properties": {"site": ADDRESS, "owner": {"not": {"$ref": "#/definitions/Gone"}}}},
+    },
+}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_inline_objects_are_folded_across_components(workers):
+    with ParallelSchemaCompiler(INLINE, workers=workers) as compiler:
+        definition = compiler.compile()
+    assert definition == SchemaCompiler(INLINE).compile()
+    # A serial compile reaches Person first, so the shared model is named after it.
+    assert [m.name for m in definition.models] == ["PersonHome", "Person", "Company", "Shop", "Directory"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_component_errors_propagate(workers):
+    person = {"type": "object", "properties": {"home": {"$ref": "other.json#/Address"}}}
+    schema = {**INLINE, "definitions": {**INLINE["definitions"], "Person": person}}
+    with pytest.raises(ValueError, match="other.json"):
+        ParallelSchemaCompiler(schema, workers=workers).compile()
+
+
+def test_pool_is_reused_until_closed():
+    with ParallelSchemaCompiler(SCHEMA, workers=2) as compiler:
+        first = compiler.compile()
+        pool = compiler._pool
+        assert pool is not None
+        assert compiler.compile() == first
+        assert compiler._pool is pool
+    assert compiler._pool is None
+
+
+def test_parser_builds_parallel_definition():
+    model = SchemaParser(SCHEMA, cache=None, workers=2).parse()
+    catalog = model(products=[{"name": "Pen", "vendor": {"address": {"city": "Oslo"}}}], owner={"friend": {}})
+    assert catalog.products[0].vendor.address.city == "Oslo"
+    assert catalog.owner.friend.friend is None
+
+
+def test_root_must_be_an_object():
+    with pytest.raises(ValueError, match="root"):
+        ParallelSchemaCompiler({"type": "string"}, workers=1).compile()
+    with pytest.raises(ValueError, match="workers"):
+        ParallelSchemaCompiler(SCHEMA, workers=0)
+
+
+READING = {
+    "title": "Reading",
+    "type": "object",
+    "properties": {"sensor": {"type": "string"}, "value": {"type": "number"}},
+    "required": ["sensor", "value"],
+}
+
+
+def ndjson(count):
+    lines = [json.dumps({"sensor": f"s{i}", "value": i}) if i % 5 else '{"sensor": 1}' for i in range(count)]
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+def test_iter_chunks_end_at_line_boundaries():
+    data = ndjson(50)
+    chunks = list(iter_chunks(io.BytesIO(data), chunk_size=64))
+    assert b"".join(c for _, c in chunks) == data
+    assert all(c.endswith(b"\n") for _, c in chunks)
+    firsts = [1 + sum(c.count(b"\n") for _, c in chunks[:i]) for i in range(len(chunks))]
+    assert [first for first, _ in chunks] == firsts
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_validator_preserves_order(workers):
+    with ParallelValidator(READING, workers, chunk_size=100) as validator:
+        results = list(validator.validate_ndjson(io.BytesIO(ndjson(40))))
+    assert len(results) == 40
+    for i, result in enumerate(results):
+        if i % 5:
+            assert result == {"sensor": f"s{i}", "value": i}
+        else:
+            assert isinstance(result, LineError)
+            assert result.line == i + 1
+            assert [e["type"] for e in result.errors] == ["string_type", "missing"]
+
+
+def test_parallel_validator_matches_stream(tmp_path):
+    path = tmp_path / "readings.ndjson"
+    path.write_bytes(ndjson(10))
+    model = SchemaParser(READING).parse()
+    expected = [r if isinstance(r, LineError) else r.model_dump() for r in validate_ndjson(path, model)]
+    with ParallelValidator(READING, 1) as validator, path.open(encoding="utf-8") as text:
+        assert list(validator.validate_ndjson(text)) == expected
+        assert list(validator.validate_ndjson(path)) == expected
+
+
+def test_parallel_validator_json_mode(tmp_path):
+    path = tmp_path / "readings.ndjson"
+    path.write_bytes(ndjson(10))
+    with ParallelValidator(READING, 2, mode="json") as validator:
+        results = list(validator.validate_ndjson(path))
+    assert results[1] == b'{"sensor":"s1","value":1.0}'
+    assert isinstance(results[0], LineError)
+
+
+def test_parallel_validator_rejects_bad_arguments():
+    with pytest.raises(ValueError, match="workers"):
+        ParallelValidator(READING, 0)
+    with pytest.raises(ValueError, match="mode"):
+        ParallelValidator(READING, mode="xml")
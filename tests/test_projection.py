@@ -0,0 +1,99 @@
+import io
+
+import pytest
+
+from chiaro.core import SchemaParser
+from chiaro.queries import TypedQuery
+from chiaro.stream import validate_ndjson
+
+SCHEMA = {
+    "title": "Order",
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "note": {"type": "string", "maxLength": 5},
+        "customer": {"$ref": "#/definitions/Customer"},
+        "lines": {"type": "array", "items": {"$ref": "#/definitions/Line"}},
+        "by-sku": {"type": "object", "additionalProperties": {"$ref": "#/definitions/Line"}},
+        "parent": {"$ref": "#"},
+    },
+    "required": ["id"],
+    "additionalProperties": False,
+    "definitions": {
+        "Customer": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "email": {"type": "string", "pattern": "@"}},
+        },
+        "Line": {"type": "object", "properties": {"sku": {"type": "string"}, "quantity": {"type": "integer"}}},
+    },
+}
+
+RECORD = {
+    "id": 1,
+    "note": "far too long",
+    "customer": {"name": "Ada", "email": "not an email"},
+    "lines": [{"sku": "A", "quantity": "many"}],
+    "by-sku": {"A": {"sku": "A", "quantity": 2}},
+    "parent": {"id": 0, "note": "also too long"},
+}
+
+
+@pytest.fixture(scope="module")
+def model():
+    return SchemaParser(SCHEMA, cache=None).parse()
+
+
+def test_projection_validates_only_selected_fields(model):
+    projection = model.projection("id", "customer.name", "lines.sku", "by-sku.quantity", "parent.id")
+    assert list(projection.model_fields) == ["id", "customer", "lines", "by_sku", "parent"]
+    record = projection.model_validate(RECORD)
+    assert record.customer.name == "Ada"
+    assert record.lines[0].model_dump() == {"sku": "A"}
+    assert record.by_sku["A"].quantity == 2
+    assert record.parent.id == 0
+    with pytest.raises(ValueError, match="id"):
+        projection.model_validate({**RECORD, "id": "one"})
+
+
+def test_selected_fields_are_kept_whole(model):
+    projection = model.projection("customer", "customer.name")
+    assert projection.model_fields["customer"].annotation is model.model_fields["customer"].annotation
+    assert list(projection.model_fields) == ["customer"]
+
+
+def test_projections_are_cached(model):
+    first = model.projection("id", "lines.sku")
+    assert model.projection("lines.sku", "id") is first
+    line = model.model_fields["lines"].annotation.__args__[0]
+    assert first.model_fields["lines"].annotation == list[line.projection("sku")]
+    assert SchemaParser(SCHEMA).parse_projection("id") is SchemaParser(SCHEMA).parse().projection("id")
+
+
+@pytest.mark.parametrize(
+    ("path", "message"), [("missing", "Unknown field 'missing'"), ("id.value", "no nested fields")]
+)
+def test_invalid_paths(model, path, message):
+    with pytest.raises(ValueError, match=message):
+        model.projection(path)
+
+
+def test_query_validates_against_selection(model):
+    query = TypedQuery(model).select("id").select("customer.name")
+    assert query.projection is model.projection("id", "customer.name")
+    result = query.validate([RECORD, {"customer": {}}])
+    assert result.instances[0].customer.name == "Ada"
+    assert list(result.errors) == [1]
+    assert TypedQuery(model).projection is model
+
+
+def test_repeated_selects_add_to_the_selection(model):
+    query = TypedQuery(model).select("id", "note").select("id").select("customer.name")
+    assert query.selected == ["id", "note", "id", "customer.name"]
+    assert query.projection is model.projection("id", "note", "customer.name")
+
+
+def test_stream_validates_projection(model):
+    data = b'{"id": 1, "note": "far too long"}\n{"note": "x"}\n'
+    results = list(validate_ndjson(io.BytesIO(data), model, fields=["id"]))
+    assert results[0].id == 1
+    assert results[1].line == 2
@@ -0,0 +1,68 @@
+import io
+import json
+
+import pytest
+
+from chiaro.core import SchemaParser
+from chiaro.stream import LineError, iter_chunks, validate_ndjson
+
+SCHEMA = {
+    "title": "Reading",
+    "type": "object",
+    "properties": {"sensor": {"type": "string"}, "value": {"type": "number"}},
+    "required": ["sensor", "value"],
+}
+
+LINES = [
+    '{"sensor": "a", "value": 1}',
+    "",
+    '{"sensor": "b", "value": "high"}',
+    "{not json",
+    '{"sensor": "c", "value": 3.5}',
+]
+
+
+@pytest.fixture
+def model():
+    return SchemaParser(SCHEMA, cache=None).parse()
+
+
+def summarize(results):
+    return [
+        (r.line, [e["type"] for e in r.errors]) if isinstance(r, LineError) else r.sensor for r in results
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [3, 16, 1 << 20])
+def test_validate_ndjson_yields_instances_and_errors(model, chunk_size):
+    data = "\n".join(LINES).encode()
+    results = list(validate_ndjson(io.BytesIO(data), model, chunk_size=chunk_size))
+    assert summarize(results) == ["a", (3, ["float_parsing"]), (4, ["json_invalid"]), "c"]
+    assert isinstance(results[0], model)
+
+
+def test_validate_ndjson_reads_paths_and_text_files(model, tmp_path):
+    path = tmp_path / "readings.ndjson"
+    path.write_text("\r\n".join(LINES) + "\r\n\n", encoding="utf-8")
+    from_path = summarize(validate_ndjson(path, model))
+    from_str = summarize(validate_ndjson(str(path), model))
+    with path.open(encoding="utf-8", newline="") as file:
+        from_text = summarize(validate_ndjson(file, model, chunk_size=7))
+    assert from_path == from_str == from_text == ["a", (3, ["float_parsing"]), (4, ["json_invalid"]), "c"]
+
+
+def test_lines_match_validating_each_one(model):
+    lines = [line.encode() for line in LINES * 3 if line]
+    expected = []
+    for number, line in enumerate(lines, 1):
+        try:
+            expected.append(model.model_validate_json(line))
+        except ValueError as error:
+            expected.append(LineError(number, error.errors()))
+    assert list(validate_ndjson(io.BytesIO(b"\n".join(lines)), model, chunk_size=64)) == expected
+
+
+def test_lines_longer_than_a_chunk():
+    long_line = json.dumps({"sensor": "x" * 100, "value": 1}).encode()
+    chunks = list(iter_chunks(io.BytesIO(long_line + b"\n\n" + long_line), chunk_size=8))
+    assert chunks == [(1, long_line + b"\n\n"), (3, long_line)]
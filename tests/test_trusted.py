@@ -0,0 +1,99 @@
+import pytest
+
+from chiaro.core import DriftReport, DynamicModel, SchemaParser
+
+SCHEMA = {
+    "title": "Order",
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "customer": {"$ref": "#/definitions/Customer"},
+        "lines": {"type": "array", "items": {"$ref": "#/definitions/Line"}},
+        "by-sku": {"type": "object", "additionalProperties": {"$ref": "#/definitions/Line"}},
+        "status": {"type": "string", "default": "open"},
+        "parent": {"$ref": "#"},
+    },
+    "required": ["id"],
+    "definitions": {
+        "Customer": {"type": "object", "properties": {"name": {"type": "string"}}},
+        "Line": {"type": "object", "properties": {"sku": {"type": "string"}, "quantity": {"type": "integer"}}},
+    },
+}
+
+RECORD = {
+    "id": 1,
+    "customer": {"name": "Ada"},
+    "lines": [{"sku": "A", "quantity": 2}],
+    "by-sku": {"A": {"sku": "A", "quantity": 2}},
+    "parent": {"id": 0},
+}
+
+
+@pytest.fixture(scope="module")
+def model():
+    return SchemaParser(SCHEMA, cache=None).parse()
+
+
+def test_from_trusted_matches_validation(model):
+    trusted = model.from_trusted(RECORD)
+    assert trusted == model.model_validate(RECORD)
+    assert trusted.status == "open"
+    assert trusted.customer.name == "Ada"
+    assert trusted.lines[0].quantity == 2
+    assert trusted.by_sku["A"].sku == "A"
+    assert isinstance(trusted.parent, model)
+    assert trusted.parent.customer is None
+
+
+def test_from_trusted_fields_and_unknown_keys(model):
+    trusted = model.from_trusted({**RECORD, "unknown": 1})
+    assert trusted.model_fields_set == {"id", "customer", "lines", "by_sku", "parent"}
+    assert "unknown" not in trusted.__dict__
+    assert trusted.model_dump(by_alias=True, exclude_unset=True) == RECORD
+    assert model.from_trusted({"id": 1, "by_sku": {}}).by_sku == {}
+
+
+class Inner(DynamicModel):
+    x: int
+
+
+class Tuples(DynamicModel):
+    items: tuple[Inner, ...] = ()
+    pair: tuple[Inner, int] | None = None
+
+
+def test_from_trusted_constructs_tuples():
+    record = {"items": [{"x": 1}, {"x": 2}, {"x": 3}], "pair": [{"x": 4}, 5]}
+    trusted = Tuples.from_trusted(record)
+    assert trusted.items == (Inner(x=1), Inner(x=2), Inner(x=3))
+    assert trusted.pair == (Inner(x=4), 5)
+    assert trusted == Tuples.model_validate(record)
+    assert Tuples.from_trusted({"items": []}).items == ()
+
+
+def test_from_trusted_does_not_validate(model):
+    trusted = model.from_trusted({"id": "not a number"})
+    assert trusted.id == "not a number"
+
+
+def test_from_trusted_many_samples_records(model):
+    drift = DriftReport(sample_every=3)
+    records = [{"id": i} if i % 2 else {"id": f"bad-{i}"} for i in range(7)]
+    instances = model.from_trusted_many(records, drift=drift)
+    assert [i.id for i in instances] == [r["id"] for r in records]
+    # Records 0, 3 and 6 are validated; 0 and 6 have drifted.
+    assert (drift.constructed, drift.sampled, drift.drifted) == (7, 3, 2)
+    assert drift.drift_rate == pytest.approx(2 / 3)
+    assert [e[0]["loc"] for e in drift.errors] == [("id",), ("id",)]
+
+
+def test_drift_report_keeps_recent_errors(model):
+    drift = DriftReport(sample_every=1)
+    model.from_trusted_many(({"id": "bad"} for _ in range(20)), drift=drift)
+    assert drift.drifted == 20
+    assert len(drift.errors) == 10
+
+
+def test_sample_every_must_be_positive():
+    with pytest.raises(ValueError, match="sample_every"):
+        DriftReport(sample_every=0)
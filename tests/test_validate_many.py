@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from chiaro.core import BatchResult, SchemaParser
+
+SCHEMA = {
+    "title": "Reading",
+    "type": "object",
+    "properties": {
+        "sensor": {"type": "string"},
+        "value": {"type": "number"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["sensor", "value"],
+}
+
+RECORDS = [
+    {"sensor": "a", "value": 1.5},
+    {"sensor": "b", "value": "high"},
+    {"sensor": "c", "value": 2, "tags": ["x"]},
+    {"value": 3},
+]
+
+
+@pytest.fixture
+def model():
+    return SchemaParser(SCHEMA, cache=None).parse()
+
+
+def test_validate_many_valid_batch(model):
+    result = model.validate_many(r for r in RECORDS if "sensor" in r and r["value"] != "high")
+    assert result.errors == {}
+    assert [r.sensor for r in result.instances] == ["a", "c"]
+    assert all(isinstance(r, model) for r in result.instances)
+
+
+def test_validate_many_reports_errors_by_index(model):
+    result = model.validate_many(RECORDS)
+    assert isinstance(result, BatchResult)
+    assert [None if r is None else r.sensor for r in result.instances] == ["a", None, "c", None]
+    assert [r.sensor for r in result.valid] == ["a", "c"]
+    assert sorted(result.errors) == [1, 3]
+    assert [e["loc"] for e in result.errors[1]] == [("value",)]
+    assert [e["loc"] for e in result.errors[3]] == [("sensor",)]
+    assert result.instances[2].tags == ["x"]
+
+
+def test_validate_many_json_matches_python(model):
+    result = model.validate_many_json(json.dumps(RECORDS).encode())
+    expected = model.validate_many(RECORDS)
+    assert result.instances == expected.instances
+    assert {i: [e["loc"] for e in errors] for i, errors in result.errors.items()} == {
+        i: [e["loc"] for e in errors] for i, errors in expected.errors.items()
+    }
+
+
+@pytest.mark.parametrize("data", [b"[{", b'{"sensor": "a", "value": 1}'])
+def test_validate_many_json_rejects_non_arrays(model, data):
+    with pytest.raises(ValidationError):
+        model.validate_many_json(data)
+
+
+def test_list_adapter_is_cached_per_model(model):
+    other = SchemaParser({**SCHEMA, "title": "Other"}, cache=None).parse()
+    assert model._list_adapter() is model._list_adapter()
+    assert other._list_adapter() is not model._list_adapter()
+    assert isinstance(other.validate_many(RECORDS[:1]).instances[0], other)